@@ -1,11 +1,48 @@
 import streamlit as st
 from pathlib import Path
 import pandas as pd
-from thefuzz import process, fuzz
 
 from src.utils.process_data import LolDataProcessor
 from src.utils.process_new_data import LoLDataNewProcessor
 from src.models.predict import LoLPredictor
+from src.utils.team_resolver import TeamNameResolver, build_team_league_map
+
+
+@st.cache_resource
+def load_components():
+    """
+    Creates the processors and loads the model once per server process,
+    so Streamlit reruns and new sessions reuse them.
+    """
+    return LolDataProcessor(), LoLDataNewProcessor(), LoLPredictor()
+
+
+@st.cache_resource(max_entries=1)
+def load_team_league_map(path, mtime_ns):
+    """
+    Builds the team -> league mapping from the merged dataset in one vectorized pass.
+
+    Args:
+        path (str): Path of the merged dataset.
+        mtime_ns (int): Modification time of the file, used only as part of
+                        the cache key.
+    """
+    df = pd.read_csv(path, usecols=["teamA", "teamB", "league"])
+    return build_team_league_map(df)
+
+
+@st.cache_resource(max_entries=1)
+def load_team_resolver(path, mtime_ns):
+    """
+    Builds the fuzzy team-name index once per version of the merged dataset.
+
+    Args:
+        path (str): Path of the merged dataset.
+        mtime_ns (int): Modification time of the file, used only as part of
+                        the cache key.
+    """
+    return TeamNameResolver(load_team_league_map(path, mtime_ns))
+
 
 class LoLPredictorApp:
     """
@@ -19,34 +56,38 @@ class LoLPredictorApp:
         instantiates the required logic components.
         """
         st.set_page_config(page_title="LOL Predictor", layout="centered")
-        self.processor = LolDataProcessor()
-        self.processor_new = LoLDataNewProcessor()
-        self.predictor = LoLPredictor()
+        self.processor, self.processor_new, self.predictor = load_components()
 
         BASE_DIR = Path(__file__).resolve().parent
         self.teams_name_path = BASE_DIR / "data" / "merged" / "data.csv"
         
-        self.team_league_map = {}
-        self.valid_teams = self._load_team_and_league_list()
+        self.team_league_map = self._load_team_and_league_list()
+        self.valid_teams = list(self.team_league_map.keys())
+        self.resolver = self._load_team_resolver()
 
     def _load_team_and_league_list(self):
         """
-        Loads the list of valid team names and leagues from the dataset.
+        Loads the mapping of valid team names to leagues from the dataset.
+        The mapping is cached per server process and rebuilt when the file changes.
+        """
+        mtime_ns = self.teams_name_path.stat().st_mtime_ns
+        return load_team_league_map(str(self.teams_name_path), mtime_ns)
+
+    def _load_team_resolver(self):
+        """
+        Loads the fuzzy team-name index for the same version of the dataset.
         """
-        df = pd.read_csv(self.teams_name_path)
-        for _, row in df.iterrows():
-            self.team_league_map[row["teamA"]] = row["league"]
-            self.team_league_map[row["teamB"]] = row["league"]
-        return list(self.team_league_map.keys())
+        mtime_ns = self.teams_name_path.stat().st_mtime_ns
+        return load_team_resolver(str(self.teams_name_path), mtime_ns)
     
     def _get_best_match(self, user_input):
         """
-        Uses fuzzy matching to find the closest valid team name to the user input.
+        Uses the prebuilt fuzzy index to find the closest valid team name
+        to the user input.
         """
         if not user_input or not self.valid_teams:
             return None, 0
-        best_match, score = process.extractOne(user_input, self.valid_teams, scorer=fuzz.ratio)
-        return best_match, score
+        return self.resolver.best_match(user_input)
     
     def _process_ui_logic(self, team_a_input, team_b_input, league, date):
         """
@@ -146,8 +187,9 @@ class LoLPredictorApp:
         with st.spinner("Analyzing stats..."):
             processed_df = self.processor_new.run_pipeline(match_df)
             
-            prediction = self.predictor.predict_winner(processed_df)
-            probability = self.predictor.predict_winner_probability(processed_df)
+            prediction, probability = self.predictor.predict_with_probability(
+                processed_df
+            )
 
         st.divider()
         result_label = "WIN" if prediction[0] == 1 else "LOSS"
@@ -3,6 +3,12 @@ import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
 from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.models.evaluation import youden_threshold
+from src.models.registry import ModelRegistry
 
 
 def print_metrics(y_true, y_pred, y_proba):
@@ -20,7 +26,7 @@ def print_metrics(y_true, y_pred, y_proba):
                               (typically the second column of model.predict_proba).
 
     Returns:
-        None
+        float: The Youden-optimal threshold.
     """
     accuracy = metrics.accuracy_score(y_true, y_pred)
     conf_matrix = metrics.confusion_matrix(y_true, y_pred)
@@ -33,9 +39,8 @@ def print_metrics(y_true, y_pred, y_proba):
 
     fpr, tpr, thresholds = metrics.roc_curve(y_true, y_proba)
 
-    j_scores = tpr - fpr
-    best_idx = np.argmax(j_scores)
-    best_threshold = thresholds[best_idx]
+    best_threshold = youden_threshold(y_true, y_proba)
+    best_idx = np.flatnonzero(thresholds == best_threshold)[0]
     print(f"Best Threshold (Youden's J statistic): {best_threshold}")
 
     plt.figure(figsize=(6, 6))
@@ -58,6 +63,44 @@ def print_metrics(y_true, y_pred, y_proba):
     plt.legend(loc="lower right")
     plt.show()
 
+    return best_threshold
+
+
+def register_model(model, name, Xval, yval, train_dates=None, registry=None):
+    """
+    Evaluates a fitted model on the validation set and stores it as a new version
+    in the model registry, so it can be served with LoLPredictor.from_registry.
+
+    Args:
+        model: A fitted classifier with predict_proba.
+        name (str): Model name in the registry (e.g., "xgboost").
+        Xval (pd.DataFrame): Validation features.
+        yval (pd.Series): Validation target.
+        train_dates (tuple): First and last match date seen during training.
+        registry (ModelRegistry): Registry to use, defaults to data/registry.
+
+    Returns:
+        str: The registered version.
+    """
+    y_proba = model.predict_proba(Xval)[:, 1]
+    y_pred = model.predict(Xval)
+    scores = {
+        "accuracy": metrics.accuracy_score(yval, y_pred),
+        "f1": metrics.f1_score(yval, y_pred),
+        "log_loss": metrics.log_loss(yval, y_proba),
+        "auc": metrics.roc_auc_score(yval, y_proba),
+    }
+
+    registry = registry or ModelRegistry()
+    return registry.register(
+        model,
+        name,
+        feature_names=list(Xval.columns),
+        train_dates=train_dates,
+        metrics=scores,
+        threshold=youden_threshold(yval, y_proba),
+    )
+
 
 def prepare_dataset():
     """
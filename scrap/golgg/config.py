@@ -1,10 +1,27 @@
 from pathlib import Path
 
 BASE_URL = "https://gol.gg"
-PROJECT_DIR = Path(__file__).resolve().parents[4]
+PROJECT_DIR = Path(__file__).resolve().parents[2]
 DATA_DIR = PROJECT_DIR / "scrap/golgg/data"
 
 USER_AGENT = "golgg-scraper/0.1 (ladislav.pavlicek.2004@gmail.com)"
 REQUEST_DELAY = 1.0
 MAX_RETRIES = 5
 TIMEOUT = 20
+
+# Concurrent scraping: at most MAX_CONCURRENCY requests in flight and on average
+# REQUESTS_PER_SECOND requests per second, with bursts of up to REQUEST_BURST requests.
+MAX_CONCURRENCY = 4
+REQUESTS_PER_SECOND = 2.0
+REQUEST_BURST = 2
+
+# HTTP cache: pages of live tournaments are revalidated after LIVE_TTL seconds.
+# A tournament whose last match is older than FINISHED_AFTER_DAYS days counts as
+# finished, but a split break can be longer than that, so finished tournaments are
+# rechecked every FINISHED_RECHECK_DAYS days until their last match is older than
+# FINAL_AFTER_DAYS days. Only then do their pages never expire.
+CACHE_DIR = PROJECT_DIR / "scrap/golgg/cache"
+LIVE_TTL = 3600
+FINISHED_AFTER_DAYS = 7
+FINISHED_RECHECK_DAYS = 14
+FINAL_AFTER_DAYS = 90
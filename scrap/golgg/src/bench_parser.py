@@ -0,0 +1,70 @@
+import argparse
+from pathlib import Path
+import sys
+import time
+
+CURRENT_DIR = Path(__file__).resolve().parent
+
+PARENT_DIR = CURRENT_DIR.parent
+
+for d in [str(CURRENT_DIR), str(PARENT_DIR)]:
+    if d not in sys.path:
+        sys.path.insert(0, d)
+
+from parser_matchlist import GolParser
+
+DEFAULT_PAGE = CURRENT_DIR.parents[2] / "tests" / "test_golgg_matchlist.html"
+
+
+def time_backend(backend: str, pages: list, repeat: int) -> float:
+    """
+    Returns the best time in seconds to parse all pages once.
+    """
+    parser = GolParser(backend)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for html in pages:
+            parser.parse_tournament_matchlist(html)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the speed of the matchlist parser backends."
+    )
+    parser.add_argument(
+        "pages",
+        nargs="*",
+        type=Path,
+        help="Saved matchlist pages (.html files or directories)",
+    )
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per backend")
+    args = parser.parse_args()
+
+    paths = []
+    for p in args.pages or [DEFAULT_PAGE]:
+        paths.extend(sorted(p.glob("*.html")) if p.is_dir() else [p])
+    pages = [p.read_text(encoding="utf-8") for p in paths]
+
+    fast, bs4 = GolParser("fast"), GolParser("bs4")
+    mismatches = [
+        p.name
+        for p, html in zip(paths, pages)
+        if fast.parse_tournament_matchlist(html) != bs4.parse_tournament_matchlist(html)
+    ]
+    if mismatches:
+        print(f"[!] Backends disagree on: {', '.join(mismatches)}")
+
+    times = {
+        backend: time_backend(backend, pages, args.repeat)
+        for backend in ["bs4", "fast"]
+    }
+    for backend, seconds in times.items():
+        print(f"{backend:>5}: {1000 * seconds / len(pages):8.2f} ms/page")
+    print(f"speedup: {times['bs4'] / times['fast']:.1f}x over {len(pages)} pages")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import time
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 from tenacity import (
     retry,
@@ -9,24 +12,145 @@ from tenacity import (
     wait_exponential,
 )
 
-from config import MAX_RETRIES, REQUEST_DELAY, TIMEOUT, USER_AGENT
+from config import (
+    MAX_CONCURRENCY,
+    MAX_RETRIES,
+    REQUEST_BURST,
+    REQUEST_DELAY,
+    REQUESTS_PER_SECOND,
+    TIMEOUT,
+    USER_AGENT,
+)
+
+# Shared by the blocking and the asynchronous fetcher, so both retry the same way.
+retry_request = retry(
+    stop=stop_after_attempt(MAX_RETRIES),
+    wait=wait_exponential(min=1, max=10),
+    retry=retry_if_exception_type(RequestException),
+)
 
 
 class Fetcher:
-    def __init__(self, delay=REQUEST_DELAY, user_agent=USER_AGENT, timeout=TIMEOUT):
+    def __init__(
+        self,
+        delay=REQUEST_DELAY,
+        user_agent=USER_AGENT,
+        timeout=TIMEOUT,
+        pool_size=MAX_CONCURRENCY,
+        cache=None,
+    ):
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": user_agent})
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.delay = delay
         self.timeout = timeout
+        self.cache = cache
 
-    @retry(
-        stop=stop_after_attempt(MAX_RETRIES),
-        wait=wait_exponential(min=1, max=10),
-        retry=retry_if_exception_type(RequestException),
-    )
-    def get(self, url):
-        resp = self.session.get(url, timeout=self.timeout)
+    def cached(self, url):
+        """
+        Returns the fresh cached response of a URL, or None.
+        """
+        return self.cache.get(url) if self.cache is not None else None
+
+    def request(self, url):
+        """
+        Sends a single GET request, without delay or retries, unless the cache
+        holds a fresh response. Stale cached responses are revalidated with a
+        conditional request. Server errors are raised so that the callers retry them.
+        """
+        if self.cache is None:
+            headers = {}
+        else:
+            resp = self.cache.get(url)
+            if resp is not None:
+                return resp
+            headers = self.cache.conditional_headers(url)
+
+        resp = self.session.get(url, headers=headers, timeout=self.timeout)
         if resp.status_code >= 500:
             resp.raise_for_status()
-        time.sleep(self.delay)
+        return self.cache.store(url, resp) if self.cache is not None else resp
+
+    @retry_request
+    def get(self, url):
+        resp = self.request(url)
+        if not getattr(resp, "from_cache", False):
+            time.sleep(self.delay)
         return resp
+
+
+class TokenBucket:
+    """
+    Asyncio rate limiter: allows `rate` acquisitions per second on average and
+    bursts of up to `capacity` acquisitions.
+    """
+
+    def __init__(self, rate=REQUESTS_PER_SECOND, capacity=REQUEST_BURST):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """
+        Waits until a token is available and takes it.
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class AsyncFetcher:
+    """
+    Fetches pages concurrently from asyncio code.
+
+    Requests go through the HTTP cache and connection pool of a Fetcher and run
+    in a thread pool; a semaphore bounds the number of requests in flight and a
+    token bucket bounds the request rate (every retry takes a token too).
+    Retries and backoff are the same as for Fetcher.get.
+    """
+
+    def __init__(
+        self,
+        fetcher=None,
+        concurrency=MAX_CONCURRENCY,
+        rate=REQUESTS_PER_SECOND,
+        burst=REQUEST_BURST,
+    ):
+        self.fetcher = fetcher or Fetcher(pool_size=concurrency)
+        self.limiter = TokenBucket(rate, burst)
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.executor = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="golgg-fetch"
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+    @retry_request
+    async def get(self, url):
+        # Fresh cached pages are served right away, without taking a token.
+        resp = self.fetcher.cached(url)
+        if resp is not None:
+            return resp
+        async with self.semaphore:
+            await self.limiter.acquire()
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, self.fetcher.request, url)
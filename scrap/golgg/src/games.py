@@ -0,0 +1,189 @@
+import asyncio
+from collections import defaultdict
+
+import pandas as pd
+
+from fetcher import AsyncFetcher
+from parser_games import GolGameParser
+from planner import is_final
+
+GAME_COLUMNS = [
+    "tournament",
+    "date",
+    "series_id",
+    "teamA",
+    "teamB",
+    "game",
+    "game_id",
+    "blue_team",
+    "red_team",
+    "winner_side",
+    "duration_s",
+]
+
+
+class GolGameScraper:
+    """
+    Scrapes per-game results of GOL.gg tournaments: follows every series of a
+    matchlist to its summary page and from there to the page of every game.
+
+    Pages are fetched by a bounded pool of asyncio workers that share one
+    AsyncFetcher (and so one rate limiter) and the HTTP cache of the manager's
+    Fetcher. The games of a tournament are stored in
+    <data_dir>/games/<tournament>_games.parquet.
+    """
+
+    def __init__(self, manager):
+        """
+        Args:
+            manager (GolManager): Provides the fetcher, the planner and the limits.
+        """
+        self.manager = manager
+        self.parser = GolGameParser()
+        self.out_dir = manager.data_dir / "games"
+
+    def game_path(self, tournament: str):
+        safe_name = tournament.replace("/", "_")
+        return self.out_dir / f"{safe_name}_games.parquet"
+
+    def _url(self, kind: str, page_id: int) -> str:
+        return f"{self.manager.base_url}/game/stats/{page_id}/page-{kind}/"
+
+    def _set_ttl(self, url: str, finished: bool):
+        if finished and self.manager.fetcher.cache is not None:
+            self.manager.fetcher.cache.set_ttl(url, None)
+
+    async def _handle(self, fetcher, queue, games, task):
+        kind, tournament, url, context = task
+        resp = await fetcher.get(url)
+
+        if kind == "matchlist":
+            for series in await asyncio.to_thread(self.parser.parse_series, resp.text):
+                info = {
+                    "tournament": tournament,
+                    "date": series["date"],
+                    "series_id": series["series_id"],
+                    "teamA": series["teamA"],
+                    "teamB": series["teamB"],
+                }
+                page = series["series_page"]
+                queue.put_nowait(
+                    (page, tournament, self._url(page, series["series_id"]), info)
+                )
+
+        elif kind == "summary":
+            game_ids = await asyncio.to_thread(self.parser.parse_game_ids, resp.text)
+            # Series without game links (e.g. best-of-one) are a single game
+            # with the series id. Their pages are frozen once the tournament is final.
+            for number, game_id in enumerate(
+                game_ids or [context["series_id"]], start=1
+            ):
+                queue.put_nowait(
+                    (
+                        "game",
+                        tournament,
+                        self._url("game", game_id),
+                        {**context, "game": number, "game_id": game_id},
+                    )
+                )
+            self._set_ttl(url, is_final(context["date"]))
+
+        else:
+            game = await asyncio.to_thread(self.parser.parse_game, resp.text)
+            context.setdefault("game", 1)
+            context.setdefault("game_id", context["series_id"])
+            games[tournament].append({**context, **game})
+            self._set_ttl(url, game["winner_side"] is not None)
+
+    async def scrape_many_async(self, tournaments: list, force=False) -> dict:
+        """
+        Scrapes the games of the tournaments. Finished tournaments whose games
+        are already stored are skipped unless force is set. A tournament is only
+        stored if all of its pages could be fetched.
+
+        Returns:
+            dict: A DataFrame of games for every stored tournament.
+        """
+        planner = self.manager.planner
+        planned = [
+            t
+            for t in tournaments
+            if force or not (self.game_path(t).exists() and planner.settled(t))
+        ]
+        if len(planned) < len(tournaments):
+            print(
+                f"[=] Skipping games of {len(tournaments) - len(planned)} "
+                "finished tournaments"
+            )
+
+        queue = asyncio.Queue()
+        for t in planned:
+            queue.put_nowait(("matchlist", t, self.manager._slug_to_url(t), {}))
+
+        games = defaultdict(list)
+        failed = set()
+
+        async def worker():
+            while True:
+                task = await queue.get()
+                try:
+                    await self._handle(fetcher, queue, games, task)
+                except Exception as e:
+                    failed.add(task[1])
+                    print(f"[ERROR] Failed to scrape {task[2]} ({task[1]}): {e}")
+                finally:
+                    queue.task_done()
+
+        manager = self.manager
+        async with AsyncFetcher(
+            manager.fetcher, concurrency=manager.concurrency, rate=manager.rate
+        ) as fetcher:
+            workers = [
+                asyncio.create_task(worker()) for _ in range(manager.concurrency)
+            ]
+            await queue.join()
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        saved = {}
+        for t in planned:
+            if t in failed:
+                continue
+            if not games[t]:
+                print(f"[!] No games found for {t}")
+                continue
+            saved[t] = self._save(t, games[t])
+        return saved
+
+    def scrape_many(self, tournaments: list, force=False) -> dict:
+        return asyncio.run(self.scrape_many_async(tournaments, force=force))
+
+    def _save(self, tournament: str, games: list) -> pd.DataFrame:
+        df = pd.DataFrame(games, columns=GAME_COLUMNS)
+        df = df.sort_values(["date", "series_id", "game"], kind="stable").reset_index(
+            drop=True
+        )
+        df["date"] = pd.to_datetime(df["date"], errors="coerce")
+        for col in ["series_id", "game_id"]:
+            df[col] = df[col].astype("int64")
+        df["game"] = df["game"].astype("int8")
+        df["duration_s"] = df["duration_s"].astype("Int32")
+        for col in [
+            "tournament",
+            "teamA",
+            "teamB",
+            "blue_team",
+            "red_team",
+            "winner_side",
+        ]:
+            df[col] = df[col].astype("category")
+
+        path = self.game_path(tournament)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.tmp")
+        df.to_parquet(tmp, index=False, compression="zstd")
+        tmp.replace(path)
+
+        print(f"[OK] Saved {len(df)} games to {path}")
+        return df
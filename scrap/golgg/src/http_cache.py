@@ -0,0 +1,146 @@
+from email.utils import formatdate
+import hashlib
+import json
+import os
+from pathlib import Path
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from config import CACHE_DIR, LIVE_TTL
+
+
+class HttpCache:
+    """
+    On-disk cache of GET responses for the Fetcher.
+
+    Every URL is stored as <sha1>.body with the raw response body and <sha1>.json
+    with its ETag, Last-Modified, fetch time and time to live. Fresh entries are
+    served without any request; stale ones are revalidated with a conditional GET,
+    and a 304 answer only refreshes the fetch time. A TTL of None never expires,
+    which is used for finished tournaments.
+    """
+
+    stored_headers = ["ETag", "Last-Modified", "Content-Type"]
+
+    def __init__(self, cache_dir=CACHE_DIR, default_ttl=LIVE_TTL):
+        """
+        Initializes the cache.
+
+        Args:
+            cache_dir (str | Path): Directory of the cached responses.
+            default_ttl (float): Seconds a newly stored response stays fresh.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+
+    def _paths(self, url):
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def _read_meta(self, url):
+        meta_path, body_path = self._paths(url)
+        if not (meta_path.exists() and body_path.exists()):
+            return None
+        with open(meta_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write(self, path, data: bytes):
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def _write_meta(self, url, meta):
+        self._write(self._paths(url)[0], json.dumps(meta, indent=2).encode("utf-8"))
+
+    def _response(self, url, meta):
+        resp = requests.Response()
+        resp.url = url
+        resp.status_code = 200
+        resp.headers = CaseInsensitiveDict(meta["headers"])
+        resp._content = self._paths(url)[1].read_bytes()
+        resp.encoding = (
+            requests.utils.get_encoding_from_headers(resp.headers) or "utf-8"
+        )
+        resp.from_cache = True
+        return resp
+
+    def get(self, url):
+        """
+        Returns the cached response of a URL if it is still fresh, otherwise None.
+        """
+        meta = self._read_meta(url)
+        if meta is None:
+            return None
+        if meta["ttl"] is not None and time.time() - meta["fetched_at"] > meta["ttl"]:
+            return None
+        return self._response(url, meta)
+
+    def conditional_headers(self, url) -> dict:
+        """
+        Returns the If-None-Match / If-Modified-Since headers to revalidate a URL.
+        """
+        meta = self._read_meta(url)
+        if meta is None:
+            return {}
+        headers = {}
+        if "ETag" in meta["headers"]:
+            headers["If-None-Match"] = meta["headers"]["ETag"]
+        if "Last-Modified" in meta["headers"]:
+            headers["If-Modified-Since"] = meta["headers"]["Last-Modified"]
+        elif not headers:
+            headers["If-Modified-Since"] = formatdate(meta["fetched_at"], usegmt=True)
+        return headers
+
+    def store(self, url, resp):
+        """
+        Stores a 200 response, or turns a 304 response into the cached one.
+
+        Returns:
+            requests.Response: The response to hand to the caller.
+        """
+        with self._lock:
+            if resp.status_code == 304:
+                meta = self._read_meta(url)
+                if meta is not None:
+                    meta["fetched_at"] = time.time()
+                    self._write_meta(url, meta)
+                    cached = self._response(url, meta)
+                    cached.from_cache = False
+                    return cached
+
+            resp.from_cache = False
+            if resp.status_code != 200:
+                return resp
+
+            old = self._read_meta(url)
+            meta = {
+                "url": url,
+                "headers": {
+                    h: resp.headers[h] for h in self.stored_headers if h in resp.headers
+                },
+                "fetched_at": time.time(),
+                "ttl": old["ttl"] if old else self.default_ttl,
+            }
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._write(self._paths(url)[1], resp.content)
+            self._write_meta(url, meta)
+            return resp
+
+    def set_ttl(self, url, ttl):
+        """
+        Sets how long the cached response of a URL stays fresh.
+
+        Args:
+            url (str): Cached URL.
+            ttl (float): Seconds since the last fetch, or None to never expire.
+        """
+        with self._lock:
+            meta = self._read_meta(url)
+            if meta is not None and meta["ttl"] != ttl:
+                meta["ttl"] = ttl
+                self._write_meta(url, meta)
@@ -10,12 +10,31 @@ for d in [str(CURRENT_DIR), str(PARENT_DIR)]:
     if d not in sys.path:
         sys.path.insert(0, d)
 
+from config import CACHE_DIR, MAX_CONCURRENCY, REQUESTS_PER_SECOND
+from games import GolGameScraper
 from manager import GolManager
 
 
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--list", type=str)
+    parser.add_argument(
+        "--concurrency", type=int, default=MAX_CONCURRENCY, help="Requests in flight"
+    )
+    parser.add_argument(
+        "--rate", type=float, default=REQUESTS_PER_SECOND, help="Requests per second"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Download every page again"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Also scrape finished tournaments"
+    )
+    parser.add_argument(
+        "--games",
+        action="store_true",
+        help="Also scrape the per-game results of every series",
+    )
     args = parser.parse_args()
 
     if not args.list:
@@ -24,9 +43,17 @@ def main():
 
     list_path = CURRENT_DIR / args.list
 
-    manager = GolManager()
+    manager = GolManager(
+        concurrency=args.concurrency,
+        rate=args.rate,
+        cache_dir=None if args.no_cache else CACHE_DIR,
+        scraped_list=CURRENT_DIR / "scraped_tournaments.txt",
+    )
     tournaments = manager.load_tournaments_from_file(list_path)
-    manager.scrape_many(tournaments)
+    manager.scrape_many(tournaments, force=args.force)
+
+    if args.games:
+        GolGameScraper(manager).scrape_many(tournaments, force=args.force)
 
 
 if __name__ == "__main__":
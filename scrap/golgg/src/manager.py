@@ -1,10 +1,26 @@
-import csv
+import asyncio
 from pathlib import Path
 from urllib.parse import quote
 
-from config import BASE_URL, DATA_DIR
-from fetcher import Fetcher
+from config import (
+    BASE_URL,
+    CACHE_DIR,
+    DATA_DIR,
+    LIVE_TTL,
+    MAX_CONCURRENCY,
+    REQUESTS_PER_SECOND,
+)
+from fetcher import AsyncFetcher, Fetcher
+from http_cache import HttpCache
 from parser_matchlist import GolParser
+from planner import (
+    ScrapePlanner,
+    finished_ttl,
+    is_finished,
+    last_match_date,
+    matches_to_csv,
+    write_atomic,
+)
 
 
 class GolManager:
@@ -12,46 +28,114 @@ class GolManager:
     Manages the scraping workflow for GOL.gg tournaments.
     """
 
-    def __init__(self):
-        self.fetcher = Fetcher()
+    def __init__(
+        self,
+        base_url=BASE_URL,
+        data_dir=DATA_DIR,
+        concurrency=MAX_CONCURRENCY,
+        rate=REQUESTS_PER_SECOND,
+        cache_dir=CACHE_DIR,
+        scraped_list=None,
+    ):
+        cache = HttpCache(cache_dir) if cache_dir is not None else None
+        self.fetcher = Fetcher(pool_size=concurrency, cache=cache)
         self.parser = GolParser()
-        self.base_url = BASE_URL
+        self.base_url = base_url
+        self.data_dir = Path(data_dir)
+        self.planner = ScrapePlanner(self.data_dir, scraped_list=scraped_list)
+        self.concurrency = concurrency
+        self.rate = rate
 
     def _slug_to_url(self, slug: str) -> str:
         encoded = quote(slug, safe="")
         return f"{self.base_url}/tournament/tournament-matchlist/{encoded}/"
 
-    def scrape_tournament_matchlist(self, tournament_name: str, out_csv: Path = None):
-        url = self._slug_to_url(tournament_name)
-        resp = self.fetcher.get(url)
-
-        matches = self.parser.parse_tournament_matchlist(resp.text)
+    def _update_ttl(self, url: str, matches: list):
+        """
+        Lets the cached matchlist of a finished tournament (no match in the last
+        FINISHED_AFTER_DAYS days) expire at its next recheck, or never once it is
+        final; live ones expire after LIVE_TTL.
+        """
+        if self.fetcher.cache is None:
+            return
+        last_match = last_match_date(matches)
+        self.fetcher.cache.set_ttl(
+            url, finished_ttl(last_match) if is_finished(last_match) else LIVE_TTL
+        )
 
+    def _save_matches(self, tournament_name: str, matches: list, out_csv: Path = None):
         if not matches:
             print(f"[!] No matches found for {tournament_name}")
             return []
 
-        if out_csv is None:
-            safe_name = tournament_name.replace("/", "_")
-            out_csv = DATA_DIR / f"{safe_name}_matches.csv"
+        if out_csv is not None:
+            out_csv.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(out_csv, matches_to_csv(matches))
+        elif not self.planner.write(tournament_name, matches):
+            print(f"[=] {tournament_name} unchanged ({len(matches)} matches)")
+            return matches
+        else:
+            out_csv = self.planner.csv_path(tournament_name)
 
-        out_csv.parent.mkdir(parents=True, exist_ok=True)
+        print(f"[OK] Saved {len(matches)} matches to {out_csv}")
+        return matches
 
-        with open(out_csv, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=matches[0].keys())
-            writer.writeheader()
-            writer.writerows(matches)
+    def scrape_tournament_matchlist(self, tournament_name: str, out_csv: Path = None):
+        url = self._slug_to_url(tournament_name)
+        resp = self.fetcher.get(url)
 
-        print(f"[OK] Saved {len(matches)} matches to {out_csv}")
+        matches = self.parser.parse_tournament_matchlist(resp.text)
+        self._update_ttl(url, matches)
+        matches = self._save_matches(tournament_name, matches, out_csv)
+        if out_csv is None:
+            self.planner.save_manifest()
         return matches
 
-    def scrape_many(self, tournaments: list):
-        for name in tournaments:
-            try:
-                self.scrape_tournament_matchlist(name)
-            except Exception as e:
-                print(f"[ERROR] Failed to scrape {name}: {e}")
+    async def _scrape_one(self, fetcher: AsyncFetcher, tournament_name: str):
+        url = self._slug_to_url(tournament_name)
+        resp = await fetcher.get(url)
+        # Parsing runs in a worker thread, so the other downloads keep going meanwhile.
+        matches = await asyncio.to_thread(
+            self.parser.parse_tournament_matchlist, resp.text
+        )
+        self._update_ttl(url, matches)
+        return self._save_matches(tournament_name, matches)
+
+    async def scrape_many_async(self, tournaments: list, force=False) -> dict:
+        """
+        Scrapes the tournaments concurrently, within the concurrency and rate limits.
+        Finished tournaments that were already scraped are skipped unless force is set.
+
+        Returns:
+            dict: The scraped matches of every scraped tournament that did not fail.
+        """
+        planned = self.planner.plan(tournaments, force=force)
+        skipped = len(tournaments) - len(planned)
+        if skipped:
+            print(f"[=] Skipping {skipped} finished tournaments")
+        tournaments = planned
+
+        async with AsyncFetcher(
+            self.fetcher, concurrency=self.concurrency, rate=self.rate
+        ) as fetcher:
+            results = await asyncio.gather(
+                *(self._scrape_one(fetcher, name) for name in tournaments),
+                return_exceptions=True,
+            )
+
+        scraped = {}
+        for name, result in zip(tournaments, results):
+            if isinstance(result, Exception):
+                print(f"[ERROR] Failed to scrape {name}: {result}")
                 continue
+            scraped[name] = result
+
+        self.planner.save_manifest()
+        self.planner.update_scraped_list()
+        return scraped
+
+    def scrape_many(self, tournaments: list, force=False) -> dict:
+        return asyncio.run(self.scrape_many_async(tournaments, force=force))
 
     @staticmethod
     def load_tournaments_from_file(path: str):
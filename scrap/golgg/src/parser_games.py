@@ -0,0 +1,141 @@
+from html.parser import HTMLParser
+import re
+
+from parser_matchlist import GolParser, _MatchTableScanner
+
+SERIES_LINK = re.compile(r"game/stats/(\d+)/page-(summary|game)/")
+GAME_LINK = re.compile(r"""href=["'](?:[^"']*/)?(\d+)/page-game/["']""")
+DURATION = re.compile(r"(?:(\d+):)?(\d{1,2}):(\d{2})")
+SIDE_HEADER = re.compile(r"^(.*?)\s*-\s*(WIN|LOSS)$", re.IGNORECASE)
+
+
+class _SeriesLinkScanner(_MatchTableScanner):
+    """
+    Match table scanner that also keeps the first link of every row, which
+    points to the series page.
+    """
+
+    def handle_starttag(self, tag, attrs):
+        super().handle_starttag(tag, attrs)
+        if self.table is None:
+            return
+        links = self.table.setdefault("links", [])
+        if tag == "tr":
+            links.append(None)
+        elif tag == "a" and links and links[-1] is None:
+            links[-1] = dict(attrs).get("href")
+
+
+class _GamePageScanner(HTMLParser):
+    """
+    Collects the texts of a game page in document order, and separately the texts
+    of the blue and red side headers (elements with the blue-line-header and
+    red-line-header classes).
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.texts = []
+        self.sides = {"blue": [], "red": []}
+        self.open = []
+
+    def handle_starttag(self, tag, attrs):
+        classes = (dict(attrs).get("class") or "").split()
+        side = next((s for s in ("blue", "red") if f"{s}-line-header" in classes), None)
+        if side is not None:
+            self.open.append((tag, side))
+        elif self.open and tag == self.open[-1][0]:
+            self.open.append((tag, None))
+
+    def handle_endtag(self, tag):
+        if self.open and tag == self.open[-1][0]:
+            self.open.pop()
+
+    def handle_data(self, data):
+        data = data.strip()
+        if not data:
+            return
+        self.texts.append(data)
+        sides = {side for _, side in self.open if side}
+        for side in sides:
+            self.sides[side].append(data)
+
+
+class GolGameParser:
+    """
+    Parses series and game pages of GOL.gg.
+    """
+
+    def __init__(self):
+        self.matchlist_parser = GolParser()
+
+    def parse_series(self, html):
+        """
+        Extracts the series of a tournament matchlist with the link to their page.
+
+        Returns:
+            list: One dict per series with 'series_id', 'series_page' ("summary"
+                  or "game"), 'teamA', 'teamB', 'scoreA', 'scoreB' and 'date'.
+        """
+        table = _SeriesLinkScanner().match_table(html)
+        if table is None:
+            return []
+
+        result = []
+        for row, link in list(zip(table["rows"], table.get("links", [])))[1:]:
+            tds = ["".join(cell) for cell in row]
+            m = SERIES_LINK.search(link or "")
+            if len(tds) < 5 or not m:
+                continue
+            result.append(
+                {
+                    "series_id": int(m.group(1)),
+                    "series_page": m.group(2),
+                    **self.matchlist_parser._row_to_match(tds),
+                }
+            )
+        return result
+
+    def parse_game_ids(self, html):
+        """
+        Returns the ids of the games linked from a series summary page, in order.
+        """
+        return list(dict.fromkeys(int(game_id) for game_id in GAME_LINK.findall(html)))
+
+    def parse_game(self, html):
+        """
+        Extracts the sides, the winner and the duration of a game page.
+
+        Returns:
+            dict: 'blue_team', 'red_team', 'winner_side' ("blue", "red" or None)
+                  and 'duration_s' (None if not found).
+        """
+        scanner = _GamePageScanner()
+        scanner.feed(html)
+        scanner.close()
+
+        game = {
+            "blue_team": None,
+            "red_team": None,
+            "winner_side": None,
+            "duration_s": None,
+        }
+        for side in ("blue", "red"):
+            m = SIDE_HEADER.match(" ".join(scanner.sides[side]))
+            if m:
+                game[f"{side}_team"] = m.group(1)
+                if m.group(2).upper() == "WIN":
+                    game["winner_side"] = side
+
+        # The duration follows the "Game Time" label.
+        texts = scanner.texts
+        for i, text in enumerate(texts):
+            if text.lower() == "game time":
+                for candidate in texts[i + 1 : i + 3]:
+                    m = DURATION.fullmatch(candidate)
+                    if m:
+                        hours, minutes, seconds = (int(g or 0) for g in m.groups())
+                        game["duration_s"] = 3600 * hours + 60 * minutes + seconds
+                        break
+                break
+        return game
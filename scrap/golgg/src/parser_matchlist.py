@@ -1,64 +1,163 @@
+import datetime
+from html.parser import HTMLParser
 import re
 
 from bs4 import BeautifulSoup
 from dateutil import parser as dparser
 
+MATCH_TABLE_HEADERS = ("score", "patch", "date", "game")
+ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+SCORE = re.compile(r"(\d+)\s*[-:]\s*(\d+)")
+
+
+class _TableFound(Exception):
+    pass
+
+
+class _MatchTableScanner(HTMLParser):
+    """
+    Streams through a page and collects the cell texts of the match table: the
+    first table with a match list header, or the first table of the page.
+
+    Only table, tr, th and td tags are tracked, and parsing stops as soon as the
+    match table is closed. Texts are joined like BeautifulSoup's get_text(strip=True).
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.depth = 0
+        self.first = None
+        self.table = None
+        self.cell = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "table":
+            self.depth += 1
+            if self.depth == 1:
+                self.table = {"headers": [], "rows": []}
+        elif self.table is None:
+            return
+        elif tag == "tr":
+            self.table["rows"].append([])
+        elif tag == "th":
+            self.cell = []
+            self.table["headers"].append(self.cell)
+        elif tag == "td" and self.table["rows"]:
+            self.cell = []
+            self.table["rows"][-1].append(self.cell)
+
+    def handle_endtag(self, tag):
+        if tag == "table" and self.depth:
+            self.depth -= 1
+            if self.depth == 0:
+                headers = ["".join(h).lower() for h in self.table["headers"]]
+                if any(h in MATCH_TABLE_HEADERS for h in headers):
+                    raise _TableFound
+                if self.first is None:
+                    self.first = self.table
+                self.table = None
+        elif tag in ("td", "th"):
+            self.cell = None
+
+    def handle_data(self, data):
+        if self.cell is not None:
+            data = data.strip()
+            if data:
+                self.cell.append(data)
+
+    def match_table(self, html):
+        """
+        Returns the match table as a dict with its 'headers' and 'rows', or None.
+        """
+        try:
+            self.feed(html)
+            self.close()
+            return self.first
+        except _TableFound:
+            return self.table
+
+    def match_rows(self, html):
+        """
+        Returns the rows (lists of cell texts) of the match table, or None.
+        """
+        table = self.match_table(html)
+        if table is None:
+            return None
+        return [["".join(cell) for cell in row] for row in table["rows"]]
+
 
 class GolParser:
     """
     Parses tournament match data from GOL.gg HTML content.
     """
 
+    def __init__(self, backend="fast"):
+        """
+        Args:
+            backend (str): "fast" streams the page with the standard library parser,
+                           "bs4" builds the full BeautifulSoup tree and parses every
+                           date fuzzily, as the original parser did.
+        """
+        if backend not in ("fast", "bs4"):
+            raise ValueError(f"Unknown parser backend '{backend}'.")
+        self.backend = backend
+
     def parse_tournament_matchlist(self, html):
         """
         Main parsing method that extracts match details from HTML.
         """
+        if self.backend == "bs4":
+            rows = self._match_rows_bs4(html)
+        else:
+            rows = _MatchTableScanner().match_rows(html)
+        if rows is None:
+            return []
+
+        return [self._row_to_match(tds) for tds in rows[1:] if len(tds) >= 5]
+
+    def _row_to_match(self, tds):
+        """
+        Internal helper to turn the cell texts of a match row into a match.
+        """
+        scoreA, scoreB = self._parse_score(tds[2])
+        date = self._try_parse_date(tds[-1] if len(tds) > 5 else "")
+
+        return {
+            "teamA": tds[1],
+            "teamB": tds[3],
+            "scoreA": scoreA,
+            "scoreB": scoreB,
+            "date": date,
+        }
+
+    def _match_rows_bs4(self, html):
+        """
+        Finds the match table with BeautifulSoup and returns its rows of cell texts.
+        """
         soup = BeautifulSoup(html, "html.parser")
-        result = []
 
         table = None
         for t in soup.find_all("table"):
             headers = [th.get_text(strip=True).lower() for th in t.find_all("th")]
-            if any(h in ("score", "patch", "date", "game") for h in headers):
+            if any(h in MATCH_TABLE_HEADERS for h in headers):
                 table = t
                 break
 
         if not table:
             table = soup.find("table")
         if not table:
-            return result
-
-        for tr in table.find_all("tr")[1:]:
-            tds = tr.find_all("td")
-            if len(tds) < 5:
-                continue
-
-            teamA = tds[1].get_text(strip=True)
-            teamB = tds[3].get_text(strip=True)
-
-            score_text = tds[2].get_text(strip=True)
-            scoreA, scoreB = self._parse_score(score_text)
-
-            date_text = tds[-1].get_text(strip=True) if len(tds) > 5 else ""
-            date = self._try_parse_date(date_text)
-
-            result.append(
-                {
-                    "teamA": teamA,
-                    "teamB": teamB,
-                    "scoreA": scoreA,
-                    "scoreB": scoreB,
-                    "date": date,
-                }
-            )
+            return None
 
-        return result
+        return [
+            [td.get_text(strip=True) for td in tr.find_all("td")]
+            for tr in table.find_all("tr")
+        ]
 
     def _parse_score(self, s):
         """
         Internal helper to extract scores using regex.
         """
-        m = re.search(r"(\d+)\s*[-:]\s*(\d+)", s or "")
+        m = SCORE.search(s or "")
         if not m:
             return None, None
         return int(m.group(1)), int(m.group(2))
@@ -66,9 +165,16 @@ class GolParser:
     def _try_parse_date(self, s):
         """
         Internal helper to format dates consistently.
+        The fast backend accepts plain YYYY-MM-DD dates, which is what gol.gg
+        shows, without the slow fuzzy parser.
         """
         if not s:
             return ""
+        if self.backend == "fast" and ISO_DATE.fullmatch(s):
+            try:
+                return datetime.date.fromisoformat(s).isoformat()
+            except ValueError:
+                pass
         try:
             return dparser.parse(s, fuzzy=True).date().isoformat()
         except Exception:
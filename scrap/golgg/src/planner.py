@@ -0,0 +1,263 @@
+import csv
+from datetime import date, datetime, timedelta, timezone
+import hashlib
+import io
+import os
+from pathlib import Path
+import re
+
+from config import (
+    DATA_DIR,
+    FINAL_AFTER_DAYS,
+    FINISHED_AFTER_DAYS,
+    FINISHED_RECHECK_DAYS,
+)
+
+MANIFEST_FIELDS = [
+    "tournament",
+    "scraped_at",
+    "rows",
+    "sha256",
+    "last_match",
+    "finished",
+]
+
+
+def last_match_date(matches: list) -> str:
+    """
+    Returns the latest ISO date of the matches, or "" if there is none.
+    """
+    dates = [
+        m["date"]
+        for m in matches
+        if re.fullmatch(r"\d{4}-\d{2}-\d{2}", m["date"] or "")
+    ]
+    return max(dates, default="")
+
+
+def is_finished(last_match: str) -> bool:
+    """
+    A tournament counts as finished when its last match is older than
+    FINISHED_AFTER_DAYS days.
+    """
+    return (
+        bool(last_match)
+        and last_match
+        < (date.today() - timedelta(days=FINISHED_AFTER_DAYS)).isoformat()
+    )
+
+
+def is_final(last_match: str) -> bool:
+    """
+    A finished tournament is no longer rechecked once its last match is older than
+    FINAL_AFTER_DAYS days.
+    """
+    return (
+        bool(last_match)
+        and last_match < (date.today() - timedelta(days=FINAL_AFTER_DAYS)).isoformat()
+    )
+
+
+def finished_ttl(last_match: str):
+    """
+    Returns the cache TTL in seconds of a finished tournament's pages: None (never
+    expire) once it is final, otherwise FINISHED_RECHECK_DAYS days.
+    """
+    return None if is_final(last_match) else FINISHED_RECHECK_DAYS * 24 * 3600
+
+
+def matches_to_csv(matches: list) -> bytes:
+    """
+    Serializes matches exactly as they are written to <tournament>_matches.csv.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=matches[0].keys())
+    writer.writeheader()
+    writer.writerows(matches)
+    return buffer.getvalue().encode("utf-8")
+
+
+def write_atomic(path: Path, data: bytes):
+    """
+    Writes a file through a temporary file and a rename, so readers never see it
+    half-written.
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+class ScrapePlanner:
+    """
+    Keeps a manifest of the scraped tournaments (last scrape time, row count,
+    content hash, last match date) and decides what a run has to scrape.
+
+    Finished tournaments are skipped, but rechecked every FINISHED_RECHECK_DAYS days
+    until they are final, since a split can pause for more than FINISHED_AFTER_DAYS
+    days. Match CSVs are only rewritten when their
+    content hash changes, so the modification times and the manifest hashes tell
+    downstream stages whether anything changed.
+    """
+
+    def __init__(self, data_dir=DATA_DIR, manifest_path=None, scraped_list=None):
+        """
+        Initializes the planner and loads the manifest.
+
+        Args:
+            data_dir (str | Path): Directory of the <tournament>_matches.csv files.
+            manifest_path (str | Path): Manifest CSV, defaults to
+                                        <data_dir>/manifest.csv.
+            scraped_list (str | Path): Optional list of already scraped tournaments
+                                       (scraped_tournaments.txt), used to seed the
+                                       manifest from existing CSVs.
+        """
+        self.data_dir = Path(data_dir)
+        self.manifest_path = (
+            Path(manifest_path) if manifest_path else self.data_dir / "manifest.csv"
+        )
+        self.scraped_list = Path(scraped_list) if scraped_list else None
+        self.manifest = self._load_manifest()
+        if self.scraped_list is not None and self.scraped_list.exists():
+            self._seed(self._read_list(self.scraped_list))
+
+    def csv_path(self, tournament: str) -> Path:
+        safe_name = tournament.replace("/", "_")
+        return self.data_dir / f"{safe_name}_matches.csv"
+
+    def _load_manifest(self) -> dict:
+        if not self.manifest_path.exists():
+            return {}
+        with open(self.manifest_path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        for row in rows:
+            row["rows"] = int(row["rows"])
+            row["finished"] = row["finished"] == "True"
+        return {row["tournament"]: row for row in rows}
+
+    def save_manifest(self):
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=MANIFEST_FIELDS)
+        writer.writeheader()
+        writer.writerows(self.manifest[t] for t in sorted(self.manifest))
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.manifest_path, buffer.getvalue().encode("utf-8"))
+
+    @staticmethod
+    def _read_list(path: Path) -> list:
+        # Indented lines are section headings (e.g. "    LPL - 2023 - 2025").
+        with open(path, encoding="utf-8") as f:
+            return [
+                line.strip() for line in f if line.strip() and not line[0].isspace()
+            ]
+
+    def _seed(self, tournaments: list):
+        """
+        Adds manifest entries for already scraped tournaments whose CSV exists.
+        """
+        for name in tournaments:
+            path = self.csv_path(name)
+            if name in self.manifest or not path.exists():
+                continue
+            data = path.read_bytes()
+            with open(path, newline="", encoding="utf-8") as f:
+                matches = list(csv.DictReader(f))
+            self._record(
+                name,
+                matches,
+                data,
+                datetime.fromtimestamp(path.stat().st_mtime, timezone.utc),
+            )
+
+    def _record(self, name: str, matches: list, data: bytes, scraped_at: datetime):
+        last_match = last_match_date(matches)
+        self.manifest[name] = {
+            "tournament": name,
+            "scraped_at": scraped_at.isoformat(timespec="seconds"),
+            "rows": len(matches),
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "last_match": last_match,
+            "finished": is_finished(last_match),
+        }
+
+    def plan(self, tournaments: list, force=False) -> list:
+        """
+        Returns the tournaments that have to be scraped: new ones, active ones,
+        finished ones due for a recheck and finished ones whose CSV is missing.
+        With force, all of them.
+        """
+        if force:
+            return list(tournaments)
+        return [
+            name
+            for name in tournaments
+            if not (self.settled(name) and self.csv_path(name).exists())
+        ]
+
+    def settled(self, tournament: str) -> bool:
+        """
+        Whether a tournament is finished and not due for a recheck: it is final, or
+        it was scraped less than FINISHED_RECHECK_DAYS days ago.
+        """
+        row = self.manifest.get(tournament)
+        if row is None or not row["finished"]:
+            return False
+        if is_final(row["last_match"]):
+            return True
+        scraped_at = datetime.fromisoformat(row["scraped_at"])
+        return datetime.now(timezone.utc) - scraped_at < timedelta(
+            days=FINISHED_RECHECK_DAYS
+        )
+
+    def write(self, tournament: str, matches: list) -> bool:
+        """
+        Records a scrape and writes the tournament CSV if its content changed.
+
+        Returns:
+            bool: True if the CSV was (re)written.
+        """
+        data = matches_to_csv(matches)
+        path = self.csv_path(tournament)
+        previous = self.manifest.get(tournament)
+        self._record(tournament, matches, data, datetime.now(timezone.utc))
+
+        if (
+            previous
+            and previous["sha256"] == self.manifest[tournament]["sha256"]
+            and path.exists()
+        ):
+            return False
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(path, data)
+        return True
+
+    def finished(self) -> list:
+        return sorted(t for t, row in self.manifest.items() if row["finished"])
+
+    def update_scraped_list(self):
+        """
+        Appends newly final tournaments to the scraped tournaments list.
+        """
+        if self.scraped_list is None:
+            return
+        listed = (
+            set(self._read_list(self.scraped_list))
+            if self.scraped_list.exists()
+            else set()
+        )
+        new = [
+            t
+            for t in self.finished()
+            if t not in listed and is_final(self.manifest[t]["last_match"])
+        ]
+        if not new:
+            return
+        text = (
+            self.scraped_list.read_text(encoding="utf-8")
+            if self.scraped_list.exists()
+            else ""
+        )
+        if text and not text.endswith("\n"):
+            text += "\n"
+        write_atomic(self.scraped_list, (text + "\n".join(new) + "\n").encode("utf-8"))
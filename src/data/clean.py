@@ -3,6 +3,9 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
+from src.data.oracleselixir import OraclesElixirCache
+from src.data.team_stats import TeamStatsStore
+
 
 class LoLDataCleaner:
     """
@@ -68,6 +71,79 @@ class LoLDataCleaner:
             "winrate%",
         ]
 
+        self.group_cols = ["league", "teamname", "split", "playoffs"]
+
+        self.sum_metrics = {
+            "W": "result",
+            "K": "teamkills",
+            "D": "teamdeaths",
+        }
+
+        self.mean_metrics = {
+            "AGT": "AGT",
+            "CKPM": "CKPM",
+            "GSPD": "gspd",
+            "GD15": "GD15",
+            "FB%": "firstblood",
+            "FT%": "firsttower",
+            "F3T%": "firsttothreetowers",
+            "PPG": "turretplates",
+            "FD%": "firstdragon",
+            "FBN%": "firstbaron",
+            "LNE%": "LNE%",
+            "JNG%": "JNG%",
+            "WPM": "wpm",
+            "CWPM": "CWPM",
+            "WCPM": "WCPM",
+        }
+
+        self.rate_metrics = {
+            "HLD%": ("heralds", "opp_heralds"),
+            "GRB%": ("void_grubs", "opp_void_grubs"),
+            "BN%": ("barons", "opp_barons"),
+            "ELD%": ("elders", "opp_elders"),
+            "DRG%": ("dragons", "opp_dragons"),
+        }
+
+        self.oracleselixir_text_cols = ["gameid", "league", "split", "teamname"]
+        self.oracleselixir_numeric_cols = [
+            "participantid",
+            "playoffs",
+            "gamelength",
+            "result",
+            "minionkills",
+            "monsterkills",
+            "goldat15",
+            "opp_goldat15",
+            "controlwardsbought",
+            "wardskilled",
+            "teamkills",
+            "teamdeaths",
+            "gspd",
+            "firstblood",
+            "firsttower",
+            "firsttothreetowers",
+            "turretplates",
+            "firstdragon",
+            "firstbaron",
+            "wpm",
+            "heralds",
+            "opp_heralds",
+            "void_grubs",
+            "opp_void_grubs",
+            "barons",
+            "opp_barons",
+            "elders",
+            "opp_elders",
+            "dragons",
+            "opp_dragons",
+        ]
+        self.oracleselixir = OraclesElixirCache(
+            self.base_output_path_oracleselixir,
+            text_cols=self.oracleselixir_text_cols,
+            numeric_cols=self.oracleselixir_numeric_cols,
+        )
+
         self.league_keywords = {
             "2023": ["LPL", "LEC", "LCK", "LCS", "CBLOL", "LLA", "PCS", "VCS", "LJL"],
             "2024": ["LPL", "LEC", "LCK", "LCS", "CBLOL", "LLA", "PCS", "VCS", "LJL"],
@@ -297,100 +373,313 @@ class LoLDataCleaner:
         out["winrate%"] = out["W"] / out["GP"] if out["GP"] > 0 else np.nan
         return pd.Series(out)
 
-    def clean_teams(self) -> pd.DataFrame:
+    def _source_cols(self) -> list:
         """
-        Main processing method for teams data that reads Oracle's Elixir data and computes daily team statistics.
+        Returns the game-level columns that are accumulated by aggregate_cumulative.
+        """
+        source_cols = list(self.sum_metrics.values()) + list(self.mean_metrics.values())
+        for my_col, opp_col in self.rate_metrics.values():
+            source_cols += [my_col, opp_col]
+        return list(dict.fromkeys(source_cols))
+
+    def aggregate_cumulative(
+        self, df: pd.DataFrame, initial=None, return_totals=False
+    ) -> pd.DataFrame:
+        """
+        Calculates cumulative performance statistics for every team on every game day
+        in a single pass, using running sums and counts instead of re-aggregating
+        the growing history of each team.
+
+        Produces the same metrics as aggregate_until_date, one row per
+        (league, team, split, playoffs) group and distinct game day.
+
+        Args:
+            df (pd.DataFrame): Team-level game rows (one row per team per game).
+            initial (pd.DataFrame): Optional running totals, as returned with
+                                    return_totals, to continue from. The rows of df must
+                                    all be later.
+            return_totals (bool): Whether to also return the running totals at the end.
 
         Returns:
-            pd.DataFrame: A final, large table of team performance metrics organized by date and league.
+            pd.DataFrame: Daily cumulative statistics, including the group columns.
+            pd.DataFrame: Only if return_totals is set, the running sums, counts, games
+                          and output rows ('days') of every group, in output order,
+                          including groups of initial without new games.
         """
-        teams_2023 = pd.read_csv(
-            f"{self.base_output_path_oracleselixir}2023_LoL_esports_match_data_from_OraclesElixir.csv",
-            sep=",",
-            low_memory=False,
-        )
-        teams_2024 = pd.read_csv(
-            f"{self.base_output_path_oracleselixir}2024_LoL_esports_match_data_from_OraclesElixir.csv",
-            sep=",",
-            low_memory=False,
+        df = df.dropna(subset=self.group_cols).copy()
+        df["day"] = df["date"].dt.normalize()
+
+        source_cols = self._source_cols()
+        sum_cols = [f"sum_{c}" for c in source_cols]
+        count_cols = [f"count_{c}" for c in source_cols]
+
+        values = df[source_cols].apply(pd.to_numeric, errors="coerce")
+        work = pd.concat(
+            [
+                df[self.group_cols + ["day"]],
+                values.fillna(0).set_axis(sum_cols, axis=1),
+                values.notna().astype(int).set_axis(count_cols, axis=1),
+            ],
+            axis=1,
         )
-        teams_2025 = pd.read_csv(
-            f"{self.base_output_path_oracleselixir}2025_LoL_esports_match_data_from_OraclesElixir.csv",
-            sep=",",
-            low_memory=False,
+        work["games"] = 1
+        work["days"] = 0
+        work["seed"] = False
+
+        # Running totals are prepended as one seed row per group, so the cumulative
+        # sums continue in exactly the same order as in a full rebuild.
+        if initial is not None and len(initial):
+            seeds = initial[
+                self.group_cols + sum_cols + count_cols + ["games", "days"]
+            ].copy()
+            seeds["day"] = pd.Timestamp("1900-01-01")
+            seeds["seed"] = True
+            work = pd.concat([seeds[work.columns], work], ignore_index=True)
+
+        work = work.sort_values(self.group_cols + ["day"], kind="stable")
+
+        group_ids = work.groupby(self.group_cols, sort=False).ngroup().to_numpy()
+
+        # Plain sequential sums (pandas' groupby cumsum is compensated), so that
+        # continuing from stored totals reproduces a full rebuild exactly.
+        sum_values = work[sum_cols].to_numpy(dtype=float, copy=True)
+        bounds = np.flatnonzero(np.diff(group_ids)) + 1
+        for start, stop in zip(np.r_[0, bounds], np.r_[bounds, len(work)]):
+            np.cumsum(sum_values[start:stop], axis=0, out=sum_values[start:stop])
+        sums = pd.DataFrame(sum_values, columns=sum_cols, index=work.index)
+        counts = work[count_cols].groupby(group_ids).cumsum()
+        games = work["games"].groupby(group_ids).cumsum().to_numpy()
+
+        last_of_day = ~work.duplicated(subset=self.group_cols + ["day"], keep="last")
+        last_of_day = last_of_day.to_numpy() & ~work["seed"].to_numpy(dtype=bool)
+
+        if return_totals:
+            days = (work["days"] + last_of_day).groupby(group_ids).cumsum().to_numpy()
+            last_of_group = ~work.duplicated(
+                subset=self.group_cols, keep="last"
+            ).to_numpy()
+            totals = work.loc[last_of_group, self.group_cols].copy()
+            totals[sum_cols] = sums[last_of_group]
+            totals[count_cols] = counts[last_of_group]
+            totals["games"] = games[last_of_group]
+            totals["days"] = days[last_of_group]
+            totals = totals.reset_index(drop=True)
+
+        sums = sums[last_of_day]
+        counts = counts[last_of_day]
+        gp = games[last_of_day].astype(float)
+
+        def ratio(num, den):
+            num = np.asarray(num, dtype=float)
+            den = np.asarray(den, dtype=float)
+            out = np.full(len(num), np.nan)
+            np.divide(num, den, out=out, where=den > 0)
+            return out
+
+        snapshot = work.loc[last_of_day, self.group_cols + ["day"]]
+        out = pd.DataFrame(
+            {
+                "league": snapshot["league"].to_numpy(),
+                "split": snapshot["split"].to_numpy(),
+                "playoffs": snapshot["playoffs"].to_numpy(),
+                "date": snapshot["day"].to_numpy(),
+                "Team": snapshot["teamname"].to_numpy(),
+                "GP": gp,
+            }
         )
 
-        teams = [teams_2023, teams_2024, teams_2025]
+        for name, col in self.sum_metrics.items():
+            out[name] = sums[f"sum_{col}"].to_numpy(dtype=float)
+        out["L"] = out["GP"] - out["W"]
+        out["KD"] = ratio(out["K"], out["D"])
 
-        res = pd.DataFrame()
+        for name, col in self.mean_metrics.items():
+            out[name] = ratio(sums[f"sum_{col}"], counts[f"count_{col}"])
 
-        for i in range(len(teams)):
-            year = str(2023 + i)
+        for name, (my_col, opp_col) in self.rate_metrics.items():
+            out[name] = ratio(
+                sums[f"sum_{my_col}"], sums[f"sum_{my_col}"] + sums[f"sum_{opp_col}"]
+            )
 
-            for l in self.league_keywords.get(year, []):
-                data = (
-                    teams_2023
-                    if year == "2023"
-                    else teams_2024 if year == "2024" else teams_2025
-                )
+        out["winrate%"] = ratio(out["W"], out["GP"])
 
-                df = data[data["league"].str.upper() == f"{l.upper()}"].copy()
+        if return_totals:
+            return out, totals
+        return out
 
-                df["date"] = pd.to_datetime(df["date"])
-                df["AGT"] = df["gamelength"] / 60
+    def _prepare_team_games(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Turns one league's Oracle's Elixir rows into team-level game rows
+        with the per-game metrics used by aggregate_cumulative.
 
-                players = df[df["participantid"] < 100].copy()
+        Args:
+            df (pd.DataFrame): Player and team rows of one league.
 
-                game_totals = (
-                    players.groupby("gameid")
-                    .agg(
-                        total_minions=("minionkills", "sum"),
-                        total_jungle=("monsterkills", "sum"),
-                    )
-                    .reset_index()
-                )
+        Returns:
+            pd.DataFrame: One row per team per game, sorted by date.
+        """
+        df["date"] = pd.to_datetime(df["date"])
+        df["AGT"] = df["gamelength"] / 60
 
-                df = df.merge(game_totals, on="gameid", how="left")
+        players = df[df["participantid"] < 100].copy()
 
-                df["LNE%"] = df["minionkills"] / df["total_minions"]
-                df["JNG%"] = df["monsterkills"] / df["total_jungle"]
+        game_totals = (
+            players.groupby("gameid")
+            .agg(
+                total_minions=("minionkills", "sum"),
+                total_jungle=("monsterkills", "sum"),
+            )
+            .reset_index()
+        )
+
+        df = df.merge(game_totals, on="gameid", how="left")
 
-                df = df[df["participantid"].isin([100, 200])].copy()
-                df = df.sort_values("date")
+        df["LNE%"] = df["minionkills"] / df["total_minions"]
+        df["JNG%"] = df["monsterkills"] / df["total_jungle"]
 
-                df["K+D"] = df["teamkills"] + df["teamdeaths"]
-                df["CKPM"] = df["K+D"] / df["AGT"]
-                df["GD15"] = df["goldat15"] - df["opp_goldat15"]
+        df = df[df["participantid"].isin([100, 200])].copy()
+        df = df.sort_values("date", kind="stable")
 
-                df["CWPM"] = (
-                    pd.to_numeric(df["controlwardsbought"], errors="coerce") / df["AGT"]
+        df["K+D"] = df["teamkills"] + df["teamdeaths"]
+        df["CKPM"] = df["K+D"] / df["AGT"]
+        df["GD15"] = df["goldat15"] - df["opp_goldat15"]
+
+        df["CWPM"] = (
+            pd.to_numeric(df["controlwardsbought"], errors="coerce") / df["AGT"]
+        )
+        df["WCPM"] = pd.to_numeric(df["wardskilled"], errors="coerce") / df["AGT"]
+        return df
+
+    def clean_teams(self, previous=None, return_state=False) -> pd.DataFrame:
+        """
+        Main processing method for teams data that reads Oracle's Elixir data and
+        computes daily team statistics. The yearly dumps are read through a
+        column-pruned Parquet cache instead of the raw CSV files, one year and one
+        configured league at a time.
+
+        With previous, every year and league is checked against the game ids processed
+        by the earlier run. When all unseen games are played after the last processed
+        day, only those games are aggregated, continuing the stored running totals.
+        Leagues with late or removed games are rebuilt. Either way the result equals a
+        full rebuild.
+
+        Args:
+            previous (tuple): Optional (teams, state) of an earlier run, as returned
+                              with return_state.
+            return_state (bool): Whether to also return the state needed to continue
+                                 from this run.
+
+        Returns:
+            pd.DataFrame: A final, large table of team performance metrics organized by
+                          date and league.
+            dict: Only if return_state is set, the running totals ('totals', with a
+                  'year' column) and the row count and game ids of every year and league
+                  ('blocks').
+        """
+        old_blocks = {}
+        old_totals = None
+        if previous is not None:
+            old_teams, old_state = previous
+            old_totals = old_state["totals"]
+            start = 0
+            for key, block in old_state["blocks"].items():
+                old_blocks[key] = (
+                    old_teams.iloc[start : start + block["rows"]],
+                    set(block["games"]),
                 )
-                df["WCPM"] = (
-                    pd.to_numeric(df["wardskilled"], errors="coerce") / df["AGT"]
+                start += block["rows"]
+
+        res = []
+        all_totals = []
+        blocks = {}
+
+        for year, leagues in self.league_keywords.items():
+            for l, df in self.oracleselixir.iter_leagues(year, leagues):
+                key = f"{year}/{l}"
+                df = self._prepare_team_games(df)
+                game_ids = df["gameid"].astype(str)
+
+                old_rows, old_games = old_blocks.get(key, (None, None))
+                new = ~game_ids.isin(old_games or ())
+                continue_block = (
+                    old_rows is not None
+                    and len(old_rows) > 0
+                    and "days" in old_totals.columns
+                    and old_games <= set(game_ids)
+                    and (
+                        df.loc[new, "date"].dt.normalize() > old_rows["date"].max()
+                    ).all()
                 )
 
-                daily_stats = []
-                for (league, team, split, playoffs), group in df.groupby(
-                    ["league", "teamname", "split", "playoffs"]
-                ):
-                    group = group.sort_values("date")
-                    for day in group["date"].dt.date.unique():
-                        subset = group[group["date"].dt.date <= day]
-                        stats = self.aggregate_until_date(subset)
-                        stats["league"] = league
-                        stats["split"] = split
-                        stats["playoffs"] = playoffs
-                        stats["date"] = pd.Timestamp(day)
-                        stats["Team"] = team
-                        daily_stats.append(stats)
-
-                df_final = pd.DataFrame(daily_stats)
-
-                for c in self.expected_cols:
-                    if c not in df_final.columns:
-                        df_final[c] = np.nan
-
-                df_final = df_final[self.expected_cols]
-                res = pd.concat([res, df_final], ignore_index=True)
-
+                if continue_block:
+                    seeds = old_totals[
+                        (old_totals["year"].astype(str) == year)
+                        & (old_totals["league"].str.upper() == l.upper())
+                    ].drop(columns=["year"])
+                    if new.any():
+                        df_final, totals = self.aggregate_cumulative(
+                            df[new], initial=seeds, return_totals=True
+                        )
+                        # The stored totals are in output order and count the rows of
+                        # every group, which labels the old rows with their group, so
+                        # new rows slot in exactly where a full rebuild puts them.
+                        groups = seeds.loc[seeds.index.repeat(seeds["days"])]
+                        old_rows = old_rows.assign(
+                            split=groups["split"].to_numpy(),
+                            playoffs=groups["playoffs"].to_numpy(),
+                        )
+                        df_final = pd.concat([old_rows, df_final], ignore_index=True)
+                        df_final = self._team_rows(
+                            df_final.sort_values(
+                                ["league", "Team", "split", "playoffs", "date"],
+                                kind="stable",
+                            )
+                        )
+                    else:
+                        df_final, totals = old_rows, seeds
+                else:
+                    df_final, totals = self.aggregate_cumulative(df, return_totals=True)
+                    df_final = self._team_rows(df_final)
+
+                res.append(df_final.reset_index(drop=True))
+                all_totals.append(totals.assign(year=year))
+                blocks[key] = {"rows": len(df_final), "games": sorted(set(game_ids))}
+
+        res = (
+            pd.concat(res, ignore_index=True)
+            if res
+            else pd.DataFrame(columns=self.expected_cols)
+        )
+        if return_state:
+            totals = (
+                pd.concat(all_totals, ignore_index=True)
+                if all_totals
+                else pd.DataFrame()
+            )
+            return res, {"totals": totals, "blocks": blocks}
         return res
+
+    def _team_rows(self, df_final: pd.DataFrame) -> pd.DataFrame:
+        """
+        Keeps the expected columns of aggregated statistics, adding missing ones as NaN.
+        """
+        for c in self.expected_cols:
+            if c not in df_final.columns:
+                df_final[c] = np.nan
+        return df_final[self.expected_cols]
+
+    def blend_teams(self, teams: pd.DataFrame) -> pd.DataFrame:
+        """
+        Materializes the statistics used for a team's next match on every team-day row.
+        Rows with 5 or fewer games are blended ahead of time with the team's most recent
+        stable snapshot in the same league, so merging and live predictions only need
+        an as-of lookup.
+
+        Args:
+            teams (pd.DataFrame): Daily team statistics as returned by clean_teams.
+
+        Returns:
+            pd.DataFrame: Blended daily statistics with a 'stable_date' column pointing
+                          to the stable snapshot each row was blended with.
+        """
+        return TeamStatsStore(teams, self.expected_cols).materialize()
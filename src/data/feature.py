@@ -1,5 +1,7 @@
 import pandas as pd
 
+from src.data.feature_kernel import LoLFeatureKernel
+
 
 class LoLDataFeatureEngineer:
     """
@@ -8,42 +10,45 @@ class LoLDataFeatureEngineer:
     """
 
     def __init__(self):
-        pass
+        self.kernel = LoLFeatureKernel()
 
-    def make_mirror_matches(self, df):
+    def make_mirror_diff(self, df):
         """
-        Doubles the dataset by creating 'mirrored' versions of each match.
-        For every match (Team A vs Team B), it adds a row for (Team B vs Team A).
-        This helps the model learn that the order of teams does not matter.
+        Builds comparative features for every match and its mirrored version in a single
+        vectorized step. Equivalent to make_diff on a copy of the matches with the
+        Team A and Team B columns swapped, without building that copy.
 
         Args:
-            df (pd.DataFrame): The original match dataset.
+            df (pd.DataFrame): DataFrame with separate columns for Team A and Team B.
 
         Returns:
-            pd.DataFrame: A dataset with twice the number of rows (original + mirrored).
+            pd.DataFrame: Original matches followed by mirrored ones, with only
+                         comparative features (diffs and ratios) and the remaining
+                         columns.
         """
+        a = df.reindex(columns=self.kernel.a_cols).to_numpy(dtype=float)
+        b = df.reindex(columns=self.kernel.b_cols).to_numpy(dtype=float)
+        features = self.kernel.transform_mirrored(a, b)
 
-        df_orig = df.copy()
-        df_mirror = df.copy()
-
-        a_cols = [c for c in df.columns if c.endswith("_A")]
-        for a_col in a_cols:
-            base = a_col[:-2]
-            b_col = f"{base}_B"
-            df_mirror[a_col], df_mirror[b_col] = df[b_col], df[a_col]
-
-        df_mirror["teamA"], df_mirror["teamB"] = df["teamB"], df["teamA"]
+        drop_cols = [c for c in df.columns if c.endswith("_A") or c.endswith("_B")]
+        rest = df.drop(columns=drop_cols)
+        rest_mirror = rest.copy()
 
-        df_mirror["teamA_win"] = 1 - df["teamA_win"]
+        if "teamA" in rest.columns and "teamB" in rest.columns:
+            rest_mirror["teamA"], rest_mirror["teamB"] = rest["teamB"], rest["teamA"]
+        if "teamA_win" in rest.columns:
+            rest_mirror["teamA_win"] = 1 - rest["teamA_win"]
 
-        df_out = pd.concat([df_orig, df_mirror], ignore_index=True)
+        rest = pd.concat([rest, rest_mirror], ignore_index=True)
+        features = pd.DataFrame(features, columns=self.kernel.feature_names)
 
-        return df_out
+        return pd.concat([rest, features], axis=1)
 
     def make_diff(self, df):
         """
         Transforms raw stats of two teams into comparative features.
-        Calculates the difference (A - B) and the ratio (A / B) for all metrics.
+        Calculates the difference (A - B) and the ratio (A / B) for all metrics
+        using the shared feature kernel.
 
         Args:
             df (pd.DataFrame): DataFrame with separate columns for Team A and Team B.
@@ -52,26 +57,13 @@ class LoLDataFeatureEngineer:
             pd.DataFrame: DataFrame containing only comparative features (diffs and ratios),
                          with original team-specific columns removed.
         """
-        a_cols = [c for c in df.columns if c.endswith("_A")]
-        diff_data = {}
-        ratio_data = {}
-
-        for a_col in a_cols:
-            base = a_col[:-2]
-            b_col = f"{base}_B"
-            if b_col in df.columns:
-                diff_data[f"diff_{base}"] = df[a_col] - df[b_col]
-                ratio_data[f"ratio_{base}"] = df[a_col] / (df[b_col] + 1e-6)
-
-        df = pd.concat([df, pd.DataFrame(diff_data), pd.DataFrame(ratio_data)], axis=1)
-        drop_cols = [c for c in df.columns if c.endswith("_A") or c.endswith("_B")]
-        df = df.drop(columns=drop_cols)
-        return df
+        return self.kernel.make_diff(df)
 
     def make_feature(self, df, validation=1):
         """
         Main pipeline for preparing training and validation datasets.
-        Splits data by date, augments the training set, and creates features.
+        Splits data by date, augments the training set with mirrored matches, and
+        creates features.
 
         Args:
             df (pd.DataFrame): The merged dataset with all match and team info.
@@ -88,11 +80,11 @@ class LoLDataFeatureEngineer:
         train_df = df[df["date"] < validation_start].copy()
         val_df = df[df["date"] >= validation_start].copy()
 
-        train_df = self.make_mirror_matches(train_df)
-
         meta_cols = ["teamA", "teamB", "league"]
 
-        train_df = self.make_diff(train_df.drop(columns=meta_cols, errors="ignore"))
+        train_df = self.make_mirror_diff(
+            train_df.drop(columns=meta_cols, errors="ignore")
+        )
         val_df = self.make_diff(val_df.drop(columns=meta_cols, errors="ignore"))
 
         train_df = train_df.fillna(-1)
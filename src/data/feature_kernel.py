@@ -0,0 +1,125 @@
+import numpy as np
+import pandas as pd
+
+
+class LoLFeatureKernel:
+    """
+    The single feature-engineering kernel shared by training and inference.
+    It turns the stats of Team A and Team B into difference and ratio features
+    with a fixed, versioned column order.
+
+    The version is stored with every trained model and checked when it is loaded;
+    bump it whenever the features or their order change.
+    """
+
+    version = 1
+
+    stat_cols = [
+        "GP",
+        "W",
+        "L",
+        "AGT",
+        "K",
+        "D",
+        "KD",
+        "CKPM",
+        "GSPD",
+        "GD15",
+        "FB%",
+        "FT%",
+        "F3T%",
+        "PPG",
+        "HLD%",
+        "GRB%",
+        "FD%",
+        "DRG%",
+        "ELD%",
+        "FBN%",
+        "BN%",
+        "LNE%",
+        "JNG%",
+        "WPM",
+        "CWPM",
+        "WCPM",
+        "winrate%",
+    ]
+
+    ratio_eps = 1e-6
+
+    def __init__(self):
+        """
+        Initializes the kernel with the column names of its inputs and outputs.
+        """
+        self.a_cols = [f"{c}_A" for c in self.stat_cols]
+        self.b_cols = [f"{c}_B" for c in self.stat_cols]
+        self.feature_names = [f"diff_{c}" for c in self.stat_cols] + [
+            f"ratio_{c}" for c in self.stat_cols
+        ]
+
+    def transform(self, a, b, out=None):
+        """
+        Computes the difference (A - B) and the ratio (A / B) features.
+
+        Args:
+            a (np.ndarray): 2-D float array of Team A stats in stat_cols order.
+            b (np.ndarray): 2-D float array of Team B stats in stat_cols order.
+            out (np.ndarray): Optional preallocated output of shape
+                              (n, 2 * len(stat_cols)).
+
+        Returns:
+            np.ndarray: Features in feature_names order.
+        """
+        k = len(self.stat_cols)
+        if out is None:
+            out = np.empty((a.shape[0], 2 * k), dtype=float)
+
+        np.subtract(a, b, out=out[:, :k])
+        np.add(b, self.ratio_eps, out=out[:, k:])
+        np.divide(a, out[:, k:], out=out[:, k:])
+        return out
+
+    def transform_mirrored(self, a, b):
+        """
+        Computes the features of every match followed by the features of its mirrored
+        version (B vs A) in one preallocated array, without building a mirrored copy
+        of the inputs. Mirrored differences are B - A, which equals the sign-flipped
+        original without producing negative zeros; mirrored ratios are B / A, since
+        with the epsilon guard they are not exact reciprocals of A / B.
+
+        Args:
+            a (np.ndarray): 2-D float array of Team A stats in stat_cols order.
+            b (np.ndarray): 2-D float array of Team B stats in stat_cols order.
+
+        Returns:
+            np.ndarray: Array with 2 * n rows, original matches first.
+        """
+        n, k = a.shape[0], len(self.stat_cols)
+        out = np.empty((2 * n, 2 * k), dtype=float)
+
+        self.transform(a, b, out=out[:n])
+        np.subtract(b, a, out=out[n:, :k])
+        np.add(a, self.ratio_eps, out=out[n:, k:])
+        np.divide(b, out[n:, k:], out=out[n:, k:])
+        return out
+
+    def make_diff(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Replaces the Team A and Team B columns of a DataFrame with comparative features.
+        Stats missing from the DataFrame are treated as NaN.
+
+        Args:
+            df (pd.DataFrame): DataFrame with separate columns for Team A and Team B.
+
+        Returns:
+            pd.DataFrame: The remaining columns followed by the features in
+                          feature_names order.
+        """
+        a = df.reindex(columns=self.a_cols).to_numpy(dtype=float)
+        b = df.reindex(columns=self.b_cols).to_numpy(dtype=float)
+
+        features = pd.DataFrame(
+            self.transform(a, b), columns=self.feature_names, index=df.index
+        )
+
+        drop_cols = [c for c in df.columns if c.endswith("_A") or c.endswith("_B")]
+        return pd.concat([df.drop(columns=drop_cols), features], axis=1)
@@ -1,5 +1,7 @@
 import pandas as pd
 
+from src.data.feature_kernel import LoLFeatureKernel
+
 
 class LoLNewDataFeatureEngineer:
     """
@@ -11,11 +13,12 @@ class LoLNewDataFeatureEngineer:
         """
         Initializes the Feature Engineer for new data.
         """
-        pass
+        self.kernel = LoLFeatureKernel()
 
     def make_diff(self, df):
         """
-        Calculates the differences and ratios between Team A and Team B stats.
+        Calculates the differences and ratios between Team A and Team B stats
+        with the shared feature kernel, in the same column order as during training.
         Removes the original columns to keep only the comparative features.
 
         Args:
@@ -24,21 +27,7 @@ class LoLNewDataFeatureEngineer:
         Returns:
             pd.DataFrame: Data with 'diff_' and 'ratio_' features.
         """
-        a_cols = [c for c in df.columns if c.endswith("_A")]
-        diff_data = {}
-        ratio_data = {}
-
-        for a_col in a_cols:
-            base = a_col[:-2]
-            b_col = f"{base}_B"
-            if b_col in df.columns:
-                diff_data[f"diff_{base}"] = df[a_col] - df[b_col]
-                ratio_data[f"ratio_{base}"] = df[a_col] / (df[b_col] + 1e-6)
-
-        df = pd.concat([df, pd.DataFrame(diff_data), pd.DataFrame(ratio_data)], axis=1)
-        drop_cols = [c for c in df.columns if c.endswith("_A") or c.endswith("_B")]
-        df = df.drop(columns=drop_cols)
-        return df
+        return self.kernel.make_diff(df)
 
     def make_new_feature(self, df):
         """
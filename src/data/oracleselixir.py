@@ -0,0 +1,196 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+
+
+class OraclesElixirCache:
+    """
+    A columnar cache for the yearly Oracle's Elixir CSV dumps.
+    Each CSV is converted once into a typed, column-pruned Parquet file,
+    which is rebuilt only when the source file changes.
+    Rows are stored sorted by an upper-cased league key so that league
+    filters are pushed down to the Parquet reader.
+    """
+
+    def __init__(self, source_dir, text_cols, numeric_cols, cache_dir=None):
+        """
+        Initializes the cache with the source directory and the columns to keep.
+
+        Args:
+            source_dir (str | Path): Directory with the yearly Oracle's Elixir CSV
+                                     files.
+            text_cols (list): Columns stored as strings.
+            numeric_cols (list): Columns coerced to numbers.
+            cache_dir (str | Path): Directory for Parquet files, defaults to
+                                    source_dir/cache.
+        """
+        self.source_dir = Path(source_dir)
+        self.cache_dir = Path(cache_dir) if cache_dir else self.source_dir / "cache"
+        self.text_cols = list(text_cols)
+        self.numeric_cols = list(numeric_cols)
+        self.date_cols = ["date"]
+        self.columns = self.text_cols + self.date_cols + self.numeric_cols
+        self.league_key_col = "league_key"
+        self.stored_columns = self.columns + [self.league_key_col]
+        self.row_group_size = 50_000
+
+    def source_path(self, year: str) -> Path:
+        """
+        Returns the path of the raw yearly CSV dump.
+        """
+        return self.source_dir / f"{year}_LoL_esports_match_data_from_OraclesElixir.csv"
+
+    def cache_path(self, year: str) -> Path:
+        """
+        Returns the path of the cached Parquet file for a year.
+        """
+        return (
+            self.cache_dir / f"{year}_LoL_esports_match_data_from_OraclesElixir.parquet"
+        )
+
+    def _meta_path(self, year: str) -> Path:
+        return self.cache_path(year).with_suffix(".json")
+
+    @staticmethod
+    def _file_hash(path: Path, chunk_size=1 << 20) -> str:
+        """
+        Computes the SHA-256 digest of a file without loading it whole.
+        """
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _is_fresh(self, year: str) -> bool:
+        """
+        Checks whether the cached Parquet file still matches its source CSV.
+        Size and mtime are compared first; the content hash is only computed
+        when the mtime changed but the size did not.
+        """
+        source = self.source_path(year)
+        meta_path = self._meta_path(year)
+        if not self.cache_path(year).exists() or not meta_path.exists():
+            return False
+
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+
+        stat = source.stat()
+        if (
+            meta.get("columns") != self.stored_columns
+            or meta.get("size") != stat.st_size
+        ):
+            return False
+        if meta.get("mtime_ns") == stat.st_mtime_ns:
+            return True
+        if meta.get("sha256") != self._file_hash(source):
+            return False
+
+        meta["mtime_ns"] = stat.st_mtime_ns
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        return True
+
+    def ingest(self, year: str) -> Path:
+        """
+        Converts a yearly CSV dump into a typed, column-pruned Parquet file.
+
+        Args:
+            year (str): The season year (e.g., "2023", "2024", "2025").
+
+        Returns:
+            Path: Path of the written Parquet file.
+        """
+        source = self.source_path(year)
+        stat = source.stat()
+        wanted = set(self.columns)
+
+        df = pd.read_csv(
+            source, sep=",", usecols=lambda c: c in wanted, low_memory=False
+        )
+
+        for c in self.columns:
+            if c not in df.columns:
+                df[c] = pd.NA if c in self.text_cols else float("nan")
+
+        for c in self.text_cols:
+            df[c] = df[c].astype("string")
+        for c in self.date_cols:
+            df[c] = pd.to_datetime(df[c], errors="coerce")
+        for c in self.numeric_cols:
+            df[c] = pd.to_numeric(df[c], errors="coerce")
+
+        df[self.league_key_col] = df["league"].str.upper()
+        df = df[self.stored_columns].sort_values(self.league_key_col, kind="stable")
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_path(year)
+        tmp_path = path.with_suffix(".parquet.tmp")
+        df.to_parquet(tmp_path, index=False, row_group_size=self.row_group_size)
+        os.replace(tmp_path, path)
+
+        meta = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": self._file_hash(source),
+            "columns": self.stored_columns,
+        }
+        with open(self._meta_path(year), "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+        return path
+
+    def load(self, year: str, columns=None, leagues=None) -> pd.DataFrame:
+        """
+        Loads a year of Oracle's Elixir data, rebuilding the cache if the source
+        changed.
+
+        Args:
+            year (str): The season year (e.g., "2023", "2024", "2025").
+            columns (list): Optional column projection, defaults to all cached columns.
+            leagues (list): Optional league names (case-insensitive) to keep;
+                            the filter is applied while reading the Parquet file.
+
+        Returns:
+            pd.DataFrame: The requested columns for the matching rows of the yearly
+                          dump.
+        """
+        if not self._is_fresh(year):
+            self.ingest(year)
+
+        filters = None
+        if leagues is not None:
+            filters = [(self.league_key_col, "in", [l.upper() for l in leagues])]
+
+        return pd.read_parquet(self.cache_path(year), columns=columns, filters=filters)
+
+    def iter_leagues(self, year: str, leagues: list, columns=None):
+        """
+        Streams a year of data league by league, reading only the rows of the
+        requested leagues. At most one year's worth of filtered rows is held in memory.
+
+        Args:
+            year (str): The season year (e.g., "2023", "2024", "2025").
+            leagues (list): League names in the order they should be yielded.
+            columns (list): Optional column projection, defaults to all source columns.
+
+        Yields:
+            tuple: (league, pd.DataFrame) for each league that has rows in the dump.
+        """
+        columns = list(columns or self.columns)
+        data = self.load(year, columns=columns + [self.league_key_col], leagues=leagues)
+
+        groups = {
+            key: df.drop(columns=[self.league_key_col])
+            for key, df in data.groupby(self.league_key_col, sort=False)
+        }
+        del data
+
+        for l in leagues:
+            df = groups.pop(l.upper(), None)
+            if df is not None:
+                yield l, df.reset_index(drop=True)
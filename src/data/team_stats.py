@@ -0,0 +1,323 @@
+import hashlib
+from pathlib import Path
+import threading
+
+import numpy as np
+import pandas as pd
+
+
+class TeamStatsStore:
+    """
+    An in-memory index of daily team statistics for fast "as-of" lookups.
+    Rows are grouped by (league, Team) and kept as date-sorted NumPy arrays,
+    so the latest snapshot strictly before a date is found by binary search.
+
+    The store accepts either raw daily statistics, which are blended with the
+    last stable snapshot at lookup time, or a table produced by materialize(),
+    whose rows are already blended and are returned as they are.
+    """
+
+    def __init__(self, teams: pd.DataFrame, numeric_cols: list, stable_gp=5):
+        """
+        Builds the index from a table of daily team statistics.
+
+        Args:
+            teams (pd.DataFrame): Daily team statistics with 'league', 'Team' and 'date'
+                                  columns.
+            numeric_cols (list): Metrics that are blended with the last stable snapshot.
+            stable_gp (int): Number of games above which a snapshot is considered
+                             stable.
+        """
+        self.stable_gp = stable_gp
+        self.stable_date_col = "stable_date"
+        self.precomputed = self.stable_date_col in teams.columns
+        self.key_cols = ["date", "Team", "league", self.stable_date_col]
+        self.stat_cols = [c for c in teams.columns if c not in self.key_cols]
+
+        teams = teams.sort_values(["league", "Team", "date"], kind="stable")
+
+        self.leagues = np.asarray(teams["league"])
+        self.teams = np.asarray(teams["Team"])
+        self.dates = pd.to_datetime(teams["date"]).to_numpy(dtype="datetime64[ns]")
+        self.values = teams[self.stat_cols].to_numpy(dtype=float)
+        self.gp = teams["GP"].to_numpy(dtype=float)
+
+        self.index = {}
+        for key, positions in teams.groupby(
+            ["league", "Team"], sort=False
+        ).indices.items():
+            self.index[key] = (positions[0], positions[-1] + 1)
+
+        starts = np.zeros(len(teams), dtype=np.int64)
+        for start, stop in self.index.values():
+            starts[start:stop] = start
+
+        if self.precomputed:
+            self.ready = np.ones(len(teams), dtype=bool)
+        else:
+            self.ready = self.gp > self.stable_gp
+
+        stable_pos = np.where(self.ready, np.arange(len(teams)), -1)
+        self.last_stable = (
+            np.maximum.accumulate(stable_pos) if len(teams) else stable_pos
+        )
+        self.last_stable[self.last_stable < starts] = -1
+
+        self.blend_cols = [c for c in numeric_cols if c in self.stat_cols]
+        self.blend_idx = [self.stat_cols.index(c) for c in self.blend_cols]
+        self.blend_index = ["GP"] + [c for c in self.blend_cols if c != "GP"]
+
+        self.positions = pd.DataFrame(
+            {
+                "league": self.leagues,
+                "Team": self.teams,
+                "date": self.dates,
+                "pos": np.arange(len(teams)),
+            }
+        ).sort_values("date", kind="stable")
+
+    def locate(self, team, league, date):
+        """
+        Finds the positions of the latest snapshot strictly before a date
+        and of the latest stable snapshot up to it.
+
+        Args:
+            team (str): Name of the team.
+            league (str): The league the team plays in.
+            date (pd.Timestamp): The date of the match to look back from.
+
+        Returns:
+            tuple: (last, stable) row positions, -1 where no snapshot exists.
+        """
+        bounds = self.index.get((league, team))
+        if bounds is None or pd.isna(date):
+            return -1, -1
+
+        start, stop = bounds
+        date = np.datetime64(pd.Timestamp(date), "ns")
+        pos = start + np.searchsorted(self.dates[start:stop], date, side="left")
+        if pos == start:
+            return -1, -1
+
+        last = pos - 1
+        return last, self.last_stable[last]
+
+    def _blend(self, last, stable):
+        """
+        Blends snapshots with their last stable snapshot, which counts for at most
+        stable_gp games. Columns that are not blended are left as NaN.
+
+        Args:
+            last (np.ndarray): Positions of the current snapshots.
+            stable (np.ndarray): Positions of the matching stable snapshots.
+
+        Returns:
+            np.ndarray: A 2-D float array with columns in stat_cols order.
+        """
+        gp_stable = np.minimum(self.gp[stable], self.stable_gp)[:, None]
+        gp_curr = self.gp[last][:, None]
+        gp_total = gp_stable + gp_curr
+
+        blended = np.full((len(last), len(self.stat_cols)), np.nan)
+        if "GP" in self.stat_cols:
+            blended[:, self.stat_cols.index("GP")] = gp_total[:, 0]
+        blended[:, self.blend_idx] = (
+            self.values[last][:, self.blend_idx] * gp_curr
+            + self.values[stable][:, self.blend_idx] * gp_stable
+        ) / gp_total
+        return blended
+
+    def get_stats(self, team, league, date):
+        """
+        Retrieves the most recent statistics for a specific team before a given date.
+        If the team has played 5 or fewer games, the snapshot is blended with the
+        last stable snapshot, which counts for at most 5 games.
+
+        Args:
+            team (str): Name of the team.
+            league (str): The league the team plays in.
+            date (pd.Timestamp): The date of the match to look back from.
+
+        Returns:
+            pd.Series: Recent or blended performance metrics for the team.
+                       Returns an empty Series if no data is found.
+        """
+        last, stable = self.locate(team, league, date)
+        if last < 0:
+            return pd.Series(dtype=float)
+
+        if self.ready[last]:
+            return pd.Series(self.values[last], index=self.stat_cols)
+
+        if stable < 0:
+            return pd.Series(dtype=float)
+
+        blended = self._blend(np.array([last]), np.array([stable]))[0]
+        return pd.Series(
+            blended[[self.stat_cols.index(c) for c in self.blend_index]],
+            index=self.blend_index,
+        )
+
+    def get_stats_batch(self, teams, leagues, dates):
+        """
+        Vectorized version of get_stats for many (team, league, date) lookups.
+        The as-of search is done with pd.merge_asof and the blend with the last
+        stable snapshot is done as column arithmetic.
+
+        Args:
+            teams (array-like): Team names.
+            leagues (array-like): League of each team.
+            dates (array-like): Date of each match to look back from.
+
+        Returns:
+            tuple: (values, found) where values is a 2-D float array with one row per
+                   lookup and columns in stat_cols order, and found is a boolean mask
+                   of lookups for which statistics exist.
+        """
+        left = pd.DataFrame(
+            {
+                "league": np.asarray(leagues),
+                "Team": np.asarray(teams),
+                "date": pd.to_datetime(np.asarray(dates)).to_numpy(
+                    dtype="datetime64[ns]"
+                ),
+                "row": np.arange(len(teams)),
+            }
+        )
+        left = left.dropna(subset=["date"]).sort_values("date", kind="stable")
+
+        matched = pd.merge_asof(
+            left,
+            self.positions,
+            on="date",
+            by=["league", "Team"],
+            allow_exact_matches=False,
+            direction="backward",
+        )
+
+        last = np.full(len(teams), -1, dtype=np.int64)
+        last[matched["row"].to_numpy()] = (
+            matched["pos"].fillna(-1).to_numpy(dtype=np.int64)
+        )
+
+        has_last = last >= 0
+        safe_last = np.where(has_last, last, 0)
+        stable = np.where(has_last, self.last_stable[safe_last], -1)
+        is_ready = has_last & self.ready[safe_last]
+        blend = has_last & ~is_ready & (stable >= 0)
+
+        values = np.full((len(teams), len(self.stat_cols)), np.nan)
+        values[is_ready] = self.values[last[is_ready]]
+        values[blend] = self._blend(last[blend], stable[blend])
+
+        return values, is_ready | blend
+
+    def materialize(self) -> pd.DataFrame:
+        """
+        Precomputes, for every snapshot, the statistics a lookup returns when that
+        snapshot is the latest one: the snapshot itself once the team has played more
+        than 5 games, otherwise its blend with the last stable snapshot.
+        Snapshots without any stable history are dropped, since lookups on them
+        return no statistics.
+
+        Returns:
+            pd.DataFrame: Blended daily statistics with a 'stable_date' column pointing
+                          to the date of the stable snapshot that was used.
+        """
+        rows = np.arange(len(self.gp))
+        stable = self.last_stable
+        blend = ~self.ready & (stable >= 0)
+        found = self.ready | blend
+
+        values = self.values.copy()
+        values[blend] = self._blend(rows[blend], stable[blend])
+
+        out = pd.DataFrame(
+            {
+                "league": self.leagues[found],
+                "date": self.dates[found],
+                "Team": self.teams[found],
+            }
+        )
+        out[self.stat_cols] = values[found]
+        out[self.stable_date_col] = self.dates[stable[found]]
+        return out
+
+
+class TeamStatsCache:
+    """
+    A process-wide, memory-resident cache of indexed team statistics files.
+    Each file is parsed into a TeamStatsStore once per set of blended metrics
+    and reloaded only when its mtime or content hash changes.
+    """
+
+    _entries = {}
+    _lock = threading.Lock()
+
+    def __init__(self, path, numeric_cols: list):
+        """
+        Initializes the cache for one team statistics CSV file.
+
+        Args:
+            path (str | Path): Path of the team statistics CSV file.
+            numeric_cols (list): Metrics that are blended with the last stable snapshot.
+        """
+        self.path = Path(path).resolve()
+        self.numeric_cols = numeric_cols
+        # Stores depend on the set of blended metrics, so it is part of the key.
+        self.key = (self.path, tuple(numeric_cols))
+
+    @staticmethod
+    def _file_hash(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _load(self) -> TeamStatsStore:
+        """
+        Reads the CSV file and builds the indexed store.
+        """
+        teams = pd.read_csv(self.path, float_precision="round_trip")
+        for c in ["date", "stable_date"]:
+            if c in teams.columns:
+                teams[c] = pd.to_datetime(teams[c])
+        return TeamStatsStore(teams, self.numeric_cols)
+
+    def _entry(self) -> dict:
+        """
+        Returns the cache entry for the file, reloading it if the file changed.
+        """
+        stat = self.path.stat()
+        entry = self._entries.get(self.key)
+
+        if entry is not None and (entry["size"], entry["mtime_ns"]) == (
+            stat.st_size,
+            stat.st_mtime_ns,
+        ):
+            return entry
+
+        digest = self._file_hash(self.path)
+        if entry is not None and entry["sha256"] == digest:
+            entry["size"], entry["mtime_ns"] = stat.st_size, stat.st_mtime_ns
+            return entry
+
+        entry = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": digest,
+            "store": self._load(),
+        }
+        self._entries[self.key] = entry
+        return entry
+
+    def get_store(self) -> TeamStatsStore:
+        """
+        Returns the indexed team statistics, reloading the file only if it changed.
+
+        Returns:
+            TeamStatsStore: The shared, pre-indexed store.
+        """
+        with self._lock:
+            return self._entry()["store"]
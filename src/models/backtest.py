@@ -0,0 +1,300 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import json
+import multiprocessing
+import os
+from pathlib import Path
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from src.data.feature import LoLDataFeatureEngineer
+from src.models.evaluation import classification_metrics
+from src.models.search import fit_model
+
+# Per-process state of the backtest workers, set by _init_worker.
+_worker = {}
+
+
+def _init_worker(data_dir):
+    for name in ["X", "y", "dates"]:
+        _worker[name] = np.load(Path(data_dir) / f"{name}.npy", mmap_mode="r")
+
+
+def _run_step(model_name, params, train_stop, test_rows, random_seed):
+    """
+    Fits one walk-forward step on the rows before train_stop and scores the test rows.
+    """
+    X, y, dates = _worker["X"], _worker["y"], _worker["dates"]
+    model = fit_model(
+        model_name,
+        params,
+        X[:train_stop],
+        y[:train_stop],
+        dates[:train_stop],
+        random_seed,
+    )
+    return model.predict_proba(X[test_rows])[:, 1]
+
+
+class WalkForwardBacktest:
+    """
+    Replays the history week by week. At every step a model is trained on all
+    matches before the step (with mirrored matches and date-linear weights, as in
+    the regular training) and scores the matches of the following week.
+
+    Features are computed once for the whole history and shared by all steps
+    through memory-mapped arrays; the per-step fits run in a process pool.
+    """
+
+    default_params = {
+        "n_estimators": 40,
+        "max_depth": 8,
+        "min_samples_leaf": 1,
+        "min_samples_split": 6,
+    }
+
+    def __init__(
+        self,
+        model_name="random_forest",
+        params=None,
+        start=None,
+        step_days=7,
+        n_workers=None,
+        random_seed=42,
+    ):
+        """
+        Initializes the backtest.
+
+        Args:
+            model_name (str): Key of search.MODEL_SPECS.
+            params (dict): Model hyperparameters, required except for the random forest,
+                           which defaults to the hyperparameters of RF.
+            start (str): First day to score, defaults to January 1st of the last season.
+            step_days (int): Length of a step in days.
+            n_workers (int): Worker processes, defaults to all cores.
+            random_seed (int): Seed of the models.
+        """
+        if params is None:
+            if model_name != "random_forest":
+                raise ValueError(f"Hyperparameters are required for '{model_name}'.")
+            params = dict(self.default_params)
+
+        self.model_name = model_name
+        self.params = params
+        self.start = start
+        self.step_days = step_days
+        self.n_workers = n_workers or os.cpu_count()
+        self.random_seed = random_seed
+
+        self.base_dir = Path(__file__).resolve().parents[2]
+        self.data_path = self.base_dir / "data" / "merged" / "data.csv"
+        self.feature_engineer = LoLDataFeatureEngineer()
+
+    def build_features(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Computes features for every match and its mirrored version once, sorted by date.
+
+        Args:
+            data (pd.DataFrame): Merged matches with Team A and Team B statistics.
+
+        Returns:
+            pd.DataFrame: Features with 'date', 'league', 'teamA_win' and an 'original'
+                          flag that is False for mirrored rows.
+        """
+        data = data.drop(columns=["teamA", "teamB"], errors="ignore").copy()
+        data["date"] = pd.to_datetime(data["date"])
+
+        features = self.feature_engineer.make_mirror_diff(data)
+        features["original"] = np.arange(len(features)) < len(data)
+        features = features.fillna(-1)
+        return features.sort_values("date", kind="stable").reset_index(drop=True)
+
+    def make_steps(self, dates: pd.Series) -> list:
+        """
+        Returns the [start, end) boundaries of all steps that contain matches.
+        """
+        start = (
+            pd.Timestamp(self.start)
+            if self.start
+            else pd.Timestamp(dates.max().year, 1, 1)
+        )
+        bounds = pd.date_range(
+            start,
+            dates.max() + pd.Timedelta(days=self.step_days),
+            freq=f"{self.step_days}D",
+        )
+        return [
+            (a, b)
+            for a, b in zip(bounds[:-1], bounds[1:])
+            if ((dates >= a) & (dates < b)).any()
+        ]
+
+    def run(self, data=None) -> tuple:
+        """
+        Runs the walk-forward backtest.
+
+        Args:
+            data (pd.DataFrame): Merged matches, defaults to data/merged/data.csv.
+
+        Returns:
+            tuple: (predictions, by_step, by_league, by_league_step) where
+                   predictions holds the win probability of every scored match and
+                   the others hold accuracy, log-loss and AUC per step, per league
+                   and per league and step.
+        """
+        if data is None:
+            data = pd.read_csv(self.data_path)
+
+        features = self.build_features(data)
+        dates = features["date"]
+        feature_cols = self.feature_engineer.kernel.feature_names
+        original = features["original"].to_numpy()
+
+        steps = []
+        for step_start, step_end in self.make_steps(dates[original]):
+            train_stop = int(
+                np.searchsorted(
+                    dates.to_numpy(), step_start.to_datetime64(), side="left"
+                )
+            )
+            test_rows = np.flatnonzero(
+                original
+                & (dates >= step_start).to_numpy()
+                & (dates < step_end).to_numpy()
+            )
+            if train_stop > 0 and len(test_rows):
+                steps.append((step_start, step_end, train_stop, test_rows))
+
+        print(
+            f"Backtesting {len(steps)} steps of {self.step_days} days "
+            f"with {self.n_workers} workers."
+        )
+
+        with tempfile.TemporaryDirectory() as data_dir:
+            np.save(
+                Path(data_dir) / "X.npy", features[feature_cols].to_numpy(dtype=float)
+            )
+            np.save(Path(data_dir) / "y.npy", features["teamA_win"].to_numpy())
+            np.save(
+                Path(data_dir) / "dates.npy", dates.to_numpy(dtype="datetime64[ns]")
+            )
+
+            # Workers are spawned rather than forked from a possibly threaded parent;
+            # they only need the memory-mapped arrays.
+            with ProcessPoolExecutor(
+                max_workers=self.n_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(data_dir,),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _run_step,
+                        self.model_name,
+                        self.params,
+                        train_stop,
+                        test_rows,
+                        self.random_seed,
+                    )
+                    for _, _, train_stop, test_rows in steps
+                ]
+                probas = [future.result() for future in futures]
+
+        parts = []
+        for (step_start, step_end, train_stop, test_rows), proba in zip(steps, probas):
+            part = features.loc[test_rows, ["date", "league", "teamA_win"]]
+            part.insert(0, "step", step_start.date())
+            part["n_train"] = train_stop
+            part["teamA_win_probability"] = proba
+            parts.append(part)
+        predictions = pd.concat(parts, ignore_index=True)
+
+        by_step = self.summarize(predictions, "step")
+        by_step["n_train"] = by_step["step"].map(
+            predictions.groupby("step")["n_train"].first()
+        )
+        by_league = self.summarize(predictions, "league")
+        by_league_step = self.summarize(predictions, ["league", "step"])
+
+        return predictions, by_step, by_league, by_league_step
+
+    @staticmethod
+    def summarize(predictions: pd.DataFrame, by) -> pd.DataFrame:
+        """
+        Computes accuracy, log-loss and AUC of the predictions per group. Grouping by a
+        single column adds an 'all' row; grouping by a list of columns does not.
+        """
+        keys = [by] if isinstance(by, str) else list(by)
+        rows = []
+        for key, group in predictions.groupby(keys, sort=True):
+            metrics = classification_metrics(
+                group["teamA_win"], group["teamA_win_probability"]
+            )
+            rows.append({**dict(zip(keys, key)), **metrics})
+        if isinstance(by, str):
+            metrics = classification_metrics(
+                predictions["teamA_win"], predictions["teamA_win_probability"]
+            )
+            rows.append({by: "all", **metrics})
+        return pd.DataFrame(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Walk-forward backtest over the merged match history."
+    )
+    parser.add_argument(
+        "model", nargs="?", default="random_forest", help="Model of search.MODEL_SPECS"
+    )
+    parser.add_argument(
+        "--params", type=json.loads, default=None, help="Model hyperparameters as JSON"
+    )
+    parser.add_argument(
+        "--start",
+        type=str,
+        default=None,
+        help="First day to score (default: start of the last season)",
+    )
+    parser.add_argument(
+        "--step-days", type=int, default=7, help="Length of a step in days"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: all cores)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default=None,
+        help="Output directory (default: data/backtest)",
+    )
+    args = parser.parse_args()
+
+    backtest = WalkForwardBacktest(
+        args.model,
+        params=args.params,
+        start=args.start,
+        step_days=args.step_days,
+        n_workers=args.workers,
+    )
+    predictions, by_step, by_league, by_league_step = backtest.run()
+
+    output = (
+        Path(args.output) if args.output else backtest.base_dir / "data" / "backtest"
+    )
+    output.mkdir(parents=True, exist_ok=True)
+    predictions.to_csv(output / "predictions.csv", index=False)
+    by_step.to_csv(output / "by_step.csv", index=False)
+    by_league.to_csv(output / "by_league.csv", index=False)
+    by_league_step.to_csv(output / "by_league_step.csv", index=False)
+
+    print(by_league.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
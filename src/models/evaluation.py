@@ -0,0 +1,75 @@
+import numpy as np
+import sklearn.metrics as metrics
+
+
+def youden_threshold(y_true, y_proba):
+    """
+    Finds the classification threshold that maximizes Youden's J statistic (TPR - FPR).
+
+    Args:
+        y_true (array-like): Ground truth (correct) target values.
+        y_proba (array-like): Predicted probabilities for the positive class.
+
+    Returns:
+        float: The optimal threshold, usable as LoLPredictor(threshold=...).
+    """
+    fpr, tpr, thresholds = metrics.roc_curve(y_true, y_proba)
+    return float(thresholds[np.argmax(tpr - fpr)])
+
+
+def classification_metrics(y_true, y_proba, threshold=0.5) -> dict:
+    """
+    Computes accuracy, log-loss and AUC of predicted win probabilities.
+
+    Args:
+        y_true (array-like): Ground truth (correct) target values.
+        y_proba (array-like): Predicted probabilities for the positive class.
+        threshold (float): Probability from which a prediction counts as positive.
+
+    Returns:
+        dict: 'n', 'accuracy', 'log_loss' and 'auc'; AUC is NaN when only one class is
+              present.
+    """
+    y_true = np.asarray(y_true)
+    y_proba = np.asarray(y_proba, dtype=float)
+
+    auc = np.nan
+    if len(np.unique(y_true)) == 2:
+        auc = metrics.roc_auc_score(y_true, y_proba)
+
+    return {
+        "n": len(y_true),
+        "accuracy": metrics.accuracy_score(y_true, y_proba >= threshold),
+        "log_loss": metrics.log_loss(y_true, y_proba, labels=[0, 1]),
+        "auc": auc,
+    }
+
+
+def population_stability_index(reference, current, bins=10, eps=1e-4):
+    """
+    Measures how far the distribution of a feature has shifted. Values below 0.1
+    are usually read as stable and values above 0.2 as a significant shift.
+
+    Args:
+        reference (array-like): Values the model was trained on.
+        current (array-like): Newly arrived values.
+        bins (int): Number of quantile bins of the reference distribution.
+        eps (float): Floor for empty bins.
+
+    Returns:
+        float: The population stability index.
+    """
+    reference = np.asarray(reference, dtype=float)
+    current = np.asarray(current, dtype=float)
+
+    edges = np.unique(np.quantile(reference, np.linspace(0, 1, bins + 1)[1:-1]))
+    ref_share = np.bincount(
+        np.searchsorted(edges, reference, side="right"), minlength=len(edges) + 1
+    )
+    cur_share = np.bincount(
+        np.searchsorted(edges, current, side="right"), minlength=len(edges) + 1
+    )
+
+    ref_share = np.maximum(ref_share / len(reference), eps)
+    cur_share = np.maximum(cur_share / len(current), eps)
+    return float(np.sum((cur_share - ref_share) * np.log(cur_share / ref_share)))
@@ -0,0 +1,181 @@
+import json
+from pathlib import Path
+
+import numpy as np
+
+
+class NumpyForest:
+    """
+    A dependency-light random forest evaluator.
+    The trees of a fitted scikit-learn forest are flattened into a few NumPy arrays
+    (split feature, threshold, children, leaf probabilities) that can be memory-mapped
+    from disk, and all rows are walked through all trees at once, one level per step.
+    """
+
+    arrays = ["feature", "threshold", "left", "right", "missing_left", "value", "roots"]
+
+    def __init__(
+        self, feature, threshold, left, right, missing_left, value, roots, meta
+    ):
+        """
+        Initializes the evaluator from flattened tree arrays.
+
+        Args:
+            feature (np.ndarray): Split feature of every node (0 for leaves).
+            threshold (np.ndarray): Split threshold of every node; rows go left if
+                                    value <= threshold.
+            left (np.ndarray): Global index of the left child (the node itself for
+                               leaves).
+            right (np.ndarray): Global index of the right child (the node itself for
+                                leaves).
+            missing_left (np.ndarray): Whether missing values go to the left child.
+            value (np.ndarray): Class probabilities of every node,
+                                shape (n_nodes, n_classes).
+            roots (np.ndarray): Index of the root node of every tree.
+            meta (dict): 'classes', 'feature_names' and 'max_depth' of the forest.
+        """
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.missing_left = missing_left
+        self.value = value
+        self.roots = roots
+        self.meta = meta
+
+        self.classes_ = np.asarray(meta["classes"])
+        self.feature_names_in_ = np.asarray(meta["feature_names"], dtype=object)
+        self.max_depth = meta["max_depth"]
+
+    @classmethod
+    def from_sklearn(cls, model):
+        """
+        Flattens a fitted RandomForestClassifier into global node arrays.
+
+        Args:
+            model (RandomForestClassifier): A fitted single-output forest.
+
+        Returns:
+            NumpyForest: The equivalent evaluator.
+        """
+        feature, threshold, left, right, missing_left, value, roots = (
+            [] for _ in range(7)
+        )
+        offset = 0
+
+        for estimator in model.estimators_:
+            tree = estimator.tree_
+            nodes = np.arange(tree.node_count)
+            is_leaf = tree.children_left < 0
+
+            roots.append(offset)
+            feature.append(np.where(is_leaf, 0, tree.feature))
+            threshold.append(tree.threshold)
+            left.append(np.where(is_leaf, nodes, tree.children_left) + offset)
+            right.append(np.where(is_leaf, nodes, tree.children_right) + offset)
+            missing_left.append(
+                np.asarray(
+                    getattr(tree, "missing_go_to_left", np.zeros(tree.node_count)),
+                    dtype=bool,
+                )
+            )
+
+            # Recent scikit-learn versions store class fractions, older ones counts.
+            proba = tree.value[:, 0, :].astype(float)
+            normalizer = proba.sum(axis=1, keepdims=True)
+            if not np.allclose(normalizer, 1.0):
+                normalizer[normalizer == 0.0] = 1.0
+                proba = proba / normalizer
+            value.append(proba)
+
+            offset += tree.node_count
+
+        names = getattr(model, "feature_names_in_", None)
+        if names is None:
+            names = [f"x{i}" for i in range(model.n_features_in_)]
+
+        meta = {
+            "classes": np.asarray(model.classes_).tolist(),
+            "feature_names": list(names),
+            "max_depth": int(max(e.tree_.max_depth for e in model.estimators_)),
+        }
+        return cls(
+            np.concatenate(feature).astype(np.int32),
+            np.concatenate(threshold).astype(np.float64),
+            np.concatenate(left).astype(np.int32),
+            np.concatenate(right).astype(np.int32),
+            np.concatenate(missing_left),
+            np.concatenate(value),
+            np.asarray(roots, dtype=np.int32),
+            meta,
+        )
+
+    def save(self, path):
+        """
+        Writes the arrays as .npy files and the metadata as meta.json into a directory.
+
+        Args:
+            path (str | Path): Target directory, created if missing.
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        for name in self.arrays:
+            np.save(path / f"{name}.npy", getattr(self, name))
+        with open(path / "meta.json", "w", encoding="utf-8") as f:
+            json.dump(self.meta, f, indent=2)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Loads an exported forest, memory-mapping its arrays by default.
+
+        Args:
+            path (str | Path): Directory written by save().
+            mmap (bool): Whether to memory-map the arrays instead of reading them.
+
+        Returns:
+            NumpyForest: The loaded evaluator.
+        """
+        path = Path(path)
+        with open(path / "meta.json", encoding="utf-8") as f:
+            meta = json.load(f)
+        mmap_mode = "r" if mmap else None
+        arrays = [
+            np.load(path / f"{name}.npy", mmap_mode=mmap_mode) for name in cls.arrays
+        ]
+        return cls(*arrays, meta)
+
+    def predict_proba(self, X):
+        """
+        Averages the leaf probabilities of all trees, like
+        RandomForestClassifier.predict_proba.
+
+        Args:
+            X (pd.DataFrame | np.ndarray): Features in feature_names_in_ order.
+
+        Returns:
+            np.ndarray: Class probabilities of shape (n_samples, n_classes).
+        """
+        # scikit-learn trees compare float32 inputs against float64 thresholds.
+        X = np.asarray(X, dtype=np.float32)
+        rows = np.arange(X.shape[0])[:, None]
+        nodes = np.broadcast_to(self.roots, (X.shape[0], len(self.roots)))
+
+        for _ in range(self.max_depth):
+            x = X[rows, self.feature[nodes]]
+            go_left = (x <= self.threshold[nodes]) | (
+                np.isnan(x) & self.missing_left[nodes]
+            )
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+
+        proba = np.zeros((X.shape[0], self.value.shape[1]))
+        for t in range(len(self.roots)):
+            proba += self.value[nodes[:, t]]
+        proba /= len(self.roots)
+        return proba
+
+    def predict(self, X):
+        """
+        Predicts the most probable class of every row.
+        """
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
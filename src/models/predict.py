@@ -1,6 +1,12 @@
 from pathlib import Path
 import pickle
 
+import numpy as np
+
+from src.data.feature_kernel import LoLFeatureKernel
+from src.models.numpy_forest import NumpyForest
+from src.models.registry import ModelRegistry
+
 
 class LoLPredictor:
     """
@@ -8,23 +14,104 @@ class LoLPredictor:
     winner predictions on processed League of Legends match data.
     """
 
-    def __init__(self, model_name="random_forest.pkl"):
+    def __init__(
+        self, model_name="random_forest.pkl", threshold=None, model=None, metadata=None
+    ):
         """
         Initializes the predictor by loading the saved model from a file.
 
         Args:
             model_name (str): The filename of the pickled model.
+            threshold (float): Probability of a Team A win from which the label is 1,
+                               e.g. the Youden-optimal threshold from
+                               training_utils.print_metrics. Defaults to the threshold
+                               registered with the model (from metadata, or the forest's
+                               meta.json); if there is none, the label follows the
+                               model's own decision rule.
+            model: An already loaded model (e.g., from ModelRegistry), used instead of
+                   the file.
+            metadata (dict): Registry metadata of the model, if any.
         """
         self.model_path = Path(__file__).parent / model_name
-        self.model = self._load_model()
+        self.metadata = metadata or {}
+        self.model = model if model is not None else self._load_model()
+        self._check_feature_kernel()
+
+        if threshold is None:
+            threshold = self.metadata.get("threshold")
+        if threshold is None:
+            threshold = getattr(self.model, "meta", {}).get("threshold")
+        self.threshold = threshold
+
+    @classmethod
+    def from_registry(cls, name, version=None, registry=None, threshold=None):
+        """
+        Creates a predictor for a registered model, loaded lazily by the registry.
+
+        Args:
+            name (str): Model name in the registry.
+            version (str): Model version, defaults to the latest one.
+            registry (ModelRegistry): Registry to use, defaults to data/registry.
+            threshold (float): Decision threshold, defaults to the one stored with the
+                               model.
+
+        Returns:
+            LoLPredictor: The predictor.
+        """
+        registry = registry or ModelRegistry()
+        metadata = registry.metadata(name, version)
+
+        return cls(
+            model_name=str(
+                registry.root / name / metadata["version"] / registry.model_file
+            ),
+            threshold=threshold,
+            model=registry.load(name, metadata["version"]),
+            metadata=metadata,
+        )
 
     def _load_model(self):
         """
-        Internal method to safely load the pickle file.
+        Internal method to load the model. The NumPy export of the forest is
+        memory-mapped when it exists next to the pickle, which avoids importing
+        scikit-learn; otherwise the pickle file is loaded.
         """
+        arrays_path = self.model_path.with_suffix("")
+        if (arrays_path / "meta.json").exists():
+            return NumpyForest.load(arrays_path)
+
         with open(self.model_path, "rb") as f:
             return pickle.load(f)
 
+    def _check_feature_kernel(self):
+        """
+        Rejects models trained on another version of the feature kernel, whose
+        features would be silently misaligned. The version is read from the registry
+        metadata or the forest's meta.json; plain pickles carry none and are not
+        checked.
+
+        Raises:
+            ValueError: If the recorded version differs from the current kernel.
+        """
+        version = self.metadata.get("feature_kernel_version")
+        if version is None:
+            version = getattr(self.model, "meta", {}).get("feature_kernel_version")
+        if version is not None and version != LoLFeatureKernel.version:
+            raise ValueError(
+                f"Model was trained with feature kernel version {version}, "
+                f"but the current version is {LoLFeatureKernel.version}; retrain it."
+            )
+
+    def _select_features(self, processed_df):
+        """
+        Orders the columns as the model expects. Frames built by the shared
+        feature kernel already match and are passed through unchanged.
+        """
+        names = getattr(self.model, "feature_names_in_", None)
+        if names is None or list(processed_df.columns) == list(names):
+            return processed_df
+        return processed_df[names]
+
     def predict_winner_probability(self, processed_df):
         """
         Predicts the probability of victory for the competing teams.
@@ -36,8 +123,7 @@ class LoLPredictor:
         Returns:
             np.ndarray: An array of probabilities for each class (e.g., [Loss, Win]).
         """
-        if hasattr(self.model, "feature_names_in_"):
-            processed_df = processed_df[self.model.feature_names_in_]
+        processed_df = self._select_features(processed_df)
         return self.model.predict_proba(processed_df)
 
     def predict_winner(self, processed_df):
@@ -50,6 +136,26 @@ class LoLPredictor:
         Returns:
             np.ndarray: An array of binary predictions (1 = Team A wins, 0 = Team B wins).
         """
-        if hasattr(self.model, "feature_names_in_"):
-            processed_df = processed_df[self.model.feature_names_in_]
+        processed_df = self._select_features(processed_df)
         return self.model.predict(processed_df)
+
+    def predict_with_probability(self, processed_df):
+        """
+        Predicts both the winner and the probabilities with a single pass of the model.
+
+        Args:
+            processed_df (pd.DataFrame): Data containing comparative features.
+
+        Returns:
+            tuple: (labels, probabilities) where labels is an array of binary
+                   predictions (1 = Team A wins) and probabilities the output of
+                   predict_winner_probability.
+        """
+        probability = self.predict_winner_probability(processed_df)
+
+        if self.threshold is None:
+            labels = self.model.classes_[np.argmax(probability, axis=1)]
+        else:
+            labels = (probability[:, 1] >= self.threshold).astype(int)
+
+        return labels, probability
@@ -1,9 +1,22 @@
+import argparse
+import os
 from pathlib import Path
 import pickle
+import shutil
 
+import numpy as np
 import pandas as pd
 from sklearn.ensemble import RandomForestClassifier
 
+from src.data.feature_kernel import LoLFeatureKernel
+from src.models.evaluation import (
+    classification_metrics,
+    population_stability_index,
+    youden_threshold,
+)
+from src.models.numpy_forest import NumpyForest
+from src.models.registry import ModelRegistry
+
 
 class RF:
     """
@@ -18,6 +31,11 @@ class RF:
         self.base_dir = Path(__file__).resolve().parents[2]
         self.data_path = self.base_dir / "data" / "featured"
         self.model_path = Path(__file__).parent / "random_forest.pkl"
+        self.arrays_path = self.model_path.with_suffix("")
+        self.registry = ModelRegistry()
+        self.registry_name = "random_forest"
+        self.dates = None
+        self.validation = None
         self.model = RandomForestClassifier(
             n_estimators=40,
             max_depth=8,
@@ -29,6 +47,7 @@ class RF:
     def load_and_prepare_data(self):
         """
         Loads training and validation datasets, merges them, and calculates time-based sample weights.
+        The validation set is also kept in self.validation to evaluate the fitted model.
 
         Returns:
             tuple: (X, y, sample_weight) where X is the feature set, y is the target,
@@ -42,26 +61,219 @@ class RF:
         ydata = data["teamA_win"]
 
         Xdata["date"] = pd.to_datetime(Xdata["date"])
+        self.dates = Xdata["date"]
 
         min_date = Xdata["date"].min()
         max_date = Xdata["date"].max()
         sample_weight = (Xdata["date"] - min_date) / (max_date - min_date)
 
         Xdata = Xdata.drop(columns=["date"])
+        self.validation = (Xdata.iloc[len(train) :], ydata.iloc[len(train) :])
 
         return Xdata, ydata, sample_weight
 
+    def _save(self, seen_dates, refresh):
+        """
+        Exports the model as a pickle file and as NumPy arrays, and registers it
+        together with every match date it has been trained on, its metrics on the
+        validation set and the Youden threshold on it. The final model is also fitted
+        on the validation matches, so these metrics are optimistic.
+
+        Args:
+            seen_dates (list): Match days (YYYY-MM-DD) the model has seen.
+            refresh (dict): How the model was obtained (mode and drift statistics).
+        """
+        # Both artifacts are written next to the current ones and only swapped in
+        # once they are complete, so a failed export never breaks the served model.
+        Xval, yval = self.validation
+        proba = self.model.predict_proba(Xval)[:, 1]
+        threshold = youden_threshold(yval, proba) if yval.nunique() == 2 else None
+
+        # The threshold is also exported with the arrays, so the default LoLPredictor
+        # (and with it the app and the batch CLI) applies the registered threshold.
+        forest = NumpyForest.from_sklearn(self.model)
+        forest.meta["feature_kernel_version"] = LoLFeatureKernel.version
+        forest.meta["threshold"] = threshold
+        tmp_model = self.model_path.with_name(f".{self.model_path.name}.tmp")
+        tmp_arrays = self.arrays_path.with_name(f".{self.arrays_path.name}.tmp")
+        old_arrays = self.arrays_path.with_name(f".{self.arrays_path.name}.old")
+        shutil.rmtree(tmp_arrays, ignore_errors=True)
+        shutil.rmtree(old_arrays, ignore_errors=True)
+
+        with open(tmp_model, "wb") as f:
+            pickle.dump(self.model, f)
+        forest.save(tmp_arrays)
+
+        if self.arrays_path.exists():
+            os.replace(self.arrays_path, old_arrays)
+        os.replace(tmp_arrays, self.arrays_path)
+        os.replace(tmp_model, self.model_path)
+        shutil.rmtree(old_arrays, ignore_errors=True)
+
+        seen_dates = sorted(seen_dates)
+        self.registry.register(
+            self.model,
+            self.registry_name,
+            train_dates=(seen_dates[0], seen_dates[-1]),
+            metrics=classification_metrics(
+                yval, proba, 0.5 if threshold is None else threshold
+            ),
+            threshold=threshold,
+            extra={
+                "params": self.model.get_params(),
+                "seen_dates": seen_dates,
+                "refresh": refresh,
+            },
+        )
+
     def train_and_save(self):
         """
-        Executes the full workflow: loading data, training the model, and exporting the result as a pickle file.
+        Executes the full workflow: loading data, training the model, and exporting the
+        result as a pickle file and as flattened NumPy arrays for NumpyForest. The model
+        is also stored as a new version of "random_forest" in the model registry.
         """
         Xdata, ydata, sample_weight = self.load_and_prepare_data()
         self.model.fit(Xdata, ydata, sample_weight=sample_weight)
 
-        with open(self.model_path, "wb") as f:
-            pickle.dump(self.model, f)
+        seen_dates = self.dates.dt.strftime("%Y-%m-%d").unique().tolist()
+        self._save(seen_dates, {"mode": "full"})
+
+    def refresh(
+        self,
+        n_new_trees=10,
+        max_trees=200,
+        psi_threshold=0.2,
+        min_drift_rows=100,
+        min_new_rows=100,
+    ):
+        """
+        Updates the latest registered model with matches it has not seen yet.
+        By default, n_new_trees trees are fitted on the new matches only, with the same
+        date weights as a full fit, and added to the forest (warm start). Each added
+        tree votes like one fitted on the whole history, so nothing is done until at
+        least min_new_rows new rows have arrived; the matches stay unseen until then.
+        The model is refitted from scratch, like in train_and_save, when the features of
+        the new matches drift away from the seen ones (median population stability index
+        over the features above psi_threshold), when the forest would grow beyond
+        max_trees, or when the new matches hold a single class, since trees fitted on
+        them would not share the forest's classes. Drift is only measured once at least
+        min_drift_rows new rows have arrived, since the index is unreliable on a handful
+        of matches.
+
+        Args:
+            n_new_trees (int): Number of trees added by a warm-start refresh.
+            max_trees (int): Forest size above which the model is refitted instead.
+            psi_threshold (float): Feature drift above which the model is refitted
+                                   instead.
+            min_drift_rows (int): Number of new rows from which drift is measured.
+            min_new_rows (int): Number of new rows needed for a refresh.
+
+        Returns:
+            str: "none" if there were not enough new matches, "warm_start" or "full".
+        """
+        try:
+            metadata = self.registry.metadata(self.registry_name)
+        except KeyError:
+            metadata = {}
+        if not metadata.get("seen_dates"):
+            print(
+                "No registered model with recorded match dates, training from scratch."
+            )
+            self.train_and_save()
+            return "full"
+
+        Xdata, ydata, sample_weight = self.load_and_prepare_data()
+        days = self.dates.dt.strftime("%Y-%m-%d")
+        new = ~days.isin(metadata["seen_dates"]).to_numpy()
+        if not new.any():
+            print("No new matches since the last refresh.")
+            return "none"
+        if new.sum() < min_new_rows:
+            print(
+                f"Only {int(new.sum())} new rows, "
+                f"waiting for {min_new_rows} to refresh."
+            )
+            return "none"
+
+        psi = None
+        if new.sum() >= min_drift_rows:
+            psi = float(
+                np.median(
+                    [
+                        population_stability_index(
+                            Xdata.loc[~new, c], Xdata.loc[new, c]
+                        )
+                        for c in Xdata.columns
+                    ]
+                )
+            )
+
+        with open(
+            self.registry.model_path(self.registry_name, metadata["version"]), "rb"
+        ) as f:
+            model = pickle.load(f)
+
+        drifted = psi is not None and psi > psi_threshold
+        one_class = ydata[new].nunique() < len(model.classes_)
+        if drifted or one_class or model.n_estimators + n_new_trees > max_trees:
+            mode = "full"
+            self.model.fit(Xdata, ydata, sample_weight=sample_weight)
+        else:
+            mode = "warm_start"
+            model.set_params(
+                warm_start=True, n_estimators=model.n_estimators + n_new_trees
+            )
+            model.fit(Xdata[new], ydata[new], sample_weight=sample_weight[new])
+            model.set_params(warm_start=False)
+            self.model = model
+
+        new_dates = sorted(days[new].unique())
+        print(
+            f"Refresh ({mode}): {int(new.sum())} new rows from {len(new_dates)} days, "
+            f"median PSI {psi}."
+        )
+
+        seen_dates = metadata["seen_dates"] if mode == "warm_start" else []
+        self._save(
+            set(seen_dates) | set(days.unique()),
+            {
+                "mode": mode,
+                "base_version": metadata["version"],
+                "new_dates": new_dates,
+                "new_rows": int(new.sum()),
+                "median_psi": psi,
+            },
+        )
+        return mode
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the random forest model.")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Update the latest model with new matches only",
+    )
+    parser.add_argument(
+        "--new-trees", type=int, default=10, help="Trees added by a warm-start refresh"
+    )
+    parser.add_argument(
+        "--psi-threshold",
+        type=float,
+        default=0.2,
+        help="Median feature PSI that forces a full refit",
+    )
+    parser.add_argument(
+        "--min-new-rows", type=int, default=100, help="New rows needed before a refresh"
+    )
+    args = parser.parse_args()
+
     rf = RF()
-    rf.train_and_save()
+    if args.refresh:
+        rf.refresh(
+            n_new_trees=args.new_trees,
+            psi_threshold=args.psi_threshold,
+            min_new_rows=args.min_new_rows,
+        )
+    else:
+        rf.train_and_save()
@@ -0,0 +1,217 @@
+from collections import OrderedDict
+from datetime import datetime, timezone
+import json
+import os
+from pathlib import Path
+import pickle
+import tempfile
+import threading
+
+from src.data.feature_kernel import LoLFeatureKernel
+from src.models.numpy_forest import NumpyForest
+
+
+class ModelRegistry:
+    """
+    A directory of versioned model artifacts.
+
+    Every version lives in <root>/<name>/<version>/ and holds the pickled model
+    (plus a NumPy export for random forests) and a metadata.json with the feature
+    list, feature kernel version, training date range, validation metrics and
+    decision threshold.
+    Models are loaded lazily on first use and kept in a bounded LRU cache,
+    so several models can be served side by side from one process.
+    """
+
+    metadata_file = "metadata.json"
+    model_file = "model.pkl"
+    forest_dir = "forest"
+
+    def __init__(self, root=None, cache_size=4):
+        """
+        Initializes the registry.
+
+        Args:
+            root (str | Path): Registry directory, defaults to data/registry.
+            cache_size (int): Maximum number of models kept in memory.
+        """
+        self.root = (
+            Path(root)
+            if root
+            else Path(__file__).resolve().parents[2] / "data" / "registry"
+        )
+        self.cache_size = cache_size
+        self._models = OrderedDict()
+        self._lock = threading.Lock()
+
+    def names(self) -> list:
+        """
+        Returns the names of all registered models.
+        """
+        if not self.root.exists():
+            return []
+        return sorted(p.name for p in self.root.iterdir() if p.is_dir())
+
+    def versions(self, name: str) -> list:
+        """
+        Returns the versions of a model, oldest first.
+        """
+        model_dir = self.root / name
+        if not model_dir.exists():
+            return []
+        versions = [
+            p.name
+            for p in self._version_dirs(model_dir)
+            if (p / self.metadata_file).exists()
+        ]
+        return sorted(versions, key=lambda v: (len(v), v))
+
+    @staticmethod
+    def _version_dirs(model_dir: Path) -> list:
+        """
+        Returns the version directories of a model, including half-written ones.
+        """
+        return [
+            p
+            for p in model_dir.iterdir()
+            if p.is_dir() and p.name.startswith("v") and p.name[1:].isdigit()
+        ]
+
+    def _resolve(self, name: str, version=None) -> str:
+        """
+        Returns the requested version, or the latest one if none is given.
+
+        Raises:
+            KeyError: If the model or the version is not registered.
+        """
+        versions = self.versions(name)
+        if not versions:
+            raise KeyError(f"Model '{name}' is not registered.")
+        if version is None:
+            return versions[-1]
+        if version not in versions:
+            raise KeyError(f"Model '{name}' has no version '{version}'.")
+        return version
+
+    def model_path(self, name: str, version=None) -> Path:
+        """
+        Returns the path of the pickled model of a version, e.g. to keep training it.
+        """
+        return self.root / name / self._resolve(name, version) / self.model_file
+
+    def metadata(self, name: str, version=None) -> dict:
+        """
+        Reads the metadata of a model version without loading the model.
+
+        Args:
+            name (str): Model name.
+            version (str): Model version, defaults to the latest one.
+
+        Returns:
+            dict: The stored metadata, including 'name' and 'version'.
+        """
+        version = self._resolve(name, version)
+        with open(
+            self.root / name / version / self.metadata_file, encoding="utf-8"
+        ) as f:
+            return json.load(f)
+
+    def register(
+        self,
+        model,
+        name: str,
+        feature_names=None,
+        train_dates=None,
+        metrics=None,
+        threshold=None,
+        extra=None,
+    ) -> str:
+        """
+        Stores a fitted model as the next version of a name.
+
+        Args:
+            model: A fitted estimator with predict_proba.
+            name (str): Model name (e.g., "random_forest", "xgboost").
+            feature_names (list): Features in the order the model expects,
+                                  defaults to the model's feature_names_in_.
+            train_dates (tuple): First and last match date seen during training.
+            metrics (dict): Validation metrics (e.g., accuracy, log_loss, auc).
+            threshold (float): Decision threshold for the positive class.
+            extra (dict): Any additional metadata to store.
+
+        Returns:
+            str: The new version (e.g., "v3").
+        """
+        model_dir = self.root / name
+        model_dir.mkdir(parents=True, exist_ok=True)
+        # Everything is written to a hidden directory that is renamed into place
+        # once complete, so a crash never leaves a version without metadata.
+        version_dir = Path(tempfile.mkdtemp(prefix=".tmp-", dir=model_dir))
+
+        if feature_names is None:
+            feature_names = getattr(model, "feature_names_in_", [])
+
+        with open(version_dir / self.model_file, "wb") as f:
+            pickle.dump(model, f)
+
+        if type(model).__name__ == "RandomForestClassifier":
+            NumpyForest.from_sklearn(model).save(version_dir / self.forest_dir)
+
+        metadata = {
+            "name": name,
+            "model_class": type(model).__name__,
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "feature_names": [str(c) for c in feature_names],
+            "feature_kernel_version": LoLFeatureKernel.version,
+            "train_dates": [str(d) for d in train_dates] if train_dates else None,
+            "metrics": {k: float(v) for k, v in (metrics or {}).items()},
+            "threshold": None if threshold is None else float(threshold),
+        }
+        metadata.update(extra or {})
+
+        # Directories left behind by older crashes still hold their number.
+        taken = [int(p.name[1:]) for p in self._version_dirs(model_dir)]
+        number = max(taken, default=0) + 1
+        while True:
+            version = f"v{number}"
+            metadata["version"] = version
+            with open(version_dir / self.metadata_file, "w", encoding="utf-8") as f:
+                json.dump(metadata, f, indent=2)
+            try:
+                os.rename(version_dir, model_dir / version)
+            except OSError:
+                # Taken by a concurrent register() since the directory scan.
+                number += 1
+                continue
+            return version
+
+    def _load(self, name: str, version: str):
+        version_dir = self.root / name / version
+        if (version_dir / self.forest_dir / "meta.json").exists():
+            return NumpyForest.load(version_dir / self.forest_dir)
+        with open(version_dir / self.model_file, "rb") as f:
+            return pickle.load(f)
+
+    def load(self, name: str, version=None):
+        """
+        Returns a model version, loading it on first use.
+
+        Args:
+            name (str): Model name.
+            version (str): Model version, defaults to the latest one.
+
+        Returns:
+            object: The model, with predict_proba and classes_.
+        """
+        key = (name, self._resolve(name, version))
+
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                return self._models[key]
+
+            model = self._load(*key)
+            self._models[key] = model
+            if len(self._models) > self.cache_size:
+                self._models.popitem(last=False)
+            return model
@@ -0,0 +1,448 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import json
+import multiprocessing
+import os
+from pathlib import Path
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import AdaBoostClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import ParameterGrid
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.tree import DecisionTreeClassifier
+
+from src.models.evaluation import classification_metrics, youden_threshold
+from src.models.registry import ModelRegistry
+
+
+def _build_random_forest(params, random_seed, n_jobs=1):
+    return RandomForestClassifier(random_state=random_seed, n_jobs=n_jobs, **params)
+
+
+def _build_decision_tree(params, random_seed, n_jobs=1):
+    return DecisionTreeClassifier(random_state=random_seed, **params)
+
+
+def _build_adaboost(params, random_seed, n_jobs=1):
+    return AdaBoostClassifier(
+        estimator=DecisionTreeClassifier(max_depth=params["max_depth"]),
+        random_state=random_seed,
+        n_estimators=params["n_estimators"],
+        learning_rate=params["learning_rate"],
+    )
+
+
+def _build_logistic_regression(params, random_seed, n_jobs=1):
+    return make_pipeline(
+        StandardScaler(), LogisticRegression(random_state=random_seed, **params)
+    )
+
+
+def _build_xgboost(params, random_seed, n_jobs=1):
+    from xgboost import XGBClassifier
+
+    return XGBClassifier(random_state=random_seed, n_jobs=n_jobs, **params)
+
+
+# The common interface of all searchable models: a builder, the grid from the
+# training notebooks, the name of the sample-weight fit argument and the
+# smallest allowed sample weight.
+MODEL_SPECS = {
+    "random_forest": {
+        "build": _build_random_forest,
+        "grid": {
+            "n_estimators": list(range(10, 101, 10)),
+            "max_depth": list(range(3, 9)),
+            "min_samples_split": list(range(2, 8)),
+            "min_samples_leaf": list(range(1, 4)),
+        },
+        "weight_param": "sample_weight",
+        "min_weight": 0.0,
+    },
+    "decision_tree": {
+        "build": _build_decision_tree,
+        "grid": {
+            "max_depth": list(range(1, 11)),
+            "min_samples_split": list(range(2, 7)),
+            "min_samples_leaf": list(range(1, 5)),
+        },
+        "weight_param": "sample_weight",
+        "min_weight": 0.0,
+    },
+    "adaboost": {
+        "build": _build_adaboost,
+        "grid": {
+            "n_estimators": list(range(10, 101, 20)),
+            "learning_rate": [0.05, 0.1],
+            "max_depth": [3, 5],
+        },
+        "weight_param": "sample_weight",
+        "min_weight": 1e-6,
+    },
+    "logistic_regression": {
+        "build": _build_logistic_regression,
+        "grid": {
+            "C": [0.01, 0.1, 1, 10, 100],
+            "solver": ["lbfgs", "liblinear", "newton-cg"],
+        },
+        "weight_param": "logisticregression__sample_weight",
+        "min_weight": 0.0,
+    },
+    "xgboost": {
+        "build": _build_xgboost,
+        "grid": {
+            "n_estimators": list(range(50, 301, 50)),
+            "max_depth": list(range(3, 8)),
+            "learning_rate": [0.01, 0.05, 0.1],
+        },
+        "weight_param": "sample_weight",
+        "min_weight": 0.0,
+    },
+}
+
+
+def date_weights(dates: np.ndarray, min_weight=0.0) -> np.ndarray:
+    """
+    Computes the date-linear sample weights used for training: 0 for the oldest
+    match and 1 for the most recent one.
+
+    Args:
+        dates (np.ndarray): Match dates as datetime64 values.
+        min_weight (float): Lower bound for the weights.
+
+    Returns:
+        np.ndarray: One weight per match.
+    """
+    days = dates.astype("datetime64[ns]").astype(np.int64).astype(float)
+    span = days.max() - days.min()
+    weights = (days - days.min()) / span if span > 0 else np.ones(len(days))
+    return np.clip(weights, min_weight, 1.0)
+
+
+def fit_model(name, params, X, y, dates, random_seed=42, n_jobs=1):
+    """
+    Builds and fits one model of MODEL_SPECS with date-linear sample weights.
+
+    Args:
+        name (str): Key of MODEL_SPECS.
+        params (dict): Hyperparameters of the model.
+        X (np.ndarray): Feature matrix.
+        y (np.ndarray): Target.
+        dates (np.ndarray): Match date of every row.
+        random_seed (int): Seed of the model.
+        n_jobs (int): Parallelism of the model itself, where supported.
+
+    Returns:
+        object: The fitted model.
+    """
+    spec = MODEL_SPECS[name]
+    model = spec["build"](params, random_seed, n_jobs)
+    weights = date_weights(dates, spec["min_weight"])
+    model.fit(X, y, **{spec["weight_param"]: weights})
+    return model
+
+
+# Per-process state of the search workers, set by _init_worker.
+_worker = {}
+
+
+def _init_worker(data_dir, best_score):
+    _worker["X"] = np.load(Path(data_dir) / "X.npy", mmap_mode="r")
+    _worker["y"] = np.load(Path(data_dir) / "y.npy", mmap_mode="r")
+    _worker["dates"] = np.load(Path(data_dir) / "dates.npy", mmap_mode="r")
+    _worker["best_score"] = best_score
+
+
+def _evaluate(name, params, folds, random_seed, patience):
+    """
+    Evaluates one configuration on the time-ordered folds inside a worker.
+    After each fold, the configuration is stopped early if its mean accuracy so far
+    trails the best completed configuration by more than `patience`.
+
+    Returns:
+        dict: Leaderboard row, with the validation probabilities of completed
+              configurations.
+    """
+    X, y, dates = _worker["X"], _worker["y"], _worker["dates"]
+    best_score = _worker["best_score"]
+    start_time = time.perf_counter()
+
+    scores, probas = [], []
+    status = "complete"
+    for train_stop, val_stop in folds:
+        model = fit_model(
+            name,
+            params,
+            X[:train_stop],
+            y[:train_stop],
+            dates[:train_stop],
+            random_seed,
+        )
+        proba = model.predict_proba(X[train_stop:val_stop])[:, 1]
+        scores.append(classification_metrics(y[train_stop:val_stop], proba))
+        probas.append(proba)
+
+        mean_accuracy = np.mean([s["accuracy"] for s in scores])
+        if len(scores) < len(folds) and mean_accuracy < best_score.value - patience:
+            status = "pruned"
+            break
+
+    row = {
+        "model": name,
+        "params": json.dumps(params, sort_keys=True),
+        "status": status,
+        "folds": len(scores),
+        "accuracy": np.mean([s["accuracy"] for s in scores]),
+        "log_loss": np.mean([s["log_loss"] for s in scores]),
+        "auc": np.nanmean([s["auc"] for s in scores]),
+        "fit_seconds": time.perf_counter() - start_time,
+    }
+
+    if status == "complete":
+        with best_score.get_lock():
+            best_score.value = max(best_score.value, row["accuracy"])
+        row["proba"] = np.concatenate(probas)
+
+    return row
+
+
+class HyperparameterSearch:
+    """
+    Time-aware hyperparameter search over the models of MODEL_SPECS.
+
+    Matches are sorted by date and cut into expanding-window folds: every fold trains
+    on all matches before a cut and validates on the block that follows it, so no
+    configuration is scored on matches older than its training data. Configurations
+    are evaluated in a process pool whose workers memory-map one shared copy of the
+    design matrix. The winner is refitted on all matches and stored in the model
+    registry together with the leaderboard.
+    """
+
+    def __init__(
+        self,
+        model_name="random_forest",
+        n_folds=4,
+        n_iter=60,
+        patience=0.03,
+        n_workers=None,
+        random_seed=42,
+        registry=None,
+    ):
+        """
+        Initializes the search.
+
+        Args:
+            model_name (str): Key of MODEL_SPECS.
+            n_folds (int): Number of time-ordered validation blocks.
+            n_iter (int): Number of configurations sampled from the grid (all if None).
+            patience (float): Accuracy gap to the best configuration that stops
+                              a configuration early.
+            n_workers (int): Worker processes, defaults to all cores.
+            random_seed (int): Seed of the models and of the grid sampling.
+            registry (ModelRegistry): Registry for the winning model,
+                                      defaults to data/registry.
+        """
+        if model_name not in MODEL_SPECS:
+            raise ValueError(
+                f"Unknown model '{model_name}', expected one of {list(MODEL_SPECS)}."
+            )
+
+        self.model_name = model_name
+        self.n_folds = n_folds
+        self.n_iter = n_iter
+        self.patience = patience
+        self.n_workers = n_workers or os.cpu_count()
+        self.random_seed = random_seed
+        self.registry = registry or ModelRegistry()
+
+        self.base_dir = Path(__file__).resolve().parents[2]
+        self.data_path = self.base_dir / "data" / "featured"
+
+    def load_data(self):
+        """
+        Loads the training and validation features as one date-sorted dataset.
+
+        Returns:
+            tuple: (X, y, dates) where X is a DataFrame of features, y the target
+                   and dates the match dates as a datetime64 array.
+        """
+        train = pd.read_csv(self.data_path / "train.csv", sep=",")
+        val = pd.read_csv(self.data_path / "val.csv", sep=",")
+        data = pd.concat([train, val], ignore_index=True)
+
+        data["date"] = pd.to_datetime(data["date"])
+        data = data.sort_values("date", kind="stable").reset_index(drop=True)
+
+        X = data.drop(columns=["teamA_win", "date"])
+        return (
+            X,
+            data["teamA_win"].to_numpy(),
+            data["date"].to_numpy(dtype="datetime64[ns]"),
+        )
+
+    def make_folds(self, dates: np.ndarray) -> list:
+        """
+        Cuts date-sorted matches into expanding-window folds. Cuts fall between
+        match days, so one day never ends up on both sides of a cut.
+
+        Args:
+            dates (np.ndarray): Sorted match dates.
+
+        Returns:
+            list: (train_stop, val_stop) row positions of every fold.
+        """
+        days, first_rows = np.unique(dates, return_index=True)
+        targets = np.linspace(0, len(dates), self.n_folds + 2)[1:-1]
+        cuts = np.unique(
+            first_rows[np.clip(np.searchsorted(first_rows, targets), 0, len(days) - 1)]
+        )
+        stops = list(cuts[cuts > 0]) + [len(dates)]
+        return [(int(a), int(b)) for a, b in zip(stops[:-1], stops[1:])]
+
+    def candidates(self) -> list:
+        """
+        Returns the configurations to evaluate, a reproducible sample of the grid.
+        """
+        grid = list(ParameterGrid(MODEL_SPECS[self.model_name]["grid"]))
+        if self.n_iter is None or self.n_iter >= len(grid):
+            return grid
+        rng = np.random.default_rng(self.random_seed)
+        return [grid[i] for i in rng.choice(len(grid), size=self.n_iter, replace=False)]
+
+    def run(self) -> tuple:
+        """
+        Runs the search, refits the winner on all matches and registers it.
+
+        Returns:
+            tuple: (version, leaderboard) with the registered version of the winner
+                   and the leaderboard DataFrame.
+        """
+        X_df, y, dates = self.load_data()
+        folds = self.make_folds(dates)
+        configs = self.candidates()
+        print(
+            f"Evaluating {len(configs)} configurations on {len(folds)} folds "
+            f"with {self.n_workers} workers."
+        )
+
+        # Workers are spawned rather than forked from a possibly threaded parent; they
+        # only need the memory-mapped arrays and the shared best score.
+        ctx = multiprocessing.get_context("spawn")
+        best_score = ctx.Value("d", -np.inf)
+        rows = []
+
+        with tempfile.TemporaryDirectory() as data_dir:
+            np.save(Path(data_dir) / "X.npy", X_df.to_numpy(dtype=float))
+            np.save(Path(data_dir) / "y.npy", y)
+            np.save(Path(data_dir) / "dates.npy", dates)
+
+            with ProcessPoolExecutor(
+                max_workers=self.n_workers,
+                mp_context=ctx,
+                initializer=_init_worker,
+                initargs=(data_dir, best_score),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _evaluate,
+                        self.model_name,
+                        params,
+                        folds,
+                        self.random_seed,
+                        self.patience,
+                    )
+                    for params in configs
+                ]
+                for i, future in enumerate(as_completed(futures), 1):
+                    rows.append(future.result())
+                    if i % 10 == 0 or i == len(futures):
+                        print(f"{i}/{len(futures)} configurations evaluated.")
+
+        leaderboard = pd.DataFrame(rows)
+        leaderboard["complete"] = leaderboard["status"] == "complete"
+        leaderboard = leaderboard.sort_values(
+            ["complete", "accuracy", "log_loss"],
+            ascending=[False, False, True],
+            kind="stable",
+        ).reset_index(drop=True)
+        leaderboard.insert(0, "rank", np.arange(1, len(leaderboard) + 1))
+
+        best = leaderboard.iloc[0]
+        best_params = json.loads(best["params"])
+        oof_start = folds[0][0]
+        threshold = youden_threshold(y[oof_start:], best["proba"])
+
+        model = fit_model(
+            self.model_name, best_params, X_df, y, dates, self.random_seed, n_jobs=-1
+        )
+        if hasattr(model, "n_jobs"):
+            model.set_params(n_jobs=None)
+
+        version = self.registry.register(
+            model,
+            self.model_name,
+            feature_names=list(X_df.columns),
+            train_dates=(pd.Timestamp(dates[0]).date(), pd.Timestamp(dates[-1]).date()),
+            metrics={k: best[k] for k in ["accuracy", "log_loss", "auc"]},
+            threshold=threshold,
+            extra={
+                "params": best_params,
+                "search": {"folds": folds, "configs": len(configs)},
+            },
+        )
+
+        leaderboard = leaderboard.drop(columns=["complete", "proba"])
+        leaderboard.to_csv(
+            self.registry.root / self.model_name / version / "leaderboard.csv",
+            index=False,
+        )
+        return version, leaderboard
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time-aware hyperparameter search.")
+    parser.add_argument(
+        "model", nargs="?", default="random_forest", choices=list(MODEL_SPECS)
+    )
+    parser.add_argument(
+        "--folds", type=int, default=4, help="Number of time-ordered validation blocks"
+    )
+    parser.add_argument(
+        "--n-iter",
+        type=int,
+        default=60,
+        help="Configurations sampled from the grid (0 = all)",
+    )
+    parser.add_argument(
+        "--patience",
+        type=float,
+        default=0.03,
+        help="Accuracy gap that stops a configuration early",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: all cores)",
+    )
+    args = parser.parse_args()
+
+    search = HyperparameterSearch(
+        args.model,
+        n_folds=args.folds,
+        n_iter=args.n_iter or None,
+        patience=args.patience,
+        n_workers=args.workers,
+    )
+    version, leaderboard = search.run()
+    print(leaderboard.head(10).to_string(index=False))
+    print(f"Registered {args.model} {version}.")
+
+
+if __name__ == "__main__":
+    main()
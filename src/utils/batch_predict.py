@@ -0,0 +1,164 @@
+import argparse
+from contextlib import redirect_stdout
+from pathlib import Path
+import sys
+
+import numpy as np
+import pandas as pd
+
+from src.models.predict import LoLPredictor
+from src.utils.process_new_data import LoLDataNewProcessor
+from src.utils.team_resolver import TeamNameResolver, build_team_league_map
+
+
+class LoLBatchPredictor:
+    """
+    Scores whole lists of upcoming fixtures in a single vectorized pass.
+    Team names are resolved against the known teams of each league, and rows
+    that cannot be scored are reported instead of being silently dropped.
+    """
+
+    def __init__(self, processor=None, predictor=None, score_threshold=70):
+        """
+        Initializes the batch predictor with the data processor, the model and
+        the team index.
+
+        Args:
+            processor (LoLDataNewProcessor): Processor for new matches,
+                                             created if not given.
+            predictor (LoLPredictor): Loaded model, created if not given.
+            score_threshold (int): Minimum fuzzy score for a team name to be accepted.
+        """
+        self.base_dir = Path(__file__).resolve().parents[2]
+        self.teams_name_path = self.base_dir / "data" / "merged" / "data.csv"
+
+        self.processor = processor or LoLDataNewProcessor()
+        self.predictor = predictor or LoLPredictor()
+        self.score_threshold = score_threshold
+
+        teams = pd.read_csv(self.teams_name_path, usecols=["teamA", "teamB", "league"])
+        self.resolver = TeamNameResolver(build_team_league_map(teams))
+
+    @staticmethod
+    def load_fixtures(path) -> pd.DataFrame:
+        """
+        Loads fixtures (teamA, teamB, league, date) from a CSV or Parquet file.
+        """
+        path = Path(path)
+        if path.suffix.lower() in (".parquet", ".pq"):
+            df = pd.read_parquet(path)
+        else:
+            df = pd.read_csv(path, sep=",")
+        df.columns = df.columns.str.strip()
+        return df
+
+    def resolve_teams(self, fixtures: pd.DataFrame) -> pd.DataFrame:
+        """
+        Replaces team names with their canonical names within each fixture's league,
+        and leagues with their known spelling (leagues are matched case-insensitively).
+
+        Args:
+            fixtures (pd.DataFrame): Fixtures with teamA, teamB, league and date
+                                     columns.
+
+        Returns:
+            pd.DataFrame: Fixtures with canonical names and a 'status' column
+                          describing rows whose teams could not be resolved.
+        """
+        out = fixtures[["teamA", "teamB", "league", "date"]].reset_index(drop=True)
+        out["league"] = [self.resolver.canonical_league(l) for l in out["league"]]
+        out["status"] = "ok"
+
+        for col in ["teamA", "teamB"]:
+            matches = [
+                self.resolver.best_match(name, league=league)
+                for name, league in zip(out[col], out["league"])
+            ]
+            names = [name for name, _ in matches]
+            scores = np.array([score for _, score in matches])
+
+            unknown = scores < self.score_threshold
+            out[col] = np.where(unknown, out[col], names)
+            out.loc[unknown & (out["status"] == "ok"), "status"] = f"unknown {col}"
+
+        return out
+
+    def predict(self, fixtures: pd.DataFrame) -> pd.DataFrame:
+        """
+        Scores all fixtures at once.
+
+        Args:
+            fixtures (pd.DataFrame): Fixtures with teamA, teamB, league and date
+                                     columns.
+
+        Returns:
+            pd.DataFrame: Resolved fixtures with the probability that Team A wins,
+                          the predicted label and a status for every row.
+        """
+        out = self.resolve_teams(fixtures)
+        out["teamA_win_probability"] = np.nan
+        out["teamA_win"] = pd.array([pd.NA] * len(out), dtype="Int64")
+
+        processed_df, found = self.processor.run_pipeline(
+            out[["teamA", "teamB", "date", "league"]], return_mask=True
+        )
+        if len(processed_df):
+            prediction, probability = self.predictor.predict_with_probability(
+                processed_df
+            )
+            out.loc[found, "teamA_win_probability"] = probability[:, 1]
+            out.loc[found, "teamA_win"] = prediction
+
+        out.loc[~found & (out["status"] == "ok"), "status"] = "no stats"
+        return out
+
+    @staticmethod
+    def report(predictions: pd.DataFrame):
+        """
+        Prints the fixtures that could not be scored.
+        """
+        failed = predictions[predictions["status"] != "ok"]
+        print(
+            f"Scored {len(predictions) - len(failed)} of {len(predictions)} fixtures.",
+            file=sys.stderr,
+        )
+        for i, row in failed.iterrows():
+            print(
+                f"[!] Row {i}: {row['teamA']} vs {row['teamB']} "
+                f"({row['league']}, {row['date']}): {row['status']}",
+                file=sys.stderr,
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Predict the winners of a list of upcoming fixtures."
+    )
+    parser.add_argument(
+        "fixtures", type=str, help="CSV or Parquet file with teamA, teamB, league, date"
+    )
+    parser.add_argument(
+        "-o", "--output", type=str, help="Output CSV or Parquet file (default: stdout)"
+    )
+    parser.add_argument(
+        "--threshold", type=int, default=70, help="Minimum fuzzy score for team names"
+    )
+    args = parser.parse_args()
+
+    with redirect_stdout(sys.stderr):
+        batch_predictor = LoLBatchPredictor(score_threshold=args.threshold)
+        predictions = batch_predictor.predict(
+            batch_predictor.load_fixtures(args.fixtures)
+        )
+        batch_predictor.report(predictions)
+
+    if not args.output:
+        predictions.to_csv(sys.stdout, index=False)
+    elif Path(args.output).suffix.lower() in (".parquet", ".pq"):
+        predictions.to_parquet(args.output, index=False)
+    else:
+        predictions.to_csv(args.output, index=False)
+
+
+if __name__ == "__main__":
+    main()
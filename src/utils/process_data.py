@@ -1,3 +1,5 @@
+import hashlib
+import json
 import os
 from pathlib import Path
 
@@ -19,6 +21,8 @@ class LolDataProcessor:
         self.clean_dir = self.base_dir / "data" / "cleaned"
         self.merge_dir = self.base_dir / "data" / "merged"
         self.feature_dir = self.base_dir / "data" / "featured"
+        self.state_path = self.clean_dir / "pipeline_state.json"
+        self.totals_path = self.clean_dir / "team_totals.csv"
 
         self.cleaner = LoLDataCleaner()
         self.merger = LoLDataMerger()
@@ -27,7 +31,7 @@ class LolDataProcessor:
     def run_pipeline(self, years=["2023", "2024", "2025"], validation=2):
         """
         Executes the full pipeline:
-        1. Cleans raw match and team data.
+        1. Cleans raw match and team data and precomputes blended team stats.
         2. Merges team statistics with match results.
         3. Engineers features and splits data into train/validation sets.
 
@@ -41,21 +45,118 @@ class LolDataProcessor:
         matches = pd.concat(
             [self.cleaner.clean_matches(year) for year in years], ignore_index=True
         )
-        teams = self.cleaner.clean_teams()
+        teams, state = self.cleaner.clean_teams(return_state=True)
+        self.write_outputs(matches, teams, validation)
+        self.save_state(matches, state)
 
+        return None
+
+    def write_outputs(self, matches, teams, validation=2):
+        """
+        Blends the team statistics, merges them with the matches and writes the
+        cleaned, merged and featured datasets.
+        """
         matches["date"] = pd.to_datetime(matches["date"])
         teams["date"] = pd.to_datetime(teams["date"])
+        teams_blended = self.cleaner.blend_teams(teams)
 
         matches.to_csv(os.path.join(self.clean_dir, "matches.csv"), index=False)
         teams.to_csv(os.path.join(self.clean_dir, "teams.csv"), index=False)
+        teams_blended.to_csv(
+            os.path.join(self.clean_dir, "teams_blended.csv"), index=False
+        )
 
-        data = self.merger.merge_teams_and_matches(matches, teams)
+        data = self.merger.merge_teams_and_matches(matches, teams_blended)
         data.to_csv(os.path.join(self.merge_dir, "data.csv"), index=False)
 
+        self.write_features(data, validation)
+
+    def write_features(self, data, validation=2):
+        """
+        Engineers features from the merged dataset and writes the train/validation sets.
+        """
         train_df, val_df = self.feature_engineer.make_feature(
             data, validation=validation
         )
         train_df.to_csv(os.path.join(self.feature_dir, "train.csv"), index=False)
         val_df.to_csv(os.path.join(self.feature_dir, "val.csv"), index=False)
 
+    @staticmethod
+    def _matches_hash(matches):
+        return hashlib.sha256(matches.to_csv(index=False).encode("utf-8")).hexdigest()
+
+    def save_state(self, matches, state):
+        """
+        Records the running totals, row counts and game ids of every year and league
+        and a hash of the matches, so that run_incremental can continue from them.
+
+        Args:
+            matches (pd.DataFrame): All processed matches.
+            state (dict): State returned by clean_teams.
+        """
+        state["totals"].to_csv(self.totals_path, index=False)
+        with open(self.state_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"teams": state["blocks"], "matches": self._matches_hash(matches)}, f
+            )
+
+    def run_incremental(self, years=["2023", "2024", "2025"], validation=2):
+        """
+        Updates the outputs after new games or matches were added:
+        1. Aggregates only the Oracle's Elixir games that were not processed yet.
+           Leagues whose new games all come after their last processed day continue the
+           stored running totals; leagues with late or removed games are rebuilt. The
+           dumps are still read and prepared in full to find the new games.
+        2. If any team statistics or matches changed, re-blends all team statistics,
+           re-merges all matches and rewrites every output, so the files are exactly
+           what run_pipeline would write, including matches whose stats arrived late.
+        Falls back to run_pipeline when no previous state exists.
+
+        Args:
+            years (list): List of years to process.
+            validation (int): Size of the validation set in months.
+
+        Returns:
+            None
+        """
+        if not self.state_path.exists() or not self.totals_path.exists():
+            print("No pipeline state found, running the full pipeline.")
+            return self.run_pipeline(years, validation)
+
+        with open(self.state_path, encoding="utf-8") as f:
+            state = json.load(f)
+        old_state = {
+            "totals": pd.read_csv(self.totals_path, float_precision="round_trip"),
+            "blocks": state["teams"],
+        }
+        old_teams = pd.read_csv(
+            self.clean_dir / "teams.csv", float_precision="round_trip"
+        )
+        old_teams["date"] = pd.to_datetime(old_teams["date"])
+
+        teams, new_state = self.cleaner.clean_teams(
+            previous=(old_teams, old_state), return_state=True
+        )
+        matches = pd.concat(
+            [self.cleaner.clean_matches(year) for year in years], ignore_index=True
+        )
+        matches["date"] = pd.to_datetime(matches["date"])
+
+        changed = [
+            key
+            for key, block in new_state["blocks"].items()
+            if state["teams"].get(key) != block
+        ]
+        changed += [key for key in state["teams"] if key not in new_state["blocks"]]
+        if not changed and self._matches_hash(matches) == state["matches"]:
+            print("Incremental update: nothing changed.")
+            return None
+
+        print(
+            f"Incremental update: {len(changed)} leagues with new games, "
+            f"{len(teams) - len(old_teams)} new team-day rows."
+        )
+        self.write_outputs(matches, teams, validation)
+        self.save_state(matches, new_state)
+
         return None
@@ -5,6 +5,7 @@ import pandas as pd
 from src.data.clean_new_data import LoLNewDataCleaner
 from src.data.feature_new_data import LoLNewDataFeatureEngineer
 from src.data.merge_new_data import LoLNewDataMerger
+from src.data.team_stats import TeamStatsCache
 
 
 class LoLDataNewProcessor:
@@ -23,24 +24,35 @@ class LoLDataNewProcessor:
         self.cleaner = LoLNewDataCleaner()
         self.merger = LoLNewDataMerger()
         self.feature_engineer = LoLNewDataFeatureEngineer()
+        self.teams_cache = TeamStatsCache(
+            self.teams_data_path / "teams_blended.csv", self.merger.numeric_cols
+        )
 
-    def run_pipeline(self, df: pd.DataFrame) -> pd.DataFrame:
+    def run_pipeline(self, df: pd.DataFrame, return_mask=False) -> pd.DataFrame:
         """
         Main execution method to transform raw new match data into model-ready features.
+        Team statistics come from a process-wide in-memory cache that is reloaded
+        only when the underlying file changes.
 
         Args:
             df (pd.DataFrame): Raw input data of upcoming matches.
+            return_mask (bool): Whether to also return which input rows were kept.
 
         Returns:
             pd.DataFrame: A final feature set (differences and ratios) ready for prediction.
+            np.ndarray: Only if return_mask is set, a boolean mask over the input rows
+                        marking those that have stats for both teams.
         """
 
         cleaned_df = self.cleaner.clean_new_matches(df)
 
-        teams = pd.read_csv(self.teams_data_path / "teams.csv")
-        teams["date"] = pd.to_datetime(teams["date"])
+        teams = self.teams_cache.get_store()
 
-        merged_df = self.merger.merge_new_teams_and_matches(cleaned_df, teams)
+        merged_df, found = self.merger.merge_new_teams_and_matches(
+            cleaned_df, teams, return_mask=True
+        )
         featured_df = self.feature_engineer.make_new_feature(merged_df)
         featured_df = featured_df.drop(columns=["date"], errors="ignore")
+        if return_mask:
+            return featured_df, found
         return featured_df
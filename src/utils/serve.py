@@ -0,0 +1,393 @@
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+import json
+import time
+
+import pandas as pd
+
+from src.models.predict import LoLPredictor
+from src.utils.batch_predict import LoLBatchPredictor
+
+
+class MicroBatcher:
+    """
+    Gathers fixtures from concurrent requests into small batches, so that
+    many single-match requests are scored by one vectorized model call.
+    A batch is flushed once it holds max_batch fixtures or once the first
+    fixture has waited for window_ms milliseconds.
+    """
+
+    def __init__(
+        self, batch_predictor: LoLBatchPredictor, window_ms=5.0, max_batch=256
+    ):
+        """
+        Initializes the batcher around a loaded batch predictor.
+
+        Args:
+            batch_predictor (LoLBatchPredictor): Predictor with resolved team names and
+                                                 loaded model.
+            window_ms (float): Maximum time a fixture waits for others to join its
+                               batch.
+            max_batch (int): Maximum number of fixtures scored in one call.
+        """
+        self.batch_predictor = batch_predictor
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self.queue = asyncio.Queue()
+        # One worker thread keeps the model calls sequential and off the event loop.
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.worker = None
+
+    def start(self):
+        self.worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self.worker is not None:
+            self.worker.cancel()
+            await asyncio.gather(self.worker, return_exceptions=True)
+        self.executor.shutdown(wait=True)
+
+    async def submit(self, fixtures: list) -> list:
+        """
+        Queues the fixtures of one request and waits for their predictions.
+
+        Args:
+            fixtures (list): Dictionaries with teamA, teamB, league and date keys.
+
+        Returns:
+            list: One prediction dictionary per fixture, in the same order.
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((fixtures, future))
+        return await future
+
+    async def _collect(self) -> list:
+        """
+        Waits for the first request and then for more until the window closes
+        or the batch is full.
+        """
+        batch = [await self.queue.get()]
+        size = len(batch[0][0])
+        deadline = time.monotonic() + self.window
+
+        while size < self.max_batch:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self.queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            batch.append(item)
+            size += len(item[0])
+
+        return batch
+
+    def _predict(self, fixtures: list) -> list:
+        predictions = self.batch_predictor.predict(pd.DataFrame(fixtures))
+        predictions = predictions.astype(object).where(predictions.notna(), None)
+        return predictions.to_dict(orient="records")
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            fixtures = [f for request, _ in batch for f in request]
+
+            try:
+                results = await loop.run_in_executor(
+                    self.executor, self._predict, fixtures
+                )
+            except Exception:
+                # Score every request on its own, so a bad request only fails itself.
+                for request, future in batch:
+                    try:
+                        result = await loop.run_in_executor(
+                            self.executor, self._predict, request
+                        )
+                    except Exception as e:
+                        if not future.done():
+                            future.set_exception(e)
+                    else:
+                        if not future.done():
+                            future.set_result(result)
+                continue
+
+            start = 0
+            for request, future in batch:
+                if not future.done():
+                    future.set_result(results[start : start + len(request)])
+                start += len(request)
+
+
+class LoLPredictionServer:
+    """
+    A minimal asyncio HTTP/1.1 service exposing the match predictor.
+
+    Endpoints:
+        GET  /health   Service status.
+        POST /predict  One fixture object, a list of them, or {"fixtures": [...]},
+                       each with teamA, teamB, league and date.
+    """
+
+    required_keys = ["teamA", "teamB", "league", "date"]
+    max_body_size = 1 << 20
+
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=8000,
+        window_ms=5.0,
+        max_batch=256,
+        batch_predictor=None,
+    ):
+        """
+        Loads the model, the team statistics and the team-name index once.
+
+        Args:
+            host (str): Interface to listen on.
+            port (int): Port to listen on.
+            window_ms (float): Micro-batching window in milliseconds.
+            max_batch (int): Maximum number of fixtures scored in one call.
+            batch_predictor (LoLBatchPredictor): Loaded predictor, created if not given.
+        """
+        self.host = host
+        self.port = port
+        self.window_ms = window_ms
+        self.max_batch = max_batch
+        self.batch_predictor = batch_predictor or LoLBatchPredictor()
+        # Warm the team statistics cache so the first request does not pay for it.
+        self.batch_predictor.processor.teams_cache.get_store()
+        self.batcher = None
+        self.server = None
+
+    async def start(self):
+        """
+        Starts the batching worker and begins accepting connections.
+        """
+        self.batcher = MicroBatcher(
+            self.batch_predictor, self.window_ms, self.max_batch
+        )
+        self.batcher.start()
+        self.server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.batcher is not None:
+            await self.batcher.stop()
+
+    async def serve_forever(self):
+        await self.start()
+        print(f"Serving predictions on http://{self.host}:{self.port}")
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.stop()
+
+    def _parse_fixtures(self, body: bytes) -> list:
+        """
+        Validates a /predict request body.
+
+        Raises:
+            ValueError: If the body is not a fixture, a list of fixtures or
+                        {"fixtures": [...]}, or if a fixture has non-string fields
+                        or an unparsable date.
+        """
+        payload = json.loads(body)
+        if isinstance(payload, dict):
+            payload = payload["fixtures"] if "fixtures" in payload else [payload]
+        if not isinstance(payload, list) or not payload:
+            raise ValueError("Expected a fixture or a non-empty list of fixtures.")
+
+        fixtures = []
+        for i, fixture in enumerate(payload):
+            if not isinstance(fixture, dict):
+                raise ValueError(f"Fixture {i} is not an object.")
+            missing = [k for k in self.required_keys if k not in fixture]
+            if missing:
+                raise ValueError(f"Fixture {i} is missing: {', '.join(missing)}.")
+            invalid = [
+                k
+                for k in self.required_keys
+                if not isinstance(fixture[k], str) or not fixture[k].strip()
+            ]
+            if invalid:
+                raise ValueError(
+                    f"Fixture {i} needs non-empty strings for: {', '.join(invalid)}."
+                )
+            try:
+                date = pd.Timestamp(fixture["date"])
+            except ValueError:
+                date = pd.NaT
+            if pd.isna(date):
+                raise ValueError(f"Fixture {i} has an invalid date: {fixture['date']}.")
+            fixtures.append({k: fixture[k] for k in self.required_keys})
+        return fixtures
+
+    async def _route(self, method: str, path: str, body: bytes):
+        """
+        Dispatches a request and returns the status and the JSON response.
+        """
+        if path == "/health":
+            if method != "GET":
+                return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Use GET."}
+            predictor = self.batch_predictor.predictor
+            return HTTPStatus.OK, {
+                "status": "ok",
+                "model": predictor.metadata.get("name", predictor.model_path.name),
+                "version": predictor.metadata.get("version"),
+                "teams": len(self.batch_predictor.resolver.names),
+            }
+
+        if path == "/predict":
+            if method != "POST":
+                return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Use POST."}
+            try:
+                fixtures = self._parse_fixtures(body)
+            except (ValueError, UnicodeDecodeError) as e:
+                return HTTPStatus.BAD_REQUEST, {"error": str(e)}
+            predictions = await self.batcher.submit(fixtures)
+            return HTTPStatus.OK, {"predictions": predictions}
+
+        return HTTPStatus.NOT_FOUND, {"error": f"Unknown path {path}."}
+
+    @staticmethod
+    async def _write_response(
+        writer, status: HTTPStatus, payload: dict, keep_alive: bool
+    ):
+        body = json.dumps(payload).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+    async def _handle_connection(self, reader, writer):
+        """
+        Serves requests on one connection until the client closes it.
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self._write_response(
+                        writer,
+                        HTTPStatus.BAD_REQUEST,
+                        {"error": "Malformed request line."},
+                        False,
+                    )
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = (
+                    connection != "close"
+                    if version == "HTTP/1.1"
+                    else connection == "keep-alive"
+                )
+
+                try:
+                    length = int(headers.get("content-length", 0) or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._write_response(
+                        writer,
+                        HTTPStatus.BAD_REQUEST,
+                        {"error": "Invalid Content-Length."},
+                        False,
+                    )
+                    break
+                if length > self.max_body_size:
+                    await self._write_response(
+                        writer,
+                        HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                        {"error": "Body too large."},
+                        False,
+                    )
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                try:
+                    status, payload = await self._route(
+                        method, target.split("?", 1)[0], body
+                    )
+                except Exception as e:
+                    status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {
+                        "error": str(e)
+                    }
+
+                await self._write_response(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve match predictions over HTTP.")
+    parser.add_argument(
+        "--host", type=str, default="127.0.0.1", help="Interface to listen on"
+    )
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on")
+    parser.add_argument(
+        "--window-ms",
+        type=float,
+        default=5.0,
+        help="Micro-batching window in milliseconds",
+    )
+    parser.add_argument(
+        "--max-batch", type=int, default=256, help="Maximum fixtures per model call"
+    )
+    parser.add_argument(
+        "--model",
+        type=str,
+        help="Registered model as name or name@version (default: random_forest.pkl)",
+    )
+    args = parser.parse_args()
+
+    batch_predictor = None
+    if args.model:
+        name, _, version = args.model.partition("@")
+        predictor = LoLPredictor.from_registry(name, version or None)
+        batch_predictor = LoLBatchPredictor(predictor=predictor)
+
+    server = LoLPredictionServer(
+        args.host,
+        args.port,
+        args.window_ms,
+        args.max_batch,
+        batch_predictor=batch_predictor,
+    )
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+from collections import defaultdict
+import re
+
+import numpy as np
+import pandas as pd
+from rapidfuzz import fuzz
+
+from src.data.clean import LoLDataCleaner
+
+
+def build_team_league_map(matches: pd.DataFrame) -> dict:
+    """
+    Builds the team -> league mapping from a match table in one vectorized pass.
+    Teams keep the order of their first appearance and the league of their last one.
+
+    Args:
+        matches (pd.DataFrame): Matches with 'teamA', 'teamB' and 'league' columns.
+
+    Returns:
+        dict: Mapping of team names to leagues.
+    """
+    pairs = pd.DataFrame(
+        {
+            "team": matches[["teamA", "teamB"]].to_numpy().ravel(),
+            "league": matches["league"].repeat(2).to_numpy(),
+        }
+    )
+    order = pairs.drop_duplicates("team", keep="first")["team"]
+    leagues = pairs.drop_duplicates("team", keep="last").set_index("team")["league"]
+    return dict(zip(order, leagues.loc[order]))
+
+
+class TeamNameResolver:
+    """
+    Resolves free-text team names to the canonical names used in the datasets.
+    Names are normalized and indexed by character trigrams once. A lookup scores
+    the names that share a trigram with the query first, then only the other names
+    whose length still allows a score as high as the k-th best one, so the result
+    is the same as scoring every name.
+    """
+
+    def __init__(self, team_league_map: dict, aliases=None):
+        """
+        Builds the index from the known teams and an alias table.
+
+        Args:
+            team_league_map (dict): Mapping of canonical team names to their league.
+            aliases (dict): Mapping of alternative names to canonical names,
+                            defaults to the team name map of LoLDataCleaner.
+        """
+        if aliases is None:
+            aliases = LoLDataCleaner().replace_map
+
+        self.team_league_map = dict(team_league_map)
+        self.names = list(self.team_league_map)
+        self.normalized = [self.normalize(n) for n in self.names]
+        self.lengths = np.array([len(n) for n in self.normalized])
+
+        self.exact = {}
+        for i, norm in enumerate(self.normalized):
+            self.exact.setdefault(norm, i)
+
+        positions = {name: i for i, name in enumerate(self.names)}
+        for alias, canonical in aliases.items():
+            if canonical in positions:
+                self.exact.setdefault(self.normalize(alias), positions[canonical])
+
+        self.trigram_index = defaultdict(set)
+        for i, norm in enumerate(self.normalized):
+            for gram in self._trigrams(norm):
+                self.trigram_index[gram].add(i)
+
+        # Leagues are matched case-insensitively, like team names.
+        self.league_index = defaultdict(set)
+        self.league_names = {}
+        for i, name in enumerate(self.names):
+            league = self.team_league_map[name]
+            self.league_index[str(league).upper()].add(i)
+            self.league_names.setdefault(str(league).upper(), league)
+
+    @staticmethod
+    def normalize(name) -> str:
+        """
+        Lowercases a name and replaces non-alphanumeric characters with spaces,
+        matching the default processing of thefuzz.
+        """
+        return re.sub(r"[\W_]", " ", str(name).lower()).strip()
+
+    @staticmethod
+    def _trigrams(norm: str) -> set:
+        padded = f"  {norm} "
+        return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+    def resolve(self, query, league=None, k=5) -> list:
+        """
+        Finds the canonical team names closest to the query.
+
+        Args:
+            query (str): Team name as typed by the user.
+            league (str): Optional league to restrict the search to.
+            k (int): Maximum number of candidates to return.
+
+        Returns:
+            list: Up to k (name, score) tuples ordered by descending score, where
+                  score is the fuzz.ratio similarity (0-100); exact and alias matches
+                  score 100.
+        """
+        norm = self.normalize(query) if query else ""
+        if not norm or not self.names:
+            return []
+
+        allowed = None
+        if league is not None:
+            allowed = self.league_index.get(str(league).upper(), set())
+
+        candidates = set()
+        for gram in self._trigrams(norm):
+            candidates |= self.trigram_index.get(gram, set())
+        if allowed is not None:
+            candidates &= allowed
+
+        # Like thefuzz, names are ranked on the unrounded ratio (ties go to the first
+        # name) and only the returned scores are rounded.
+        scores = {i: fuzz.ratio(norm, self.normalized[i]) for i in candidates}
+
+        # The ratio is at most 200 * min(len) / (len + len), so names without a shared
+        # trigram are only scored if that bound reaches the k-th best score so far.
+        kth = sorted(scores.values(), reverse=True)[k - 1] if len(scores) >= k else -1
+        pool = allowed if allowed is not None else range(len(self.names))
+        pool = np.array(sorted(pool), dtype=int)
+        pool = pool[~np.isin(pool, list(candidates))]
+        lengths = self.lengths[pool]
+        bound = 200 * np.minimum(lengths, len(norm)) / (lengths + len(norm))
+        for i in pool[bound >= kth - 1e-9]:
+            scores[int(i)] = fuzz.ratio(norm, self.normalized[i])
+
+        hit = self.exact.get(norm)
+        if hit is not None and (allowed is None or hit in allowed):
+            scores[hit] = 100.0
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:k]
+        return [(self.names[i], int(round(score))) for i, score in ranked]
+
+    def canonical_league(self, league):
+        """
+        Returns the known spelling of a league (e.g. "LCK" for "lck"),
+        or the league itself if it is unknown.
+        """
+        return self.league_names.get(str(league).upper(), league)
+
+    def best_match(self, query, league=None):
+        """
+        Returns the single closest canonical team name.
+
+        Args:
+            query (str): Team name as typed by the user.
+            league (str): Optional league to restrict the search to.
+
+        Returns:
+            tuple: (name, score), or (None, 0) if nothing can be matched.
+        """
+        matches = self.resolve(query, league=league, k=1)
+        return matches[0] if matches else (None, 0)
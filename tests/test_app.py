@@ -0,0 +1,36 @@
+import pandas as pd
+
+import app
+
+
+def _write_matches(path, rows):
+    pd.DataFrame(rows, columns=["teamA", "teamB", "league", "date"]).to_csv(
+        path, index=False
+    )
+
+
+def test_team_league_map_is_cached_per_file_version(tmp_path):
+    """
+    The team map is built once per version of data.csv: the same mtime reuses it,
+    a rewritten file is read again. Teams keep their first-appearance order and
+    the league of their last appearance, like the former row-by-row loop.
+    """
+    path = tmp_path / "data.csv"
+    _write_matches(
+        path,
+        [
+            ("T1", "Gen.G", "LCK", "2025-01-01"),
+            ("G2 Esports", "T1", "MSI", "2025-05-01"),
+        ],
+    )
+    mtime = path.stat().st_mtime_ns
+
+    team_map = app.load_team_league_map(str(path), mtime)
+    assert team_map == {"T1": "MSI", "Gen.G": "LCK", "G2 Esports": "MSI"}
+    assert app.load_team_league_map(str(path), mtime) is team_map
+
+    _write_matches(path, [("Fnatic", "G2 Esports", "LEC", "2025-06-01")])
+    assert app.load_team_league_map(str(path), mtime + 1) == {
+        "Fnatic": "LEC",
+        "G2 Esports": "LEC",
+    }
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.models.backtest import WalkForwardBacktest
+from src.models.search import fit_model
+
+DATA_PATH = Path(__file__).resolve().parents[1] / "data" / "merged" / "data.csv"
+
+
+def test_every_step_is_scored_by_a_model_of_the_past():
+    """
+    Every original match from the start day is scored once, by a model fitted only
+    on the (original and mirrored) matches played before its step.
+    """
+    data = pd.read_csv(DATA_PATH)
+    start = (pd.to_datetime(data["date"]).max() - pd.Timedelta(days=20)).strftime(
+        "%Y-%m-%d"
+    )
+    params = {"max_depth": 3, "min_samples_split": 2, "min_samples_leaf": 1}
+    backtest = WalkForwardBacktest(
+        "decision_tree", params=params, start=start, n_workers=1
+    )
+
+    predictions, by_step, by_league, by_league_step = backtest.run(data)
+
+    dates = pd.to_datetime(data["date"])
+    assert len(predictions) == (dates >= start).sum()
+    assert by_step["n"].iloc[-1] == len(predictions) == by_league["n"].iloc[-1]
+    assert by_league_step["n"].sum() == len(predictions)
+    counts = predictions.groupby(["league", "step"]).size()
+    assert by_league_step.set_index(["league", "step"])["n"].equals(counts)
+
+    features = backtest.build_features(data)
+    feature_cols = backtest.feature_engineer.kernel.feature_names
+    for step, part in predictions.groupby("step"):
+        train = features[features["date"] < pd.Timestamp(step)]
+        assert part["n_train"].iloc[0] == len(train)
+        model = fit_model(
+            "decision_tree",
+            params,
+            train[feature_cols].to_numpy(dtype=float),
+            train["teamA_win"].to_numpy(),
+            train["date"].to_numpy(dtype="datetime64[ns]"),
+        )
+        test = features[features["original"] & (features["date"] >= pd.Timestamp(step))]
+        test = test[test["date"] < pd.Timestamp(step) + pd.Timedelta(days=7)]
+        np.testing.assert_array_equal(
+            part["teamA_win_probability"].to_numpy(),
+            model.predict_proba(test[feature_cols].to_numpy(dtype=float))[:, 1],
+        )
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+
+from src.utils.batch_predict import LoLBatchPredictor
+
+
+def test_predictions_line_up_with_fixtures_when_rows_are_dropped():
+    """
+    Fixtures that cannot be scored keep their row with a status, and every scored
+    row gets the probability of predicting that fixture on its own.
+    """
+    batch = LoLBatchPredictor()
+    fixtures = pd.DataFrame(
+        [
+            ("T1", "Gen.G", "LCK", "2025-08-01"),
+            ("Unknown Squad", "T1", "LCK", "2025-08-01"),
+            ("Fnatic", "G2 Esports", "LEC", "2025-08-01"),
+            ("T1", "Gen.G", "LCK", "2000-01-01"),
+            ("g2 esports", "fnatic", "LEC", "2025-08-02"),
+            ("t1", "gen.g", "lck", "2025-08-01"),
+        ],
+        columns=["teamA", "teamB", "league", "date"],
+    )
+
+    out = batch.predict(fixtures)
+
+    assert len(out) == len(fixtures)
+    assert out["status"].tolist() == [
+        "ok",
+        "unknown teamA",
+        "ok",
+        "no stats",
+        "ok",
+        "ok",
+    ]
+    assert out.loc[4, ["teamA", "teamB"]].tolist() == ["G2 Esports", "Fnatic"]
+    # Leagues are matched case-insensitively.
+    assert out.loc[5, ["teamA", "teamB", "league"]].tolist() == ["T1", "Gen.G", "LCK"]
+    assert out.loc[5, "teamA_win_probability"] == out.loc[0, "teamA_win_probability"]
+    assert out.loc[out["status"] != "ok", "teamA_win_probability"].isna().all()
+
+    for i in np.flatnonzero(out["status"] == "ok"):
+        single = batch.processor.run_pipeline(
+            out.loc[[i], ["teamA", "teamB", "date", "league"]]
+        )
+        _, probability = batch.predictor.predict_with_probability(single)
+        assert out.loc[i, "teamA_win_probability"] == probability[0, 1]
@@ -3,6 +3,8 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 
+from src.data.clean import LoLDataCleaner
+
 
 def test_compare_csv_outputs_teams():
     """
@@ -46,5 +48,68 @@ def test_compare_csv_outputs_teams():
         )
 
 
+def _synthetic_games(seed=0, n=400):
+    """
+    Builds random team-level game rows shaped like prepared Oracle's Elixir data.
+    """
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            "league": rng.choice(["LEC", "LCK"], n),
+            "teamname": rng.choice(["Fnatic", "G2 Esports", "T1", "Gen.G"], n),
+            "split": rng.choice(["Winter", "Spring", np.nan], n, p=[0.45, 0.45, 0.1]),
+            "playoffs": rng.integers(0, 2, n),
+            "date": pd.Timestamp("2025-01-01")
+            + pd.to_timedelta(rng.integers(0, 60 * 24 * 40, n), unit="min"),
+            "result": rng.integers(0, 2, n),
+            "teamkills": rng.integers(0, 30, n),
+            "teamdeaths": rng.integers(0, 30, n),
+        }
+    )
+    cleaner = LoLDataCleaner()
+    for col in cleaner.mean_metrics.values():
+        values = rng.normal(size=n)
+        values[rng.random(n) < 0.2] = np.nan
+        df[col] = values
+    for my_col, opp_col in cleaner.rate_metrics.values():
+        df[my_col] = rng.integers(0, 3, n).astype(float)
+        df[opp_col] = rng.integers(0, 3, n).astype(float)
+    df.loc[df["league"] == "LCK", "void_grubs"] = np.nan
+    return df.sort_values("date")
+
+
+def test_aggregate_cumulative_matches_aggregate_until_date():
+    """
+    Checks that the running-sum aggregation engine reproduces the per-day
+    results of the reference aggregate_until_date implementation.
+    """
+    cleaner = LoLDataCleaner()
+    df = _synthetic_games()
+
+    expected = []
+    for (league, team, split, playoffs), group in df.groupby(cleaner.group_cols):
+        for day in group["date"].dt.date.unique():
+            stats = cleaner.aggregate_until_date(group[group["date"].dt.date <= day])
+            stats["league"] = league
+            stats["Team"] = team
+            stats["date"] = pd.Timestamp(day)
+            expected.append(stats)
+    expected = pd.DataFrame(expected)
+
+    actual = cleaner.aggregate_cumulative(df)
+
+    assert len(actual) == len(expected)
+    for col in cleaner.expected_cols:
+        if col in ["league", "Team", "date"]:
+            assert (actual[col].to_numpy() == expected[col].to_numpy()).all()
+            continue
+        np.testing.assert_allclose(
+            actual[col].to_numpy(dtype=float),
+            expected[col].to_numpy(dtype=float),
+            rtol=1e-9,
+            err_msg=f"Mismatch found in column: {col}",
+        )
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
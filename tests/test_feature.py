@@ -0,0 +1,82 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.data.feature import LoLDataFeatureEngineer
+from src.data.feature_new_data import LoLNewDataFeatureEngineer
+
+DATA_PATH = Path(__file__).resolve().parents[1] / "data" / "merged" / "data.csv"
+
+
+def _merged(n=200):
+    df = pd.read_csv(DATA_PATH, parse_dates=["date"])
+    return df.sample(n, random_state=0).reset_index(drop=True)
+
+
+def _reference_diff(df):
+    """
+    The pandas implementation of make_diff the kernel replaced.
+    """
+    a_cols = [c for c in df.columns if c.endswith("_A")]
+    diff_data, ratio_data = {}, {}
+    for a_col in a_cols:
+        base = a_col[:-2]
+        b_col = f"{base}_B"
+        if b_col in df.columns:
+            diff_data[f"diff_{base}"] = df[a_col] - df[b_col]
+            ratio_data[f"ratio_{base}"] = df[a_col] / (df[b_col] + 1e-6)
+    drop_cols = [c for c in df.columns if c.endswith("_A") or c.endswith("_B")]
+    features = [pd.DataFrame(diff_data), pd.DataFrame(ratio_data)]
+    return pd.concat([df.drop(columns=drop_cols)] + features, axis=1)
+
+
+def _mirror_matches(df):
+    """
+    The copying implementation make_mirror_diff replaced: the matches followed by
+    copies with the Team A and Team B columns swapped.
+    """
+    df_mirror = df.copy()
+    for a_col in [c for c in df.columns if c.endswith("_A")]:
+        b_col = f"{a_col[:-2]}_B"
+        df_mirror[a_col], df_mirror[b_col] = df[b_col], df[a_col]
+    df_mirror["teamA"], df_mirror["teamB"] = df["teamB"], df["teamA"]
+    df_mirror["teamA_win"] = 1 - df["teamA_win"]
+    return pd.concat([df.copy(), df_mirror], ignore_index=True)
+
+
+def test_training_and_inference_features_come_from_one_kernel():
+    """
+    Both feature engineers produce the reference features, in the same column order.
+    """
+    df = _merged()
+    expected = _reference_diff(df)
+
+    engineer = LoLDataFeatureEngineer()
+    train = engineer.make_diff(df.copy())
+    new = LoLNewDataFeatureEngineer().make_diff(df.copy())
+
+    feature_names = engineer.kernel.feature_names
+    assert list(train.columns[-len(feature_names) :]) == feature_names
+    pd.testing.assert_frame_equal(train, expected[train.columns])
+    pd.testing.assert_frame_equal(new, train)
+
+
+def test_mirrored_features_equal_features_of_swapped_teams():
+    """
+    transform_mirrored appends the features of B vs A, and make_mirror_diff equals
+    make_diff on the copied and swapped mirror matches.
+    """
+    df = _merged()
+    engineer = LoLDataFeatureEngineer()
+    kernel = engineer.kernel
+    a = df[kernel.a_cols].to_numpy(dtype=float)
+    b = df[kernel.b_cols].to_numpy(dtype=float)
+
+    mirrored = kernel.transform_mirrored(a, b)
+    np.testing.assert_array_equal(mirrored[: len(df)], kernel.transform(a, b))
+    np.testing.assert_array_equal(mirrored[len(df) :], kernel.transform(b, a))
+
+    expected = engineer.make_diff(_mirror_matches(df))
+    actual = engineer.make_mirror_diff(df)
+    pd.testing.assert_frame_equal(actual, expected[actual.columns])
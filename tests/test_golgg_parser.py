@@ -0,0 +1,77 @@
+from pathlib import Path
+import sys
+
+import pytest
+
+SCRAPER_DIR = Path(__file__).resolve().parents[1] / "scrap" / "golgg"
+# Appended, not prepended: scrap/golgg/src must not shadow the repository's src
+# package in interpreters spawned by the other tests.
+for d in [str(SCRAPER_DIR / "src"), str(SCRAPER_DIR)]:
+    if d not in sys.path:
+        sys.path.append(d)
+
+from parser_matchlist import GolParser  # noqa: E402
+
+PAGE = (Path(__file__).parent / "test_golgg_matchlist.html").read_text(encoding="utf-8")
+
+ROW = (
+    "<tr><td>{a} vs {b}</td><td>{a}</td><td>{score}</td><td>{b}</td>"
+    "<td>WEEK1</td><td>15.1</td><td>{date}</td></tr>"
+)
+EDGE_PAGE = "".join(
+    [
+        "<html><body><table><tr><th>Menu</th></tr><tr><td>Stats</td></tr></table>",
+        "<table class='table_list'><thead><tr><th>Game</th><th></th>",
+        "<th>Score</th><th></th><th>Stage</th><th>Patch</th><th>Date</th>",
+        "</tr></thead><tbody>",
+        ROW.format(
+            a="Team &amp; Co", b="<b>KT</b> Rolster", score="2 - 1", date="2025-06-15"
+        ),
+        ROW.format(a="T1", b="Gen.G", score="FF", date="Jun 15, 2025"),
+        ROW.format(a="T1", b="Gen.G", score="1:2", date="2025-06-15 (W1)"),
+        ROW.format(a="T1", b="Gen.G", score="0 - 0", date="2025-02-30"),
+        ROW.format(a="T1", b="Gen.G", score="3 - 0", date="TBD"),
+        "<tr><td>short</td><td>row</td></tr>",
+        "<tr><td>x</td><td>T1</td><td>2 - 0</td><td>DRX</td><td>no date</td></tr>",
+        "</tbody></table></body></html>",
+    ]
+)
+FALLBACK_PAGE = (
+    "<table><tr><td>header</td></tr>"
+    + ROW.format(a="T1", b="DRX", score="2 - 0", date="2024-01-17")
+    + "</table><table><tr><th>Other</th></tr></table>"
+)
+
+
+@pytest.mark.parametrize(
+    "html",
+    [PAGE, EDGE_PAGE, FALLBACK_PAGE, "<html><body>Not found</body></html>", ""],
+    ids=["saved", "edge", "fallback", "no_table", "empty"],
+)
+def test_fast_parser_parity(html):
+    """
+    The streaming parser returns exactly what the BeautifulSoup parser returns.
+    """
+    assert GolParser("fast").parse_tournament_matchlist(html) == GolParser(
+        "bs4"
+    ).parse_tournament_matchlist(html)
+
+
+def test_fast_parser_values():
+    matches = GolParser().parse_tournament_matchlist(EDGE_PAGE)
+    assert len(matches) == 6
+    assert matches[0] == {
+        "teamA": "Team & Co",
+        "teamB": "KTRolster",
+        "scoreA": 2,
+        "scoreB": 1,
+        "date": "2025-06-15",
+    }
+    assert [m["date"] for m in matches[1:]] == [
+        "2025-06-15",
+        "2025-06-15 (W1)",
+        "2025-02-30",
+        "TBD",
+        "",
+    ]
+    assert matches[1]["scoreA"] is None
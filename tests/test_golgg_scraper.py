@@ -0,0 +1,350 @@
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import sys
+import threading
+import time
+from urllib.parse import unquote
+
+import pandas as pd
+import pytest
+
+SCRAPER_DIR = Path(__file__).resolve().parents[1] / "scrap" / "golgg"
+# Appended, not prepended: scrap/golgg/src must not shadow the repository's src
+# package in interpreters spawned by the other tests.
+for d in [str(SCRAPER_DIR / "src"), str(SCRAPER_DIR)]:
+    if d not in sys.path:
+        sys.path.append(d)
+
+from games import GolGameScraper  # noqa: E402
+from manager import GolManager  # noqa: E402
+from parser_matchlist import GolParser  # noqa: E402
+from planner import ScrapePlanner  # noqa: E402
+
+PAGE = (Path(__file__).parent / "test_golgg_matchlist.html").read_bytes()
+ETAG = '"matchlist-v1"'
+
+
+def series_game_ids(series_id):
+    # Every fifth series is a best-of-one without game links on its summary page.
+    if series_id % 5 == 0:
+        return []
+    return [series_id * 10 + k for k in range(2 + series_id % 2)]
+
+
+def game_stats_page(path):
+    """
+    Renders a minimal series summary or game page like the ones of gol.gg.
+    """
+    page_id, kind = path.strip("/").split("/")[2:4]
+    page_id = int(page_id)
+    if kind == "page-summary":
+        links = "".join(
+            f'<a href="../{g}/page-game/">GAME {i + 1}</a>'
+            for i, g in enumerate(series_game_ids(page_id))
+        )
+        return f"<html><body><div class='navbar'>{links}</div></body></html>"
+    blue, red = ("WIN", "LOSS") if page_id % 2 == 0 else ("LOSS", "WIN")
+    return (
+        "<html><body><div class='row'>"
+        "<div class='col-12 blue-line-header'>"
+        f"<a href='../teams/1/'>Blue {page_id}</a> - {blue}</div>"
+        "<div class='col-12 red-line-header'>"
+        f"<a href='../teams/2/'>Red {page_id}</a> - {red}</div>"
+        "<div class='col-6'><h1>Game Time</h1>"
+        f"<h1>{20 + page_id % 15}:{page_id % 60:02d}</h1></div>"
+        "</div></body></html>"
+    )
+
+
+class StubGolServer(ThreadingHTTPServer):
+    """
+    Serves the saved matchlist page for every tournament, with a little latency
+    and an ETag. "Flaky" tournaments fail once with a 503 and "Missing" ones
+    return a 404.
+    """
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.lock = threading.Lock()
+        self.requests = []
+        self.not_modified = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        name = unquote(self.path.rstrip("/").rsplit("/", 1)[-1])
+        with server.lock:
+            server.requests.append((name, time.monotonic()))
+            attempts = sum(n == name for n, _ in server.requests)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+
+        time.sleep(0.05)
+        if name.startswith("Flaky") and attempts == 1:
+            status, body = 503, b""
+        elif name.startswith("Missing"):
+            status, body = 404, b"<html><body>Not found</body></html>"
+        elif self.headers.get("If-None-Match") == ETAG:
+            status, body = 304, b""
+        elif self.path.startswith("/game/stats/"):
+            status, body = 200, game_stats_page(self.path).encode("utf-8")
+        else:
+            status, body = 200, PAGE
+
+        with server.lock:
+            server.in_flight -= 1
+            server.not_modified += status == 304
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def gol_server():
+    server = StubGolServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_scrape_many_concurrent(gol_server, tmp_path):
+    """
+    Scrapes several tournaments from a stub server and checks the saved CSVs,
+    the retry of a failed request and the concurrency and rate limits.
+    """
+    tournaments = [f"LCK 2025 Week {i}" for i in range(8)] + [
+        "Flaky Cup 2025",
+        "Missing Cup 2025",
+    ]
+    manager = GolManager(
+        base_url=gol_server.url,
+        data_dir=tmp_path,
+        concurrency=3,
+        rate=20.0,
+        cache_dir=None,
+    )
+
+    scraped = manager.scrape_many(tournaments)
+
+    expected = pd.DataFrame(
+        GolParser().parse_tournament_matchlist(PAGE.decode("utf-8"))
+    )
+    assert len(expected) == 45
+    assert sorted(scraped) == sorted(tournaments)
+    assert scraped["Missing Cup 2025"] == []
+
+    for name in tournaments[:-1]:
+        saved = pd.read_csv(tmp_path / f"{name}_matches.csv")
+        pd.testing.assert_frame_equal(saved, expected)
+    assert not (tmp_path / "Missing Cup 2025_matches.csv").exists()
+
+    assert [n for n, _ in gol_server.requests].count("Flaky Cup 2025") == 2
+    assert len(gol_server.requests) == len(tournaments) + 1
+    assert 1 < gol_server.max_in_flight <= 3
+
+    # Burst of 2 tokens, then one every 50 ms.
+    times = sorted(t for _, t in gol_server.requests[: len(tournaments)])
+    assert times[-1] - times[0] >= (len(tournaments) - 2) / 20.0 - 0.02
+
+
+def test_scrape_many_cached(gol_server, tmp_path):
+    """
+    Re-scrapes finished tournaments from the HTTP cache without any request,
+    and revalidates expired pages with conditional requests.
+    """
+    tournaments = [f"LCK 2025 Week {i}" for i in range(4)]
+    manager = GolManager(
+        base_url=gol_server.url,
+        data_dir=tmp_path,
+        rate=20.0,
+        cache_dir=tmp_path / "cache",
+    )
+
+    first = manager.scrape_many(tournaments)
+    assert len(gol_server.requests) == 4
+
+    # The fixture matches are from 2025, so the pages never expire.
+    second = manager.scrape_many(tournaments, force=True)
+    assert second == first
+    assert len(gol_server.requests) == 4
+
+    url = manager._slug_to_url(tournaments[0])
+    manager.fetcher.cache.set_ttl(url, 0)
+    manager.fetcher.cache.set_ttl(manager._slug_to_url(tournaments[1]), 0)
+    third = manager.scrape_many(tournaments, force=True)
+    assert third == first
+    assert len(gol_server.requests) == 6
+    assert gol_server.not_modified == 2
+    assert manager.fetcher.cache.get(url) is not None
+
+
+def test_scrape_many_planned(gol_server, tmp_path):
+    """
+    Skips finished tournaments listed in the manifest and only rewrites CSVs
+    whose content changed.
+    """
+    scraped_list = tmp_path / "scraped_tournaments.txt"
+    scraped_list.write_text("    LCK - 2025\n\nLCK 2025 Week 0\n", encoding="utf-8")
+    tournaments = ["LCK 2025 Week 0", "LCK 2025 Week 1"]
+    manager = GolManager(
+        base_url=gol_server.url,
+        data_dir=tmp_path,
+        rate=20.0,
+        cache_dir=None,
+        scraped_list=scraped_list,
+    )
+
+    manager.scrape_many(tournaments)
+    manifest = pd.read_csv(tmp_path / "manifest.csv")
+    assert manifest["tournament"].tolist() == tournaments
+    assert manifest["rows"].tolist() == [45, 45]
+    assert manifest["finished"].all()
+    assert scraped_list.read_text(encoding="utf-8").splitlines()[-2:] == tournaments
+    assert len(gol_server.requests) == 2
+
+    mtime = (tmp_path / "LCK 2025 Week 0_matches.csv").stat().st_mtime_ns
+    assert manager.scrape_many(tournaments) == {}
+    assert len(gol_server.requests) == 2
+
+    # Forced runs fetch the pages again, but leave unchanged CSVs untouched.
+    fresh = GolManager(
+        base_url=gol_server.url, data_dir=tmp_path, rate=20.0, cache_dir=None
+    )
+    assert sorted(fresh.scrape_many(tournaments, force=True)) == tournaments
+    assert len(gol_server.requests) == 4
+    assert (tmp_path / "LCK 2025 Week 0_matches.csv").stat().st_mtime_ns == mtime
+    assert (
+        pd.read_csv(tmp_path / "manifest.csv")["sha256"].tolist()
+        == manifest["sha256"].tolist()
+    )
+
+
+def test_scrape_games(gol_server, tmp_path):
+    """
+    Follows every series of a matchlist to its game pages and stores the games in
+    Parquet.
+    """
+    manager = GolManager(
+        base_url=gol_server.url,
+        data_dir=tmp_path,
+        rate=50.0,
+        cache_dir=tmp_path / "cache",
+    )
+    scraper = GolGameScraper(manager)
+
+    saved = scraper.scrape_many(["LCK 2025 Week 0"])
+    games = pd.read_parquet(tmp_path / "games" / "LCK 2025 Week 0_games.parquet")
+    pd.testing.assert_frame_equal(games, saved["LCK 2025 Week 0"])
+
+    series_ids = range(60000, 60045)
+    expected_ids = sorted(g for s in series_ids for g in series_game_ids(s) or [s])
+    assert sorted(games["game_id"]) == expected_ids
+    assert games["series_id"].nunique() == 45
+    assert len(gol_server.requests) == 1 + 45 + len(expected_ids)
+
+    game = games.set_index("game_id").loc[600011]
+    assert (game["series_id"], game["game"], game["blue_team"], game["red_team"]) == (
+        60001,
+        2,
+        "Blue 600011",
+        "Red 600011",
+    )
+    assert (game["winner_side"], game["duration_s"]) == (
+        "red",
+        60 * (20 + 600011 % 15) + 600011 % 60,
+    )
+    first = games[games["series_id"] == 60000].iloc[0]
+    assert (first["teamA"], first["teamB"], first["date"]) == (
+        "Hanwha Life eSports",
+        "T1",
+        pd.Timestamp("2025-06-15"),
+    )
+
+    # Finished pages are served from the cache.
+    scraper.scrape_many(["LCK 2025 Week 0"], force=True)
+    assert len(gol_server.requests) == 1 + 45 + len(expected_ids)
+
+
+def test_plan_rechecks_recently_finished_tournaments(tmp_path):
+    """
+    Tournaments that look finished during a split break are scraped again after
+    FINISHED_RECHECK_DAYS days; only final ones are skipped for good.
+    """
+    today, now = date.today(), datetime.now(timezone.utc)
+    entries = {
+        "Paused, checked": (today - timedelta(days=20), now - timedelta(days=2)),
+        "Paused, stale": (today - timedelta(days=20), now - timedelta(days=15)),
+        "Final": (today - timedelta(days=200), now - timedelta(days=150)),
+    }
+    planner = ScrapePlanner(data_dir=tmp_path)
+    for name, (last_match, scraped_at) in entries.items():
+        planner.manifest[name] = {
+            "tournament": name,
+            "scraped_at": scraped_at.isoformat(timespec="seconds"),
+            "rows": 1,
+            "sha256": "",
+            "last_match": last_match.isoformat(),
+            "finished": True,
+        }
+        planner.csv_path(name).write_text("date\n", encoding="utf-8")
+    planner.save_manifest()
+
+    planner = ScrapePlanner(data_dir=tmp_path)
+    assert planner.plan(list(entries)) == ["Paused, stale"]
+    assert planner.settled("Final") and not planner.settled("Paused, stale")
+
+
+def test_write_keeps_unchanged_seeded_csv(tmp_path):
+    """
+    A CSV seeded from the committed (CRLF) files is not rewritten when a scrape
+    returns the same matches.
+    """
+    name = "CBLOL Split 1 2023"
+    source = SCRAPER_DIR / "data" / f"{name}_matches.csv"
+    data = source.read_bytes()
+    assert b"\r\n" in data
+    (tmp_path / source.name).write_bytes(data)
+    scraped_list = tmp_path / "scraped_tournaments.txt"
+    scraped_list.write_text(f"{name}\n", encoding="utf-8")
+
+    planner = ScrapePlanner(data_dir=tmp_path, scraped_list=scraped_list)
+    matches = pd.read_csv(source, dtype=str, keep_default_na=False).to_dict("records")
+
+    assert not planner.write(name, matches)
+    assert (tmp_path / source.name).read_bytes() == data
+
+
+def test_summary_pages_expire_until_the_tournament_is_final(
+    gol_server, tmp_path, monkeypatch
+):
+    """
+    Series summary pages of a finished but not yet final tournament keep expiring,
+    so added games are picked up; they are only frozen once it is final.
+    """
+    import planner
+
+    summary = f"{gol_server.url}/game/stats/60001/page-summary/"
+    for final_after_days, frozen in [(100000, False), (1, True)]:
+        monkeypatch.setattr(planner, "FINAL_AFTER_DAYS", final_after_days)
+        cache_dir = tmp_path / f"cache_{final_after_days}"
+        manager = GolManager(
+            base_url=gol_server.url, data_dir=tmp_path, rate=50.0, cache_dir=cache_dir
+        )
+        GolGameScraper(manager).scrape_many(["LCK 2025 Week 0"], force=True)
+        assert (manager.fetcher.cache._read_meta(summary)["ttl"] is None) == frozen
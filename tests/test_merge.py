@@ -0,0 +1,88 @@
+from pathlib import Path
+
+import pandas as pd
+
+from src.data.clean import LoLDataCleaner
+from src.data.merge import LoLDataMerger
+from src.data.merge_new_data import LoLNewDataMerger
+from src.data.team_stats import TeamStatsStore
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data" / "cleaned"
+
+
+def _inputs(n=300):
+    teams = pd.read_csv(DATA_DIR / "teams.csv", parse_dates=["date"])
+    matches = pd.read_csv(DATA_DIR / "matches.csv", parse_dates=["date"]).sample(
+        n, random_state=0
+    )
+    unknown = pd.DataFrame(
+        {
+            "teamA": ["Nobody"],
+            "teamB": ["T1"],
+            "date": [pd.Timestamp("2025-06-01")],
+            "league": ["LCK"],
+            "teamA_win": [1],
+        }
+    )
+    return teams, pd.concat([matches, unknown], ignore_index=True)
+
+
+def _merge_rows(matches, teams, numeric_cols, info_cols):
+    """
+    Reference merge looking up both teams of every match one row at a time.
+    """
+    store = TeamStatsStore(teams, numeric_cols)
+    merged_rows = []
+    for _, row in matches.iterrows():
+        statsA = store.get_stats(row["teamA"], row["league"], row["date"])
+        statsB = store.get_stats(row["teamB"], row["league"], row["date"])
+        if statsA.empty or statsB.empty:
+            continue
+
+        combined_data = pd.concat([statsA.add_suffix("_A"), statsB.add_suffix("_B")])
+        for col in info_cols:
+            combined_data[col] = row[col]
+        merged_rows.append(combined_data)
+
+    return pd.DataFrame(merged_rows).reset_index(drop=True)
+
+
+def test_batch_merge_equals_row_by_row_merge():
+    """
+    The as-of batch merges produce the rows of a row-by-row merge, in the same order.
+    """
+    teams, matches = _inputs()
+
+    merger = LoLDataMerger()
+    batch = merger.merge_teams_and_matches(matches, teams)
+    rows = _merge_rows(
+        matches,
+        teams,
+        merger.numeric_cols,
+        ["teamA", "teamB", "date", "league", "teamA_win"],
+    )
+    assert len(batch) < len(matches)
+    pd.testing.assert_frame_equal(rows[batch.columns], batch, check_dtype=False)
+
+    new_merger = LoLNewDataMerger()
+    fixtures = matches.drop(columns=["teamA_win"])
+    batch = new_merger.merge_new_teams_and_matches(fixtures, teams)
+    rows = _merge_rows(
+        fixtures, teams, new_merger.numeric_cols, ["teamA", "teamB", "date", "league"]
+    )
+    pd.testing.assert_frame_equal(rows[batch.columns], batch, check_dtype=False)
+
+
+def test_merge_on_blended_stats_equals_merge_on_raw_stats():
+    """
+    Merging against the precomputed blended table gives the same rows as blending
+    at lookup time.
+    """
+    teams, matches = _inputs()
+    blended = LoLDataCleaner().blend_teams(teams)
+    assert (blended["GP"] <= 5).any()
+
+    merger = LoLDataMerger()
+    expected = merger.merge_teams_and_matches(matches, teams)
+    actual = merger.merge_teams_and_matches(matches, blended)
+    pd.testing.assert_frame_equal(actual[expected.columns], expected)
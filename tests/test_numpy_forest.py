@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+
+from src.models.numpy_forest import NumpyForest
+
+
+def test_numpy_forest_matches_sklearn_probabilities(tmp_path):
+    """
+    Checks that the exported, memory-mapped forest reproduces the probabilities
+    of the scikit-learn forest exactly, including rows with missing values.
+    """
+    rng = np.random.default_rng(0)
+    columns = [f"f{i}" for i in range(12)]
+    X = pd.DataFrame(rng.normal(size=(600, 12)), columns=columns)
+    y = (
+        X["f0"] + 0.5 * X["f1"] * X["f2"] + rng.normal(scale=0.5, size=600) > 0
+    ).astype(int)
+
+    model = RandomForestClassifier(
+        n_estimators=40, max_depth=8, min_samples_split=6, random_state=42
+    )
+    model.fit(X, y, sample_weight=rng.uniform(size=600))
+
+    NumpyForest.from_sklearn(model).save(tmp_path / "forest")
+    forest = NumpyForest.load(tmp_path / "forest")
+
+    X_test = pd.DataFrame(rng.normal(size=(300, 12)), columns=columns)
+    X_test.iloc[::7, 3] = np.nan
+
+    assert list(forest.feature_names_in_) == columns
+    np.testing.assert_array_equal(
+        forest.predict_proba(X_test), model.predict_proba(X_test)
+    )
+    np.testing.assert_array_equal(forest.predict(X_test), model.predict(X_test))
@@ -0,0 +1,93 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from src.data.oracleselixir import OraclesElixirCache
+
+TEXT_COLS = ["gameid", "league", "teamname"]
+NUMERIC_COLS = ["participantid", "result", "gspd"]
+
+
+def _write_dump(source_dir, seed=0, n=300):
+    """
+    Writes a small yearly dump with mixed-case leagues, missing values and an
+    extra column that the cache does not keep.
+    """
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            "gameid": [f"G{i // 12}" for i in range(n)],
+            "league": rng.choice(["LCK", "LEC", "lec", "LPL"], n),
+            "teamname": rng.choice(["T1", "Fnatic", "JD Gaming", None], n),
+            "date": pd.Timestamp("2025-01-01")
+            + pd.to_timedelta(rng.integers(0, 10**6, n), unit="min"),
+            "participantid": rng.integers(1, 13, n),
+            "result": rng.integers(0, 2, n),
+            "gspd": np.where(rng.random(n) < 0.2, np.nan, rng.normal(size=n)),
+            "champion": rng.choice(["Ahri", "Azir"], n),
+        }
+    )
+    path = source_dir / "2025_LoL_esports_match_data_from_OraclesElixir.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+def _read_csv(path):
+    """
+    Reads the dump the way the cleaner did before the cache existed.
+    """
+    df = pd.read_csv(path, usecols=TEXT_COLS + ["date"] + NUMERIC_COLS)
+    df["date"] = pd.to_datetime(df["date"])
+    return df
+
+
+def test_parquet_cache_matches_csv_and_tracks_the_source(tmp_path):
+    """
+    The cached dump holds the same values as the CSV, is reused while the source
+    is unchanged (even if only touched) and rebuilt once it changes.
+    """
+    path = _write_dump(tmp_path)
+    cache = OraclesElixirCache(tmp_path, TEXT_COLS, NUMERIC_COLS)
+    columns = TEXT_COLS + ["date"] + NUMERIC_COLS
+
+    cached = cache.load("2025", columns=columns)
+    expected = _read_csv(path)
+    key = expected["league"].str.upper()
+    expected = expected.iloc[np.argsort(key.to_numpy(), kind="stable")].reset_index(
+        drop=True
+    )
+    pd.testing.assert_frame_equal(cached, expected, check_dtype=False)
+
+    parquet = cache.cache_path("2025")
+    built = parquet.stat().st_mtime_ns
+    os.utime(path, ns=(built + 10**9, built + 10**9))
+    cache.load("2025")
+    assert parquet.stat().st_mtime_ns == built
+
+    path = _write_dump(tmp_path, seed=1, n=200)
+    assert len(cache.load("2025")) == 200
+
+
+def test_league_filter_is_case_insensitive_and_ordered(tmp_path):
+    """
+    Filtered loads return the rows of the requested leagues whatever their case,
+    and iter_leagues yields them in the requested order.
+    """
+    path = _write_dump(tmp_path)
+    cache = OraclesElixirCache(tmp_path, TEXT_COLS, NUMERIC_COLS)
+    expected = _read_csv(path)
+    key = expected["league"].str.upper()
+
+    loaded = cache.load("2025", leagues=["lec", "LPL"])
+    assert sorted(loaded["gameid"]) == sorted(
+        expected.loc[key.isin(["LEC", "LPL"]), "gameid"]
+    )
+
+    yielded = list(cache.iter_leagues("2025", ["LPL", "LEC", "LTA N"]))
+    assert [l for l, _ in yielded] == ["LPL", "LEC"]
+    for league, df in yielded:
+        league_rows = expected[key == league].reset_index(drop=True)
+        pd.testing.assert_frame_equal(
+            df[league_rows.columns], league_rows, check_dtype=False
+        )
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+
+from src.data.feature_kernel import LoLFeatureKernel
+from src.models.numpy_forest import NumpyForest
+from src.models.predict import LoLPredictor
+from src.models.registry import ModelRegistry
+
+
+class CountingModel:
+    """
+    Wraps a fitted classifier and counts its predict_proba calls.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.classes_ = model.classes_
+        self.calls = 0
+
+    def predict(self, X):
+        return self.model.predict(X)
+
+    def predict_proba(self, X):
+        self.calls += 1
+        return self.model.predict_proba(X)
+
+
+def test_predict_with_probability_uses_one_model_pass():
+    """
+    Labels and probabilities come from a single predict_proba call and agree with
+    predict_winner, or with the threshold when one is set.
+    """
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(300, 4)), columns=list("abcd"))
+    y = (X["a"] + rng.normal(scale=0.5, size=300) > 0).astype(int)
+    model = CountingModel(
+        RandomForestClassifier(n_estimators=20, random_state=0).fit(X, y)
+    )
+
+    predictor = LoLPredictor(model=model)
+    labels, probability = predictor.predict_with_probability(X)
+    assert model.calls == 1
+    np.testing.assert_array_equal(labels, predictor.predict_winner(X))
+    np.testing.assert_array_equal(probability, predictor.predict_winner_probability(X))
+
+    labels, probability = LoLPredictor(
+        model=model, threshold=0.7
+    ).predict_with_probability(X)
+    np.testing.assert_array_equal(labels, (probability[:, 1] >= 0.7).astype(int))
+
+
+def test_models_of_another_feature_kernel_version_are_rejected(tmp_path):
+    """
+    The feature kernel version is stored with registered models and exported forests,
+    and a model trained on another version is rejected when it is loaded.
+    """
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(100, 4)), columns=list("abcd"))
+    y = (X["a"] > 0).astype(int)
+    model = RandomForestClassifier(n_estimators=5, random_state=0).fit(X, y)
+
+    registry = ModelRegistry(tmp_path / "registry")
+    registry.register(model, "rf")
+    assert registry.metadata("rf")["feature_kernel_version"] == LoLFeatureKernel.version
+    LoLPredictor.from_registry("rf", registry=registry)
+    with pytest.raises(ValueError, match="feature kernel version"):
+        LoLPredictor(model=model, metadata={"feature_kernel_version": -1})
+
+    forest = NumpyForest.from_sklearn(model)
+    forest.meta["feature_kernel_version"] = LoLFeatureKernel.version - 1
+    forest.save(tmp_path / "old_forest")
+    with pytest.raises(ValueError, match="feature kernel version"):
+        LoLPredictor(model_name=str(tmp_path / "old_forest.pkl"))
+
+
+def test_committed_forest_matches_the_feature_kernel():
+    """
+    The shipped forest records the current kernel version and its feature order.
+    """
+    predictor = LoLPredictor()
+    assert predictor.model.meta["feature_kernel_version"] == LoLFeatureKernel.version
+    assert list(predictor.model.feature_names_in_) == LoLFeatureKernel().feature_names
@@ -0,0 +1,159 @@
+import filecmp
+
+import numpy as np
+import pandas as pd
+
+from src.utils.process_data import LolDataProcessor
+
+TEAMS = {
+    "LCK": ["T1", "Gen.G", "Hanwha Life Esports", "KT Rolster"],
+    "LEC": ["Fnatic", "G2 Esports", "Team Vitality", "Karmine Corp"],
+}
+COUNT_COLS = [
+    "goldat15",
+    "opp_goldat15",
+    "controlwardsbought",
+    "wardskilled",
+    "teamkills",
+    "teamdeaths",
+    "turretplates",
+    "heralds",
+    "opp_heralds",
+    "void_grubs",
+    "opp_void_grubs",
+    "barons",
+    "opp_barons",
+    "elders",
+    "opp_elders",
+    "dragons",
+    "opp_dragons",
+    "firstblood",
+    "firsttower",
+    "firsttothreetowers",
+    "firstdragon",
+    "firstbaron",
+]
+OUTPUTS = [
+    "cleaned/teams.csv",
+    "cleaned/teams_blended.csv",
+    "cleaned/matches.csv",
+    "cleaned/team_totals.csv",
+    "cleaned/pipeline_state.json",
+    "merged/data.csv",
+    "featured/train.csv",
+    "featured/val.csv",
+]
+
+
+def _oracleselixir(seed=0, days=150):
+    """
+    Builds raw Oracle's Elixir rows (ten player rows and two team rows per game)
+    and the matching gol.gg matches, two games a day in every league.
+    """
+    rng = np.random.default_rng(seed)
+    rows, matches = [], []
+    for day in pd.date_range("2025-01-01", periods=days):
+        for league, teams in TEAMS.items():
+            for game in range(2):
+                date = day + pd.Timedelta(minutes=int(rng.integers(8 * 60, 22 * 60)))
+                sides = rng.choice(teams, 2, replace=False)
+                win = int(rng.integers(0, 2))
+                gameid = f"{league}_{day:%Y%m%d}_{game}"
+                for side, team in enumerate(sides):
+                    base = {
+                        "gameid": gameid,
+                        "league": league,
+                        "split": "Spring" if day.month < 4 else "Summer",
+                        "teamname": team,
+                        "playoffs": int(day.day > 25),
+                        "date": date,
+                        "gamelength": float(rng.integers(1500, 2400)),
+                        "result": float(win if side == 0 else 1 - win),
+                    }
+                    for p in range(1, 6):
+                        rows.append(
+                            dict(
+                                base,
+                                participantid=p + 5 * side,
+                                minionkills=float(rng.integers(0, 300)),
+                                monsterkills=float(rng.integers(0, 100)),
+                            )
+                        )
+                    team_row = dict(
+                        base,
+                        participantid=100 * (side + 1),
+                        minionkills=float(rng.integers(500, 1000)),
+                        monsterkills=float(rng.integers(100, 300)),
+                    )
+                    for col in COUNT_COLS:
+                        team_row[col] = float(rng.integers(0, 5))
+                    team_row["gspd"] = rng.normal()
+                    team_row["wpm"] = rng.normal(3, 1)
+                    rows.append(team_row)
+                matches.append(
+                    {
+                        "teamA": sides[0],
+                        "teamB": sides[1],
+                        "date": day,
+                        "league": league,
+                        "teamA_win": win,
+                    }
+                )
+    return pd.DataFrame(rows), pd.DataFrame(matches)
+
+
+def _processor(root, games, matches):
+    """
+    A processor writing under root that reads the given games and matches instead of
+    the dumps.
+    """
+    processor = LolDataProcessor()
+    for name in ["cleaned", "merged", "featured"]:
+        (root / name).mkdir(parents=True, exist_ok=True)
+    processor.clean_dir = root / "cleaned"
+    processor.merge_dir = root / "merged"
+    processor.feature_dir = root / "featured"
+    processor.state_path = processor.clean_dir / "pipeline_state.json"
+    processor.totals_path = processor.clean_dir / "team_totals.csv"
+
+    cleaner = processor.cleaner
+    cleaner.league_keywords = {"2025": list(TEAMS)}
+    cleaner.oracleselixir.iter_leagues = lambda year, leagues, columns=None: (
+        (l, games[games["league"] == l].reset_index(drop=True)) for l in leagues
+    )
+    cleaner.clean_matches = lambda year: matches.copy()
+    return processor
+
+
+def test_incremental_run_equals_full_run(tmp_path):
+    """
+    Continuing from an earlier run, with new days, a late game on the last processed
+    day and matches whose stats arrived late, writes exactly what a full run writes.
+    """
+    games, matches = _oracleselixir()
+    last_day = pd.Timestamp("2025-05-20")
+    # The earlier run saw the LCK up to the morning of its last day and the LEC up
+    # to the day before, and the matches of that day without their stats.
+    seen = (games["date"] < last_day + pd.Timedelta(hours=10)) & (
+        (games["league"] == "LCK") | (games["date"] < last_day)
+    )
+    late = (
+        ~seen & (games["league"] == "LCK") & (games["date"].dt.normalize() == last_day)
+    )
+    assert late.any()
+
+    incremental = tmp_path / "incremental"
+    full = tmp_path / "full"
+    earlier = _processor(incremental, games[seen], matches[matches["date"] <= last_day])
+    earlier.run_pipeline(years=["2025"])
+    _processor(incremental, games, matches).run_incremental(years=["2025"])
+    _processor(full, games, matches).run_pipeline(years=["2025"])
+
+    for rel in OUTPUTS:
+        assert filecmp.cmp(incremental / rel, full / rel, shallow=False), rel
+
+    # Rows keep the order of the original per-group loop (league, team, split,
+    # playoffs, then date), so a team's playoff days follow its regular days.
+    teams = pd.read_csv(full / "cleaned" / "teams.csv")
+    keys = ["league", "Team", "date"]
+    assert not teams[keys].equals(teams[keys].sort_values(keys).reset_index(drop=True))
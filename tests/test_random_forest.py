@@ -0,0 +1,123 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+
+from src.models.numpy_forest import NumpyForest
+from src.models.predict import LoLPredictor
+from src.models.random_forest import RF
+from src.models.registry import ModelRegistry
+
+
+def _matches(rng, dates):
+    """
+    Builds random featured matches, a few per day, shaped like train.csv.
+    """
+    n = len(dates)
+    df = pd.DataFrame(rng.normal(size=(n, 5)), columns=[f"f{i}" for i in range(5)])
+    df["date"] = dates
+    df["teamA_win"] = (df["f0"] + rng.normal(scale=0.5, size=n) > 0).astype(int)
+    return df
+
+
+def _rf(tmp_path):
+    rf = RF()
+    rf.data_path = tmp_path
+    rf.model_path = tmp_path / "random_forest.pkl"
+    rf.arrays_path = tmp_path / "random_forest"
+    rf.registry = ModelRegistry(tmp_path / "registry")
+    return rf
+
+
+def test_refresh_on_one_class_batch_refits(tmp_path):
+    """
+    A refresh whose new matches hold a single class refits the whole forest
+    instead of adding trees that would not know both classes.
+    """
+    rng = np.random.default_rng(0)
+    days = pd.date_range("2025-01-01", periods=60).strftime("%Y-%m-%d")
+    _matches(rng, np.repeat(days[:45], 6)).to_csv(tmp_path / "train.csv", index=False)
+    val = _matches(rng, np.repeat(days[45:], 6))
+    val.to_csv(tmp_path / "val.csv", index=False)
+
+    _rf(tmp_path).train_and_save()
+
+    new = _matches(rng, ["2025-03-15"])
+    new["teamA_win"] = 1
+    pd.concat([val, new], ignore_index=True).to_csv(tmp_path / "val.csv", index=False)
+
+    rf = _rf(tmp_path)
+    assert rf.refresh(min_new_rows=1) == "full"
+
+    with open(rf.model_path, "rb") as f:
+        model = pickle.load(f)
+    X = new.drop(columns=["date", "teamA_win"])
+    assert list(model.classes_) == [0, 1]
+    np.testing.assert_array_equal(
+        NumpyForest.load(rf.arrays_path).predict_proba(X), model.predict_proba(X)
+    )
+    assert rf.registry.metadata("random_forest")["refresh"]["mode"] == "full"
+    assert not any(p.name.startswith(".") for p in tmp_path.iterdir())
+
+
+def test_refresh_waits_for_enough_rows_and_keeps_date_weights(tmp_path, monkeypatch):
+    """
+    A refresh with fewer than min_new_rows new rows does nothing and leaves them
+    unseen; a later, larger one adds trees fitted on all of them with the same date
+    weights as a full fit.
+    """
+    rng = np.random.default_rng(2)
+    days = pd.date_range("2025-01-01", periods=60).strftime("%Y-%m-%d")
+    _matches(rng, np.repeat(days[:40], 6)).to_csv(tmp_path / "train.csv", index=False)
+    val = _matches(rng, np.repeat(days[40:50], 6))
+    val.to_csv(tmp_path / "val.csv", index=False)
+    _rf(tmp_path).train_and_save()
+
+    val = pd.concat([val, _matches(rng, np.repeat(days[50:52], 6))], ignore_index=True)
+    val.to_csv(tmp_path / "val.csv", index=False)
+    rf = _rf(tmp_path)
+    assert rf.refresh(min_new_rows=20) == "none"
+    assert rf.registry.versions("random_forest") == ["v1"]
+
+    weights = []
+    fit = RandomForestClassifier.fit
+
+    def recording_fit(model, X, y, sample_weight=None):
+        weights.append(sample_weight)
+        return fit(model, X, y, sample_weight=sample_weight)
+
+    monkeypatch.setattr(RandomForestClassifier, "fit", recording_fit)
+    val = pd.concat([val, _matches(rng, np.repeat(days[52:], 6))], ignore_index=True)
+    val.to_csv(tmp_path / "val.csv", index=False)
+    rf = _rf(tmp_path)
+    assert rf.refresh(min_new_rows=20, psi_threshold=np.inf) == "warm_start"
+
+    _, _, sample_weight = rf.load_and_prepare_data()
+    np.testing.assert_array_equal(weights[0], sample_weight.iloc[-60:])
+    assert rf.registry.metadata("random_forest")["refresh"]["new_rows"] == 60
+
+
+def test_train_and_save_registers_validation_metrics(tmp_path):
+    """
+    The registered version records the validation metrics and the Youden threshold.
+    """
+    rng = np.random.default_rng(1)
+    days = pd.date_range("2025-01-01", periods=40).strftime("%Y-%m-%d")
+    _matches(rng, np.repeat(days[:30], 6)).to_csv(tmp_path / "train.csv", index=False)
+    _matches(rng, np.repeat(days[30:], 6)).to_csv(tmp_path / "val.csv", index=False)
+
+    rf = _rf(tmp_path)
+    rf.train_and_save()
+
+    metadata = rf.registry.metadata("random_forest")
+    assert metadata["metrics"]["n"] == 60
+    assert set(metadata["metrics"]) == {"n", "accuracy", "log_loss", "auc"}
+    assert 0 < metadata["threshold"] < 1
+
+    # The default predictor of the exported model applies the registered threshold.
+    predictor = LoLPredictor(model_name=str(rf.model_path))
+    assert predictor.threshold == metadata["threshold"]
+    assert LoLPredictor.from_registry(
+        "random_forest", registry=rf.registry
+    ).threshold == (metadata["threshold"])
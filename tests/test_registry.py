@@ -0,0 +1,48 @@
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+
+from src.models.registry import ModelRegistry
+
+
+def test_load_evicts_least_recently_used_model(tmp_path):
+    """
+    Loaded models are cached up to cache_size; the least recently used one is evicted.
+    """
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(40, 3))
+    y = (X[:, 0] > 0).astype(int)
+
+    registry = ModelRegistry(tmp_path, cache_size=2)
+    for name in ["a", "b", "c"]:
+        registry.register(LogisticRegression().fit(X, y), name)
+
+    a = registry.load("a")
+    registry.load("b")
+    assert registry.load("a") is a
+    registry.load("c")
+
+    assert list(registry._models) == [("a", "v1"), ("c", "v1")]
+    assert registry.load("a") is a
+    assert registry.load("b") is not None
+    assert ("c", "v1") not in registry._models
+
+
+def test_register_skips_half_written_version(tmp_path):
+    """
+    A version directory left without metadata by a crash keeps its number and is
+    never listed; the next registration takes the following number.
+    """
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(40, 3))
+    y = (X[:, 0] > 0).astype(int)
+
+    registry = ModelRegistry(tmp_path)
+    registry.register(LogisticRegression().fit(X, y), "a")
+    (tmp_path / "a" / "v2").mkdir()
+    (tmp_path / "a" / "v2" / "model.pkl").write_bytes(b"partial")
+
+    assert registry.register(LogisticRegression().fit(X, y), "a") == "v3"
+    assert registry.register(LogisticRegression().fit(X, y), "a") == "v4"
+    assert registry.versions("a") == ["v1", "v3", "v4"]
+    assert registry.metadata("a")["version"] == "v4"
+    assert not [p for p in (tmp_path / "a").iterdir() if p.name.startswith(".tmp-")]
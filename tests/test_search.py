@@ -0,0 +1,60 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from src.models.registry import ModelRegistry
+from src.models.search import HyperparameterSearch
+
+
+def _write_features(data_dir, rng, days=60, per_day=5):
+    dates = np.repeat(
+        pd.date_range("2025-01-01", periods=days).strftime("%Y-%m-%d"), per_day
+    )
+    df = pd.DataFrame(
+        rng.normal(size=(len(dates), 4)), columns=[f"f{i}" for i in range(4)]
+    )
+    df["date"] = dates
+    df["teamA_win"] = (df["f0"] + rng.normal(scale=0.5, size=len(df)) > 0).astype(int)
+    cut = len(df) * 3 // 4
+    df.iloc[:cut].to_csv(data_dir / "train.csv", index=False)
+    df.iloc[cut:].to_csv(data_dir / "val.csv", index=False)
+
+
+def test_folds_expand_in_time_and_never_split_a_day():
+    search = HyperparameterSearch("decision_tree", n_folds=4)
+    days = pd.date_range("2025-01-01", periods=30).to_numpy()
+    dates = np.sort(np.random.default_rng(0).choice(days, 200))
+
+    folds = search.make_folds(dates)
+
+    assert len(folds) == 4
+    assert folds[-1][1] == len(dates)
+    for (train_stop, val_stop), following in zip(
+        folds, folds[1:] + [(len(dates), None)]
+    ):
+        assert 0 < train_stop < val_stop == following[0]
+        assert dates[train_stop - 1] < dates[train_stop]
+
+
+def test_search_registers_the_best_configuration(tmp_path):
+    """
+    A small search evaluates the sampled configurations and registers the refitted
+    winner with its cross-validated metrics, threshold and leaderboard.
+    """
+    _write_features(tmp_path, np.random.default_rng(0))
+    registry = ModelRegistry(tmp_path / "registry")
+    search = HyperparameterSearch(
+        "decision_tree", n_folds=3, n_iter=4, n_workers=1, registry=registry
+    )
+    search.data_path = tmp_path
+
+    version, leaderboard = search.run()
+
+    assert len(leaderboard) == 4
+    assert leaderboard["rank"].tolist() == [1, 2, 3, 4]
+    metadata = registry.metadata("decision_tree", version)
+    assert metadata["params"] == json.loads(leaderboard.loc[0, "params"])
+    assert metadata["metrics"]["accuracy"] == leaderboard.loc[0, "accuracy"]
+    assert metadata["threshold"] is not None
+    assert (registry.root / "decision_tree" / version / "leaderboard.csv").exists()
@@ -0,0 +1,124 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pandas as pd
+
+from src.utils.serve import LoLPredictionServer
+
+
+class FakeBatchPredictor:
+    """
+    Stands in for LoLBatchPredictor: scores every fixture with a fixed probability
+    and fails the whole call if any fixture is in the "Broken" league.
+    """
+
+    def __init__(self):
+        self.calls = []
+        self.processor = SimpleNamespace(
+            teams_cache=SimpleNamespace(get_store=lambda: None)
+        )
+        self.predictor = SimpleNamespace(metadata={"name": "fake"}, model_path=None)
+        self.resolver = SimpleNamespace(names=[])
+
+    def predict(self, fixtures: pd.DataFrame) -> pd.DataFrame:
+        self.calls.append(len(fixtures))
+        if (fixtures["league"] == "Broken").any():
+            raise ValueError("incompatible merge keys")
+        out = fixtures.copy()
+        out["teamA_win_probability"] = 0.6
+        return out
+
+
+async def _post(port, payload):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode("utf-8")
+    head = (
+        "POST /predict HTTP/1.1\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n"
+    )
+    writer.write(head.encode("latin-1") + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body)
+
+
+def test_bad_requests_do_not_fail_their_batch():
+    """
+    Concurrent requests share a batch; invalid fixtures get a 400 and a fixture
+    that breaks the model call only fails its own request.
+    """
+    fixture = {"teamA": "T1", "teamB": "Gen.G", "league": "LCK", "date": "2025-06-15"}
+    payloads = [
+        fixture,
+        {**fixture, "teamA": ["T1"]},
+        [fixture, {**fixture, "teamB": "KT Rolster"}],
+        {**fixture, "date": "not a date"},
+        {**fixture, "league": "Broken"},
+        {"fixtures": [fixture]},
+    ]
+    predictor = FakeBatchPredictor()
+
+    async def run():
+        server = LoLPredictionServer(port=0, window_ms=200, batch_predictor=predictor)
+        await server.start()
+        try:
+            return await asyncio.gather(*(_post(server.port, p) for p in payloads))
+        finally:
+            await server.stop()
+
+    responses = asyncio.run(run())
+
+    assert [status for status, _ in responses] == [200, 400, 200, 400, 500, 200]
+    assert "teamA" in responses[1][1]["error"]
+    assert "date" in responses[3][1]["error"]
+    assert "incompatible merge keys" in responses[4][1]["error"]
+    assert [
+        len(body["predictions"]) for status, body in responses if status == 200
+    ] == [1, 2, 1]
+    assert all(
+        p["teamA_win_probability"] == 0.6
+        for _, body in responses[:1]
+        for p in body["predictions"]
+    )
+    # One shared call for the batch, then one call per request after it failed.
+    assert predictor.calls == [5, 1, 2, 1, 1]
+
+
+def test_invalid_content_length_gets_400():
+    """
+    A non-numeric or negative Content-Length is answered with 400 Bad Request
+    instead of killing the connection handler, which keeps serving afterwards.
+    """
+
+    async def raw_request(port, length):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(
+            f"POST /predict HTTP/1.1\r\nContent-Length: {length}\r\n\r\n".encode(
+                "latin-1"
+            )
+        )
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        head, _, body = response.partition(b"\r\n\r\n")
+        return int(head.split()[1]), json.loads(body)
+
+    fixture = {"teamA": "T1", "teamB": "Gen.G", "league": "LCK", "date": "2025-06-15"}
+
+    async def run():
+        server = LoLPredictionServer(port=0, batch_predictor=FakeBatchPredictor())
+        await server.start()
+        try:
+            bad = [await raw_request(server.port, length) for length in ["abc", "-5"]]
+            return bad, await _post(server.port, fixture)
+        finally:
+            await server.stop()
+
+    bad, good = asyncio.run(run())
+    assert [status for status, _ in bad] == [400, 400]
+    assert all("Content-Length" in body["error"] for _, body in bad)
+    assert good[0] == 200
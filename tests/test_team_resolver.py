@@ -0,0 +1,74 @@
+from pathlib import Path
+
+import pandas as pd
+from thefuzz import fuzz, process
+
+from src.utils.team_resolver import TeamNameResolver, build_team_league_map
+
+DATA_PATH = Path(__file__).resolve().parents[1] / "data" / "merged" / "data.csv"
+
+
+def test_build_team_league_map_keeps_first_order_and_last_league():
+    matches = pd.DataFrame(
+        {
+            "teamA": ["T1", "Fnatic", "T1"],
+            "teamB": ["Gen.G", "T1", "G2 Esports"],
+            "league": ["LCK", "MSI", "Worlds"],
+        }
+    )
+    assert build_team_league_map(matches) == {
+        "T1": "Worlds",
+        "Gen.G": "LCK",
+        "Fnatic": "MSI",
+        "G2 Esports": "Worlds",
+    }
+
+
+def test_best_match_agrees_with_extract_one():
+    """
+    Outside of exact and alias hits, the indexed lookup returns the same team and
+    score as scoring every team with process.extractOne.
+    """
+    teams = {
+        "T1": "LCK",
+        "Gen.G": "LCK",
+        "Hanwha Life Esports": "LCK",
+        "KT Rolster": "LCK",
+        "Fnatic": "LEC",
+        "G2 Esports": "LEC",
+        "Team Vitality": "LEC",
+        "Karmine Corp": "LEC",
+        "Bilibili Gaming": "LPL",
+        "Top Esports": "LPL",
+    }
+    resolver = TeamNameResolver(teams, aliases={})
+    for query in [
+        "fnatik",
+        "g2",
+        "hanwha",
+        "KT",
+        "team vitaliti",
+        "bilibili",
+        "top esport",
+        "karmin",
+    ]:
+        expected = process.extractOne(query, list(teams), scorer=fuzz.ratio)
+        assert resolver.best_match(query) == expected[:2], query
+
+    assert resolver.best_match("T1") == ("T1", 100)
+    assert resolver.best_match("", league="LEC") == (None, 0)
+
+
+def test_ties_on_the_rounded_score_follow_extract_one():
+    """
+    Names with the same rounded score are ranked on the unrounded ratio, as
+    process.extractOne does, e.g. "CTBC Gaming" scores 70 against both "JD Gaming"
+    and "Weibo Gaming" but is closer to the first.
+    """
+    matches = pd.read_csv(DATA_PATH, usecols=["teamA", "teamB", "league"])
+    teams = build_team_league_map(matches)
+    resolver = TeamNameResolver(teams, aliases={})
+    for query in ["CTBC Gaming", "kd lal b", "Ultra Rebellion"]:
+        expected = process.extractOne(query, list(teams), scorer=fuzz.ratio)
+        assert resolver.best_match(query) == expected[:2], query
+    assert resolver.best_match("CTBC Gaming") == ("JD Gaming", 70)
@@ -0,0 +1,104 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.data.merge import LoLDataMerger
+from src.data.team_stats import TeamStatsCache, TeamStatsStore
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data" / "cleaned"
+
+
+def _scan_stats(team, league, date, teams, numeric_cols):
+    """
+    Reference lookup scanning the whole team table, as the mergers used to do.
+    """
+    team_data_past = teams[
+        (teams["Team"] == team) & (teams["league"] == league) & (teams["date"] < date)
+    ].sort_values("date", ascending=False)
+
+    if team_data_past.empty:
+        return pd.Series(dtype=float)
+
+    team_last_data = team_data_past.iloc[0]
+
+    if team_last_data.GP > 5:
+        return team_last_data.drop(labels=["date", "Team", "league"], errors="ignore")
+
+    stable_past_data = team_data_past[team_data_past["GP"] > 5]
+
+    if stable_past_data.empty:
+        return pd.Series(dtype=float)
+
+    team_last_stable = stable_past_data.iloc[0]
+
+    gp_stable = min(team_last_stable.GP, 5)
+    gp_curr = team_last_data.GP
+    gp_total = gp_stable + gp_curr
+
+    combined_data = pd.Series(dtype=float)
+    combined_data["GP"] = gp_total
+
+    for col in numeric_cols:
+        if col in team_last_data and col in team_last_stable:
+            combined_data[col] = (
+                (team_last_data[col] * gp_curr) + (team_last_stable[col] * gp_stable)
+            ) / gp_total
+
+    return combined_data
+
+
+def test_store_lookups_match_the_dataframe_scan():
+    """
+    The indexed as-of lookup returns the same statistics as scanning the whole
+    team table, including blended snapshots and teams without history.
+    """
+    teams = pd.read_csv(DATA_DIR / "teams.csv", parse_dates=["date"])
+    merger = LoLDataMerger()
+    store = TeamStatsStore(teams, merger.numeric_cols)
+
+    rng = np.random.default_rng(0)
+    rows = teams.sample(200, random_state=0)
+    offsets = pd.to_timedelta(rng.integers(-3, 4, len(rows)), unit="D")
+    lookups = list(zip(rows["Team"], rows["league"], rows["date"] + offsets))
+    lookups += [
+        ("T1", "LEC", pd.Timestamp("2025-06-01")),
+        ("Nobody", "LCK", pd.Timestamp("2025-06-01")),
+    ]
+
+    for team, league, date in lookups:
+        expected = _scan_stats(team, league, date, teams, merger.numeric_cols)
+        actual = store.get_stats(team, league, date)
+        pd.testing.assert_series_equal(
+            actual.astype(float), expected.astype(float), check_names=False, rtol=1e-12
+        )
+
+
+def _write_teams(path, wins):
+    pd.DataFrame(
+        {
+            "league": ["LCK", "LCK"],
+            "Team": ["T1", "T1"],
+            "date": ["2025-06-01", "2025-06-08"],
+            "GP": [6.0, 7.0],
+            "W": [4.0, wins],
+        }
+    ).to_csv(path, index=False)
+
+
+def test_cache_shares_stores_and_reloads_changed_files(tmp_path):
+    """
+    Caches of one file and one set of metrics share their store, which is rebuilt
+    once the file changes; a different set of metrics gets its own store.
+    """
+    path = tmp_path / "teams_blended.csv"
+    _write_teams(path, 5.0)
+
+    store = TeamStatsCache(path, ["W"]).get_store()
+    assert TeamStatsCache(path, ["W"]).get_store() is store
+    assert TeamStatsCache(path, ["GP", "W"]).get_store() is not store
+
+    _write_teams(path, 10.0)
+    reloaded = TeamStatsCache(path, ["W"]).get_store()
+    assert reloaded is not store
+    assert reloaded.get_stats("T1", "LCK", pd.Timestamp("2025-06-10"))["W"] == 10.0